@@ -0,0 +1,63 @@
+import argparse
+import random
+import time
+
+import numpy as np  # requires "numpy" package
+
+from cohort import Cohort, role_code
+from office_rpg.entities import Intern, Developer, Manager, HR
+from office_rpg.system import Console
+from office_rpg.tasks import TASK_TYPES
+
+# Same workload both ways: every employee does one task per step, the task
+# type and diff cycle through all six types so every branch gets hit.
+ROLE_LIST = [Intern, Developer, Manager, HR]
+
+
+def schedule(steps):
+    return [(TASK_TYPES[i % len(TASK_TYPES)], i % 8 + 1) for i in range(steps)]
+
+
+def bench_objects(n, steps):
+    employees = [ROLE_LIST[i % len(ROLE_LIST)](f"E{i}") for i in range(n)]
+    was_quiet = Console.quiet
+    Console.quiet = True
+    start = time.perf_counter()
+    try:
+        for task_cls, diff in schedule(steps):
+            for emp in employees:
+                task_cls("bench", diff).do_task(emp)
+    finally:
+        Console.quiet = was_quiet
+    return time.perf_counter() - start
+
+
+def bench_cohort(n, steps):
+    roles = [role_code(cls("x")) for cls in ROLE_LIST]
+    cohort = Cohort(np.resize(roles, n), seed=0)
+    start = time.perf_counter()
+    for task_cls, diff in schedule(steps):
+        cohort.apply_task(task_cls, diff)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Object model vs vectorized cohort")
+    parser.add_argument("--objects", type=int, default=100_000, help="employees for the object loop")
+    parser.add_argument("--cohort", type=int, default=1_000_000, help="employees for the cohort")
+    parser.add_argument("--steps", type=int, default=12)
+    args = parser.parse_args()
+
+    random.seed(0)
+    t_obj = bench_objects(args.objects, args.steps)
+    t_vec = bench_cohort(args.cohort, args.steps)
+    obj_rate = args.objects * args.steps / t_obj
+    vec_rate = args.cohort * args.steps / t_vec
+
+    print(f"object model: {args.objects:>9} employees x {args.steps} steps in {t_obj:.2f}s -> {obj_rate:,.0f} task/s")
+    print(f"cohort:       {args.cohort:>9} employees x {args.steps} steps in {t_vec:.2f}s -> {vec_rate:,.0f} task/s")
+    print(f"speedup: {vec_rate / obj_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import io
+import time
+
+from office_rpg.minigames.autoplay import AutoPlayer, play_headless
+from office_rpg.minigames.flappy import Flappy_flap
+from office_rpg.terminal import TerminalRenderer
+
+# Headless Flappy Flap: the autoplayer plays seeds 0..games-1 on a simulated
+# clock, so a frame costs only what the tick loop (and optionally the
+# renderer) costs. Games stop at --max-score, a perfect player never dies.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flappy Flap tick loop throughput with the autoplayer")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--max-score", type=int, default=1000)
+    parser.add_argument("--moves", type=int, default=1, help="keys the autoplayer may press per tick")
+    parser.add_argument("--render", action="store_true", help="also build and diff-render every frame (into a buffer)")
+    args = parser.parse_args()
+
+    scores = []
+    ticks = 0
+    start = time.perf_counter()
+    for seed in range(args.games):
+        renderer = TerminalRenderer(io.StringIO()) if args.render else None
+        game = play_headless(seed, args.max_score, args.moves, renderer)
+        scores.append(game.score)
+        ticks += game.score + 1  # the last tick is the collision (or the one reaching max_score)
+    elapsed = time.perf_counter() - start
+
+    # autoplayer's own share: one decision per tick on a fresh game
+    game = Flappy_flap(seed=0)
+    player = AutoPlayer(game, args.moves)
+    decisions = 20_000
+    t = time.perf_counter()
+    for _ in range(decisions):
+        player.best_move()
+    per_decision = (time.perf_counter() - t) / decisions
+    game.level.close()
+
+    survived = sum(s >= args.max_score for s in scores)
+    print(f"--- {args.games} games, autoplayer ({args.moves} key/tick), up to {args.max_score}"
+          f"{', rendered' if args.render else ''} ---")
+    print(f"mean score:     {sum(scores) / len(scores):.1f} (min {min(scores)}, {survived} reached {args.max_score})")
+    print(f"simulated fps:  {ticks / elapsed:,.0f} ({ticks * Flappy_flap.GAME_SPEED / elapsed:,.0f}x real time)")
+    print(f"look-ahead:     {per_decision * 1e6:.1f} us per tick")
+
+
+if __name__ == "__main__":
+    main()
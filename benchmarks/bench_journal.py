@@ -0,0 +1,109 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from office_rpg import journal as jr
+from office_rpg.minigames.flappy import Flappy_flap
+from office_rpg.system import Console
+from simulation import POLICIES, ROLES, new_player, play_turn
+
+ACTION_KINDS = {"work": jr.WORK, "break": jr.BREAK, "item": jr.USE_ITEM, "flappy": jr.FLAPPY}
+FLAPPY_ODDS = 0.1  # breaks spent on Flappy Flap instead
+
+
+def write_journal(path, actions, role, policy, seed, ends=None):
+    """Play careers back to back until `actions` actions are journaled, returns the final player.
+
+    ends, if given, gets the encoded end state of every career but the last.
+    """
+    rng = random.Random(seed)
+    rec = jr.RecordingRandom(rng)
+    journal = jr.Journal(path)
+    policy = POLICIES[policy]
+    was_quiet = Console.quiet
+    Console.quiet = True
+    try:
+        player = None
+        for _ in range(actions):
+            if player is None or player.stress >= 100:
+                if player is not None and ends is not None:
+                    ends.append(jr.encode_snapshot(player))
+                player = new_player(role, rng=rng)
+                journal.snapshot(player)
+            action = policy(player, rng)
+            if action == "item" and not player.inventory:
+                action = "break"
+            if action == "break" and rng.random() < FLAPPY_ODDS:
+                # the game itself is real time, stand in a score for it (not journaled, like the real one)
+                score = rng.randint(0, 400)
+                player.flappy_flap_best_score = max(player.flappy_flap_best_score, score)
+                Flappy_flap.reward(player, score, player.flappy_flap_best_score, rec)
+                journal.record(jr.FLAPPY, player, rec, player.flappy_flap_best_score, score + 1)
+                continue
+            play_turn(player, action, rec)
+            journal.record(ACTION_KINDS[action], player, rec)
+    finally:
+        Console.quiet = was_quiet
+        journal.close()
+    return player
+
+
+def career_ends(path):
+    """Replay a journal the slow way, encoded state of the player before each snapshot after the first."""
+    ends = []
+    player = None
+    rng = jr.ReplayRandom()
+    was_quiet = Console.quiet
+    Console.quiet = True
+    try:
+        for kind, a, b, draws in jr.read_records(path):
+            if kind == jr.SNAPSHOT:
+                if player is not None:
+                    ends.append(jr.encode_snapshot(player))
+                player = jr.restore_player(a)
+                continue
+            rng.load(draws)
+            jr.apply_action(player, kind, a, b, rng)
+    finally:
+        Console.quiet = was_quiet
+    return ends
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Journal write and replay throughput")
+    parser.add_argument("--actions", type=int, default=200_000)
+    parser.add_argument("--role", choices=sorted(ROLES), default="Developer")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="slacker")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.journal")
+        start = time.perf_counter()
+        live_ends = []
+        live = write_journal(path, args.actions, args.role, args.policy, args.seed, live_ends)
+        write_s = time.perf_counter() - start
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        n_records = sum(1 for _ in jr.read_records(path))
+        decode_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        replayed, n, _ = jr.replay(path)
+        replay_s = time.perf_counter() - start
+        # every career, not just the last one (each new career starts from a snapshot)
+        same_careers = career_ends(path) == live_ends
+
+    same = jr.encode_snapshot(replayed) == jr.encode_snapshot(live)
+    print(f"{args.actions} actions, {size / args.actions:.1f} bytes/action, {size / 1e6:.1f} MB")
+    print(f"write:  {args.actions / write_s:>12,.0f} actions/s")
+    print(f"decode: {n_records / decode_s:>12,.0f} records/s")
+    print(f"replay: {n / replay_s:>12,.0f} actions/s")
+    print("replayed state matches:", same, f"(every career: {same_careers})")
+
+
+if __name__ == "__main__":
+    main()
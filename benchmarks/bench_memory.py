@@ -0,0 +1,48 @@
+import argparse
+import random
+import tracemalloc
+
+from office_rpg.entities import Developer
+from office_rpg.items import Coffee
+from office_rpg.tasks import CodingTask, get_random_task
+
+# Subclasses without __slots__ get a __dict__ back, so they have exactly the
+# memory layout the classes had before they were slotted.
+DictDeveloper = type("DictDeveloper", (Developer,), {})
+DictCoffee = type("DictCoffee", (Coffee,), {})
+DictCodingTask = type("DictCodingTask", (CodingTask,), {})
+
+
+def footprint(make, n):
+    """Average bytes allocated per object when keeping n of them alive."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = [make(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list itself holds one pointer per object, don't count it
+    return (after - before) / n - 8, keep
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-object memory, dict-backed vs slotted/pooled")
+    parser.add_argument("-n", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.n
+
+    rows = [
+        ("Employee", lambda i: DictDeveloper("Dev"), lambda i: Developer("Dev")),
+        ("Item", lambda i: DictCoffee(), lambda i: Coffee()),
+        ("Task", lambda i: DictCodingTask(f"Task_{i}", 3), lambda i: CodingTask(f"Task_{i}", 3)),
+        ("get_random_task", lambda i: get_random_task(), lambda i: get_random_task(pooled=True)),
+    ]
+    random.seed(0)
+    print(f"{'object':<16} {'before (B)':>10} {'after (B)':>10} {'saved':>7}")
+    for label, old, new in rows:
+        old_size, _ = footprint(old, n)
+        new_size, _ = footprint(new, n)
+        print(f"{label:<16} {old_size:>10.1f} {new_size:>10.1f} {1 - new_size / old_size:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+# Load generator for office_rpg.server: many concurrent telnet-style sessions,
+# each logs in and sends work/break commands. Reports command throughput, the
+# latency distribution and, when it starts the server itself, the server's CPU
+# time, from which sessions per core follows.
+
+PROMPT = b"\n> "
+MIX = ["work", "work", "break", "status", "items"]
+
+
+async def read_reply(reader):
+    try:
+        return await reader.readuntil(PROMPT)
+    except asyncio.IncompleteReadError:
+        return None  # server closed the session (burnout or quit)
+
+
+async def session(host, port, index, commands, think, latencies, connect_gate):
+    rng = random.Random(index)
+    name = f"bench_{index}"
+    sent = 0
+    while sent < commands:
+        async with connect_gate:
+            reader, writer = await asyncio.open_connection(host, port)
+            await read_reply(reader)
+        writer.write(f"login {name} dev\n".encode())
+        await read_reply(reader)
+        alive = True
+        while alive and sent < commands:
+            if think:
+                await asyncio.sleep(rng.expovariate(1 / think))
+            start = time.perf_counter_ns()
+            writer.write(rng.choice(MIX).encode() + b"\n")
+            alive = await read_reply(reader) is not None
+            latencies.append(time.perf_counter_ns() - start)
+            sent += 1
+        if alive:
+            writer.write(b"quit\n")
+            await reader.read()
+        writer.close()
+
+
+async def load(host, port, sessions, commands, think, connect_limit):
+    latencies = []
+    gate = asyncio.Semaphore(connect_limit)  # don't overrun the listen backlog
+    start = time.perf_counter()
+    await asyncio.gather(*(session(host, port, i, commands, think, latencies, gate) for i in range(sessions)))
+    return latencies, time.perf_counter() - start
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(host, port, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server on {host}:{port} didn't come up")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent sessions against the game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="existing server (default: start one)")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--commands", type=int, default=20, help="commands per session")
+    parser.add_argument("--think", type=float, default=0.05, help="mean seconds between a session's commands")
+    parser.add_argument("--time-scale", type=float, default=0.0, help="in-game pauses of a started server (0 = none)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes of a started server")
+    parser.add_argument("--connect-limit", type=int, default=200)
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    tmp = tempfile.TemporaryDirectory()
+    if port is None:
+        port = free_port()
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        server = subprocess.Popen(
+            [sys.executable, "-m", "office_rpg.server", "--port", str(port), "--seed", "0",
+             "--time-scale", str(args.time_scale), "--workers", str(args.workers),
+             "--saves", os.path.join(tmp.name, "saves.db")],
+            cwd=root, stdout=subprocess.DEVNULL,
+        )
+        wait_for(args.host, port)
+
+    try:
+        latencies, elapsed = asyncio.run(load(args.host, port, args.sessions, args.commands, args.think, args.connect_limit))
+    finally:
+        cpu = None
+        if server is not None:
+            server.terminate()
+            # rusage of the server and its workers
+            _, _, usage = os.wait4(server.pid, 0)
+            cpu = usage.ru_utime + usage.ru_stime
+        tmp.cleanup()
+
+    latencies.sort()
+    n = len(latencies)
+    pct = lambda p: latencies[min(n - 1, n * p // 100)] / 1e6
+    print(f"{args.sessions} sessions x {args.commands} commands in {elapsed:.2f}s, think {args.think * 1000:g} ms")
+    print(f"throughput: {n / elapsed:,.0f} commands/s")
+    print(f"latency:    p50 {pct(50):.2f} ms  p99 {pct(99):.2f} ms  max {latencies[-1] / 1e6:.2f} ms")
+    if cpu is not None:
+        busy = cpu / elapsed
+        print(f"server cpu: {cpu:.2f}s ({busy:.0%} of one core)")
+        if args.workers == 1 and busy > 0:
+            # one event loop = one core, scale the sessions up to a fully busy core
+            print(f"sessions per core at this command rate: ~{args.sessions / busy:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
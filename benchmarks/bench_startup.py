@@ -0,0 +1,53 @@
+import argparse
+import subprocess
+import sys
+
+# Cold import cost of the game, as reported by python -X importtime.
+# Only counts what "python project.py" pays before the title screen, so the
+# minigames and the keyboard package should not show up here at all.
+
+
+def import_times(module):
+    """Run a fresh interpreter importing module, returns {package: (self_us, cumulative_us)}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold import time of the game (python -X importtime)")
+    parser.add_argument("--module", default="office_rpg.game")
+    parser.add_argument("--runs", type=int, default=5, help="keep the best of this many runs")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="exit with status 1 if the import takes longer than this")
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda t: t[args.module][1])
+    total_ms = best[args.module][1] / 1000
+
+    print(f"{'package':<40} {'self (ms)':>10} {'cumul (ms)':>10}")
+    for name, (self_us, cumulative_us) in sorted(best.items(), key=lambda kv: -kv[1][0])[:args.top]:
+        print(f"{name:<40} {self_us / 1000:>10.2f} {cumulative_us / 1000:>10.2f}")
+    print(f"import {args.module}: {total_ms:.1f} ms (best of {args.runs})")
+    for name in ("keyboard", "office_rpg.minigames.flappy"):
+        if name in best:
+            print(f"warning: {name} is imported at startup")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"over budget: {total_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
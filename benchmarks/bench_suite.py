@@ -0,0 +1,311 @@
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks import harness
+from benchmarks.bench_startup import import_times
+from office_rpg.entities import Employee, Intern, Developer, Manager, HR
+from office_rpg.events import BufferedConsoleSink, LogSink
+from office_rpg.metrics import Metrics
+from office_rpg.minigames.flappy import Flappy_flap, FlappyBoard
+from office_rpg.minigames.levels import LevelStream
+from office_rpg.system import Console, SystemAdmin
+from office_rpg.tasks import get_random_task
+from office_rpg.terminal import TerminalRenderer
+
+# The hot paths of the game in one run: python -m benchmarks.bench_suite --json out.json
+# and later --baseline out.json to fail on a slowdown.
+
+ROLE_LIST = [Employee, Intern, Developer, Manager, HR]
+BOARD_SIZES = [(3, 20), (7, 20), (24, 80), (48, 160)]
+
+
+def bench_do_task(role, n, metrics=False, sink=None):
+    """Task.do_task with sleeps and prints off (Console.quiet), fresh employee every 100 tasks.
+
+    With a sink the events go there instead, flushed after every task (one turn).
+    """
+    rng = random.Random(0)
+    tasks = [get_random_task(rng) for _ in range(1024)]
+    employees = []
+
+    def setup(i):
+        if i % 100 == 0:
+            employees.append(role("Bench"))
+        return tasks[i % len(tasks)], employees[-1]
+
+    def op(arg):
+        task, emp = arg
+        task.do_task(emp, rng)
+        Console.flush()
+
+    name = f"do_task/{role.__name__}{'/metrics' if metrics else ''}"
+    if sink is not None:
+        name += f"/{type(sink).__name__}"
+    was_quiet, was_enabled, was_sink = Console.quiet, Metrics.enabled, Console.sink
+    Console.quiet = sink is None
+    Console.sink = sink
+    Metrics.enabled = metrics
+    try:
+        return harness.measure(name, op, n, setup)
+    finally:
+        Console.quiet, Metrics.enabled, Console.sink = was_quiet, was_enabled, was_sink
+
+
+def allocated_per_call(fn, calls=10_000):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = [fn() for _ in range(calls)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / calls - 8  # minus the list slot
+
+
+def bench_get_random_task(n, pooled):
+    rng = random.Random(0)
+    per_call = allocated_per_call(lambda: get_random_task(rng, pooled))
+    r = harness.measure(f"get_random_task/{'pooled' if pooled else 'fresh'}", lambda _: get_random_task(rng, pooled), n)
+    r.extra["bytes_per_call"] = per_call
+    r.extra["alloc_mb_per_s"] = per_call * r.ops_per_s / 1e6
+    return r
+
+
+def bench_level_stream(n, background):
+    """next() on a Flappy Flap level, across both board growths."""
+    stream = LevelStream(0, Flappy_flap.SCREEN_HEIGHT, Flappy_flap.GROWTH, background=background)
+    name = f"flappy/level_stream{'/thread' if background else ''}"
+    try:
+        return harness.measure(name, lambda _: next(stream), n)
+    finally:
+        stream.close()
+
+
+def bench_autoplay(n):
+    """Headless Flappy Flap: one tick with the autoplayer choosing the keys (through both growths)."""
+    from office_rpg.minigames.autoplay import AutoPlayer
+
+    state = {}
+
+    def new_game():
+        state["game"] = Flappy_flap(seed=0)
+        state["player"] = AutoPlayer(state["game"])
+
+    def tick(_):
+        if not state["game"].tick(state["player"].drain()):
+            state["game"].level.close()
+            new_game()
+
+    new_game()
+    try:
+        return harness.measure("flappy/autoplay_tick", tick, n)
+    finally:
+        state["game"].level.close()
+
+
+def bench_draw_game(height, width, n):
+    """draw_game (build the lines + diff render) on a board of height x width."""
+    game = Flappy_flap(seed=0)
+    game.board = FlappyBoard(height, width)
+    game.level = LevelStream(0, height)
+    out = io.StringIO()
+    renderer = TerminalRenderer(out)
+
+    def setup(i):
+        # advance the board outside the timed region so every frame differs
+        game.board.scroll(game.next_column())
+        game.score += 1
+        game.cursor_position = i % height
+        if i % 1000 == 0:
+            out.seek(0)
+            out.truncate()
+
+    r = harness.measure(f"draw_game/{height}x{width}", lambda _: game.draw_game(0, renderer), n, setup)
+    render = sorted(renderer.frame_times[-n:])
+    r.extra["render_p50_us"] = render[len(render) // 2] * 1e6
+    r.extra["build_p50_us"] = max(0.0, r.p50_us - r.extra["render_p50_us"])
+    return r
+
+
+def bench_save_load(n, saves):
+    """SystemAdmin.save_game + load_game of one player, with `saves` other players on disk."""
+    old_path, old_file, old_store = SystemAdmin.db_path, SystemAdmin.filename, SystemAdmin._store
+    with tempfile.TemporaryDirectory() as tmp:
+        SystemAdmin.db_path = os.path.join(tmp, "saves.db")
+        SystemAdmin.filename = os.path.join(tmp, "savefile.json")
+        SystemAdmin._store = None
+        try:
+            store = SystemAdmin.store()
+            store.db.execute("BEGIN")
+            store.db.executemany(
+                "INSERT INTO saves VALUES (?, 'Intern', 0, 40, 0, 1, 0, '[]', ?)",
+                ((f"Player_{i}", time.time()) for i in range(saves)),
+            )
+            store.db.execute("COMMIT")
+            player = Developer("Bench")
+
+            def setup(i):
+                player.stress = i % 100  # something changed, so every save writes
+
+            def op(_):
+                SystemAdmin.save_game(player)
+                SystemAdmin.load_game(player.name)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                r = harness.measure("save_load/roundtrip", op, n, setup)
+            r.extra["saves_on_disk"] = saves
+            store.close()
+        finally:
+            SystemAdmin.db_path, SystemAdmin.filename, SystemAdmin._store = old_path, old_file, old_store
+    return r
+
+
+def bench_inventory(n):
+    """Long craft chain (bundle + coffee, n times) and use/add in a 1000-stack inventory."""
+    from office_rpg.items import Coffee, Inventory
+
+    inventory = Inventory()
+    coffee = inventory.add(Coffee("Espresso", 20), n)
+    chain = [inventory.add(Coffee("Instant Coffee", 10))]
+
+    def craft(_):
+        chain[0] = inventory.craft(chain[0], coffee)
+
+    craft_result = harness.measure("inventory/craft_chain", craft, n, warmup=0)
+    # stays at 2 parts and a short name however long the chain
+    bundle = inventory.item(chain[0])
+    craft_result.extra.update(parts=len(bundle.parts()), name_chars=len(bundle.name))
+
+    inventory = Inventory(Coffee(f"Blend {i}", i % 50) for i in range(1000))
+    handles = [h for h, _, _ in inventory]
+
+    def use_add(i):
+        item = inventory.take(handles[i % 1000])
+        handles[i % 1000] = inventory.add(item)
+
+    return [craft_result, harness.measure("inventory/use_add", use_add, n * 10, setup=lambda i: i)]
+
+
+def bench_leaderboard(n, players):
+    """Leaderboard submit / rank / top 10 with `players` players on the board."""
+    from office_rpg.leaderboard import Leaderboard
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "saves.db")
+        board = Leaderboard(path)
+        board.db.execute("BEGIN")
+        board.db.executemany(
+            "INSERT INTO leaderboard VALUES (?, ?, 'Intern', 1, ?)",
+            ((f"Player_{i}", int(rng.expovariate(1 / 60)), i) for i in range(players)),
+        )
+        board.db.execute("INSERT INTO score_counts SELECT score, COUNT(*) FROM leaderboard GROUP BY score")
+        board.db.execute("COMMIT")
+        board.close()
+
+        start = time.perf_counter_ns()
+        board = Leaderboard(path)
+        open_ms = (time.perf_counter_ns() - start) / 1e6
+        scores = lambda i: int(rng.expovariate(1 / 60))
+        results = [
+            harness.measure("leaderboard/submit", lambda s: board.submit(f"Player_{s}", s, "Developer", 2), n, scores),
+            harness.measure("leaderboard/rank", lambda s: (board.rank(s), board.percentile(s)), n * 10, scores),
+            harness.measure("leaderboard/top10", lambda _: board.top(10), n),
+        ]
+        board.close()
+    for r in results:
+        r.extra.update(players=players, open_ms=open_ms)
+    return results
+
+
+def bench_planner(n):
+    """The career planner's step() (a work turn) and one cautious rollout of 30 turns, from a fresh Developer."""
+    import planner
+
+    rng = random.Random(0)
+    state = ("Developer", 0, 50, 0, 1, (("coffee", 10, 1),))
+    return [
+        harness.measure("planner/step", lambda _: planner.step(state, planner.WORK, rng), n * 10),
+        harness.measure("planner/rollout", lambda _: planner.rollout(state, 30, rng), n),
+    ]
+
+
+def bench_import(module, runs):
+    samples = [import_times(module)[module][1] * 1000 for _ in range(runs)]
+    return harness.Result(f"import/{module}", samples)
+
+
+def run(args):
+    scale = 0.1 if args.quick else 1.0
+    n = lambda count: max(100, int(count * scale))
+    cases = []
+    for role in ROLE_LIST:
+        cases.append((f"do_task/{role.__name__}", lambda role=role: bench_do_task(role, n(50_000))))
+    # same as do_task/Developer with the metrics hooks recording
+    cases.append(("do_task/Developer/metrics", lambda: bench_do_task(Developer, n(50_000), metrics=True)))
+    # the same with the events rendered into a buffer (no sleeps) or logged as JSON
+    cases.append(("do_task/Developer/BufferedConsoleSink",
+                  lambda: bench_do_task(Developer, n(50_000), sink=BufferedConsoleSink(io.StringIO(), time_scale=0))))
+    cases.append(("do_task/Developer/LogSink", lambda: bench_do_task(Developer, n(50_000), sink=LogSink(io.StringIO()))))
+    for pooled in (False, True):
+        name = f"get_random_task/{'pooled' if pooled else 'fresh'}"
+        cases.append((name, lambda pooled=pooled: bench_get_random_task(n(100_000), pooled)))
+    for background in (False, True):
+        name = f"flappy/level_stream{'/thread' if background else ''}"
+        cases.append((name, lambda background=background: bench_level_stream(n(200_000), background)))
+    cases.append(("flappy/autoplay_tick", lambda: bench_autoplay(n(20_000))))
+    for height, width in BOARD_SIZES:
+        frames = n(max(1_000, 1_200_000 // (height * width)))  # fewer frames on the big boards
+        cases.append((f"draw_game/{height}x{width}", lambda h=height, w=width, f=frames: bench_draw_game(h, w, f)))
+    cases.append(("save_load/roundtrip", lambda: bench_save_load(n(5_000), args.saves)))
+    cases.append(("inventory", lambda: bench_inventory(n(20_000))))
+    cases.append(("leaderboard", lambda: bench_leaderboard(n(5_000), args.players)))
+    cases.append(("planner", lambda: bench_planner(n(50_000))))
+    cases.append(("import/office_rpg.game", lambda: bench_import("office_rpg.game", args.import_runs)))
+
+    results = []
+    for name, case in cases:
+        if args.only and args.only not in name:
+            continue
+        random.seed(0)
+        result = case()
+        results.extend(result if isinstance(result, list) else [result])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput and tail latency of the game's hot paths")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results of an earlier run (--json) to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="with --baseline: fail if throughput drops or the median grows by more than this (0.2 = 20%%)")
+    parser.add_argument("--check-tail", action="store_true", help="with --baseline: also fail on p99 growth")
+    parser.add_argument("--only", help="run only the benchmarks whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="10x fewer iterations")
+    parser.add_argument("--saves", type=int, default=100_000, help="other players in the save store")
+    parser.add_argument("--players", type=int, default=1_000_000, help="players on the leaderboard")
+    parser.add_argument("--import-runs", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = harness.load(args.baseline) if args.baseline else None
+    results = run(args)
+    harness.print_table(results, baseline)
+    if args.json:
+        harness.save(args.json, results)
+
+    if baseline is not None:
+        regressions = harness.compare(baseline, results, args.threshold, args.check_tail)
+        if regressions:
+            print(f"regressions over {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"no regressions over {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
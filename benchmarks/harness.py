@@ -0,0 +1,105 @@
+import json
+import platform
+import sys
+import time
+
+# Small benchmark harness: time one operation many times, keep every sample so
+# tail latency is real (not derived from a batch average), save/compare JSON.
+
+
+class Result:
+    def __init__(self, name, samples_ns, extra=None):
+        samples = sorted(samples_ns)
+        self.name = name
+        self.n = len(samples)
+        total = sum(samples)
+        self.ops_per_s = self.n / (total / 1e9) if total else float("inf")
+        self.p50_us = percentile(samples, 50) / 1000
+        self.p99_us = percentile(samples, 99) / 1000
+        self.p999_us = percentile(samples, 99.9) / 1000
+        self.max_us = samples[-1] / 1000
+        self.extra = extra or {}
+
+    def to_dict(self):
+        d = {
+            "n": self.n,
+            "ops_per_s": self.ops_per_s,
+            "p50_us": self.p50_us,
+            "p99_us": self.p99_us,
+            "p999_us": self.p999_us,
+            "max_us": self.max_us,
+        }
+        d.update(self.extra)
+        return d
+
+
+def percentile(sorted_samples, pct):
+    i = min(len(sorted_samples) - 1, int(len(sorted_samples) * pct / 100))
+    return sorted_samples[i]
+
+
+def measure(name, op, n, setup=None, warmup=None, extra=None):
+    """Call op(arg) n times (after warmup calls), timing each call on its own.
+
+    arg comes from setup(i), which runs outside the timed region (None without setup).
+    """
+    clock = time.perf_counter_ns
+    for i in range(n // 10 if warmup is None else warmup):
+        op(setup(i) if setup is not None else None)
+    samples = [0] * n
+    for i in range(n):
+        arg = setup(i) if setup is not None else None
+        start = clock()
+        op(arg)
+        samples[i] = clock() - start
+    return Result(name, samples, extra)
+
+
+def environment():
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def save(path, results):
+    with open(path, "w") as f:
+        json.dump({"env": environment(), "results": {r.name: r.to_dict() for r in results}}, f, indent=2)
+
+
+def load(path):
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline, results, threshold, tail=False):
+    """Names of the results slower than baseline by more than threshold (0.2 = 20%).
+
+    Slower means lower throughput or a higher median, and with tail=True also a
+    higher p99 (noisy on a busy machine). Benchmarks missing from either side
+    are skipped.
+    """
+    keys = ["p50_us", "p99_us"] if tail else ["p50_us"]
+    regressions = []
+    for r in results:
+        base = baseline.get(r.name)
+        if base is None:
+            continue
+        now = r.to_dict()
+        if now["ops_per_s"] < base["ops_per_s"] * (1 - threshold) or any(
+            now[k] > base[k] * (1 + threshold) for k in keys
+        ):
+            regressions.append(r.name)
+    return regressions
+
+
+def print_table(results, baseline=None):
+    print(f"{'benchmark':<40} {'ops/s':>12} {'p50 us':>9} {'p99 us':>9} {'p99.9 us':>9} {'vs base':>8}")
+    for r in results:
+        change = ""
+        if baseline and r.name in baseline:
+            change = f"{r.ops_per_s / baseline[r.name]['ops_per_s'] - 1:+.0%}"
+        print(f"{r.name:<40} {r.ops_per_s:>12,.0f} {r.p50_us:>9.2f} {r.p99_us:>9.2f} {r.p999_us:>9.2f} {change:>8}")
@@ -0,0 +1,169 @@
+import functools
+
+import numpy as np  # requires "numpy" package
+
+from office_rpg.balance import Balance
+from office_rpg.entities import Employee, Intern, Developer, Manager, HR
+from office_rpg.tasks import TaskTable
+
+
+# ==========================================
+# VECTORIZED COHORT
+# ==========================================
+# Struct-of-arrays version of Employee: one slot per employee in each array.
+# apply_task() is do_task() for the whole cohort at once, same task table,
+# same clamping, same promotion, just numpy instead of one object at a time.
+# The numbers come from the current Balance, like in the game.
+
+ROLE_CLASSES = (Employee, Intern, Developer, Manager, HR)
+EMPLOYEE, INTERN, DEVELOPER, MANAGER, HR_ROLE = range(len(ROLE_CLASSES))
+
+
+def start_motivation():
+    """Starting motivation of each role, see the constructors in office_rpg/entities.py."""
+    b = Balance
+    return np.array([b.employee_motivation, b.intern_motivation, b.developer_motivation,
+                     b.manager_motivation, b.hr_motivation], dtype=np.int64)
+
+
+def role_code(emp):
+    return ROLE_CLASSES.index(type(emp))
+
+
+class TaskRules:
+    """One task type's row of the TaskTable as arrays indexed by role code."""
+
+    def __init__(self, task_cls):
+        mods = [TaskTable.lookup(task_cls, role)[0] for role in ROLE_CLASSES]
+        self.chance = np.array([m.chance for m in mods])
+        self.has_set_chance = np.array([m.set_chance is not None for m in mods])
+        self.set_chance = np.array([m.set_chance or 0 for m in mods])
+        self.level_min = np.array([m.level_chance[0] if m.level_chance else 10 ** 9 for m in mods])
+        self.level_chance = np.array([m.level_chance[1] if m.level_chance else 0 for m in mods])
+        self.stress = np.array([m.stress for m in mods])
+        self.motivation = np.array([m.motivation for m in mods])
+        self.xp_bonus = np.array([m.xp_bonus for m in mods])
+        self.skip = np.array([m.skip for m in mods])
+        self.disaster_odds = np.array([m.disaster["odds"] if m.disaster else 0.0 for m in mods])
+        self.disaster_stress = np.array([m.disaster["stress"] if m.disaster else 0 for m in mods])
+
+
+def task_rules(task_cls):
+    return _task_rules(task_cls, Balance.key())
+
+
+@functools.lru_cache(maxsize=None)
+def _task_rules(task_cls, rules):
+    return TaskRules(task_cls)  # rules (Balance.key()) only keys the cache
+
+
+class Cohort:
+    def __init__(self, roles, seed=None):
+        self.role = np.asarray(roles, dtype=np.int8)
+        n = len(self.role)
+        self.stress = np.zeros(n, dtype=np.int64)
+        self.motivation = start_motivation()[self.role]
+        self.xp = np.zeros(n, dtype=np.int64)
+        self.level = np.ones(n, dtype=np.int64)
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_employees(cls, employees, seed=None):
+        c = cls([role_code(e) for e in employees], seed)
+        c.stress[:] = [e.stress for e in employees]
+        c.motivation[:] = [e.motivation for e in employees]
+        c.xp[:] = [e.xp for e in employees]
+        c.level[:] = [e.level for e in employees]
+        return c
+
+    def __len__(self):
+        return len(self.role)
+
+    def is_role(self, code):
+        return self.role == code
+
+    # same clamping as the CorporateEntity.stress / Employee.motivation setters
+    def _set_stress(self, mask, val):
+        self.stress = np.where(mask, np.clip(val, 0, 100), self.stress)
+
+    def _set_motivation(self, mask, val):
+        self.motivation = np.where(mask, np.clip(val, 0, 100), self.motivation)
+
+    def calc_odds(self, diff, noise=None):
+        b = Balance
+        base = self.motivation + self.level * b.odds_per_level - diff * b.odds_per_diff
+        if noise is None:
+            noise = self.rng.integers(-b.odds_noise, b.odds_noise + 1, len(self))
+        return np.clip(base + noise, b.odds_min, b.odds_max)
+
+    def take_break(self, mask=None, rec=None):
+        if mask is None:
+            mask = np.ones(len(self), dtype=bool)
+        if rec is None:
+            rec = self.rng.integers(Balance.break_min, Balance.break_max + 1, len(self))
+        self._set_motivation(mask, self.motivation + rec)
+        self._set_stress(mask, self.stress - Balance.break_stress)
+
+    def apply_task(self, task_cls, diff, mask=None):
+        """Run task_cls(diff).do_task() for every employee in mask (default: everyone)."""
+        n = len(self)
+        chance = self.task_chance(task_cls, diff)
+        deleted = self.rng.random(n) < task_rules(task_cls).disaster_odds[self.role]
+        success = self.rng.integers(0, 101, n) < chance
+        return self.task_effects(task_cls, diff, success, deleted, mask)
+
+    def task_chance(self, task_cls, diff, noise=None):
+        """Success threshold after the role modifiers (success is randint(0, 100) < chance)."""
+        rules = task_rules(task_cls)
+        role = self.role
+        chance = self.calc_odds(diff, noise)
+        chance = np.where(rules.has_set_chance[role], rules.set_chance[role], chance + rules.chance[role])
+        return chance + np.where(self.level >= rules.level_min[role], rules.level_chance[role], 0)
+
+    def task_effects(self, task_cls, diff, success, deleted=None, mask=None):
+        """Apply the stat changes of task_cls(diff) for a known outcome.
+
+        deleted marks the employees whose disaster roll hit (managers deleting the repo).
+        """
+        n = len(self)
+        if mask is None:
+            mask = np.ones(n, dtype=bool)
+        rules = task_rules(task_cls)
+        role = self.role
+        # employees that make it to Task.resolve (disasters and skips return early)
+        resolving = mask.copy()
+
+        if deleted is not None:
+            deleted = mask & deleted & (rules.disaster_odds[role] > 0)
+            self._set_stress(deleted, self.stress + rules.disaster_stress[role])
+            resolving &= ~deleted
+        self._set_motivation(resolving, self.motivation + rules.motivation[role])
+        self._set_stress(resolving, self.stress + rules.stress[role])
+        resolving &= ~rules.skip[role]
+
+        b = Balance
+        xp_gain = diff * b.xp_per_diff + rules.xp_bonus[role]
+        self._resolve(resolving, success, diff * b.stress_per_diff, diff * b.mot_cost_per_diff, xp_gain)
+        return success & resolving
+
+    def _resolve(self, mask, success, stress_add, mot_cost, xp_gain):
+        # Task.resolve: motivation cost, then xp on success, then stress
+        self._set_motivation(mask, self.motivation - mot_cost)
+
+        won = mask & success
+        # Intern.add_xp gets the intern_xp_rate bonus (float then int(), like the original)
+        gained = np.where(self.is_role(INTERN), (xp_gain * Balance.intern_xp_rate).astype(np.int64), xp_gain)
+        self.xp = np.where(won, self.xp + gained, self.xp)
+
+        # Employee.add_xp promotion rule
+        promoted = won & (self.xp >= self.level * Balance.xp_per_level)
+        self.level = np.where(promoted, self.level + 1, self.level)
+        self.xp = np.where(promoted, 0, self.xp)
+        self.motivation = np.where(promoted, 100, self.motivation)
+        self.stress = np.where(promoted, 0, self.stress)
+
+        added = np.where(success, stress_add // 2, stress_add)
+        self._set_stress(mask, self.stress + added)
+
+    def burned_out(self):
+        return self.stress >= 100
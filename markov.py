@@ -0,0 +1,328 @@
+import argparse
+import functools
+import time
+
+import numpy as np  # requires "numpy" package
+import scipy.sparse as sparse  # requires "scipy" package
+import scipy.sparse.linalg as sparse_linalg
+
+from cohort import Cohort, ROLE_CLASSES, start_motivation
+from office_rpg.balance import Balance
+from office_rpg.tasks import TASK_TYPES, TaskTable
+from simulation import ROLES, POLICIES
+
+
+# ==========================================
+# EXACT CAREER SOLVER (MARKOV CHAIN)
+# ==========================================
+# A career is a Markov chain on (level, xp, stress, motivation). Inside one
+# level the (stress, motivation) moves don't depend on xp, xp only goes up and
+# a promotion always lands on (stress_add // 2, 100, xp 0). So we build the
+# transitions once per level (with the vectorized Cohort rules), factor
+# (I - Q) once, and push the probability mass through the xp values one at a
+# time, lowest first (one sparse solve per xp value).
+#
+# Items aren't modelled: the solver plays with an empty inventory, so an
+# "item" action is a wasted turn (like play_turn with nothing to use).
+#
+# The rules are the current Balance's, the caches are keyed on Balance.key().
+
+DIFFS = range(1, 9)
+
+# live states: stress 0..99 x motivation 0..100, flat index stress * 101 + motivation
+N_STATES = 100 * 101
+BURNOUT = N_STATES  # sink column, stress hit 100
+
+# xp start so low the cohort never promotes, so (xp after - XP_FLOOR) is the raw xp gain
+XP_FLOOR = -(10 ** 9)
+
+
+def state_index(stress, motivation):
+    return np.where(stress >= 100, BURNOUT, stress * 101 + motivation)
+
+
+class _Probe:
+    """What a policy gets to see for a solver state."""
+
+    def __init__(self, stress, motivation, level):
+        self.name = "Solver"
+        self.stress = stress
+        self.motivation = motivation
+        self.level = level
+        self.xp = 0
+        self.inventory = []
+
+
+class _NoRandom:
+    def __getattr__(self, name):
+        raise ValueError("the Markov solver only works with deterministic policies")
+
+
+class LevelModel:
+    """Transitions of one level for a role + policy, shared by every xp value of it."""
+
+    def __init__(self, src, dst, gain, promo, prob):
+        within = gain == 0
+        self.src0, self.dst0, self.p0 = src[within], dst[within], prob[within]
+        self.src1, self.dst1, self.p1 = src[~within], dst[~within], prob[~within]
+        self.gain1, self.promo1 = gain[~within], promo[~within]
+        self.gains = sorted(set(self.gain1.tolist()))
+        # per xp gain: which successes burn out (if they don't promote) and which just move on
+        self.by_gain = {}
+        for g in self.gains:
+            of_g = self.gain1 == g
+            self.by_gain[g] = (
+                np.flatnonzero(of_g),
+                np.flatnonzero(of_g & (self.dst1 == BURNOUT)),
+                np.flatnonzero(of_g & (self.dst1 != BURNOUT)),
+            )
+
+        # states that can only ever loop on themselves (e.g. always working with 0 motivation),
+        # their mass is counted as stuck instead of being pushed around forever
+        loop = self.src0 == self.dst0
+        self.stuck = np.bincount(self.src0[loop], self.p0[loop], N_STATES) > 1 - 1e-12
+
+        to_burnout = self.dst0 == BURNOUT
+        self.burnout = np.bincount(self.src0[to_burnout], self.p0[to_burnout], N_STATES)
+
+        # Q: moves that keep the xp value, minus burnout and the stuck states' rows.
+        # Occupation n of a layer solves n (I - Q) = inflow, so factor (I - Q)^T once.
+        keep = ~to_burnout & ~self.stuck[self.src0]
+        q = sparse.csr_matrix((self.p0[keep], (self.src0[keep], self.dst0[keep])), shape=(N_STATES, N_STATES))
+        # every row of Q sums to at most 1, so (I - Q)^T is column diagonally dominant and
+        # needs no pivoting, which saves about a tenth of the factoring
+        self.lu = sparse_linalg.splu((sparse.identity(N_STATES, format="csr") - q).T.tocsc(), diag_pivot_thresh=0.0)
+
+
+def _cohort(code, stress, motivation, level):
+    c = Cohort(np.full(len(stress), code))
+    c.stress = stress.copy()
+    c.motivation = motivation.copy()
+    c.level = np.full(len(stress), level, dtype=np.int64)
+    c.xp = np.full(len(stress), XP_FLOOR, dtype=np.int64)
+    return c
+
+
+@functools.lru_cache(maxsize=None)
+def level_model(role, policy_name, level, rules):
+    """The LevelModel of level, rules is Balance.key() (only there for the cache)."""
+    policy = POLICIES[policy_name]
+    code = ROLE_CLASSES.index(ROLES[role])
+    stress, motivation = np.divmod(np.arange(N_STATES), 101)
+    actions = np.array([policy(_Probe(int(s), int(m), level), _NoRandom()) for s, m in zip(stress, motivation)])
+
+    parts = []  # (src, dst, gain, promo, prob)
+
+    def add(src, c, gain, promo, prob):
+        parts.append((src, state_index(c.stress, c.motivation), gain, promo, np.broadcast_to(prob, src.shape)))
+
+    # Work: get_random_task picks one of 6 types and a diff 1..8, all equally likely
+    work = np.flatnonzero(actions == "work")
+    p_combo = 1 / (len(TASK_TYPES) * len(DIFFS))
+    for task_cls in TASK_TYPES:
+        for diff in DIFFS:
+            tired = motivation[work] < diff * Balance.mot_cost_per_diff
+            src = work[tired]
+            parts.append((src, src, np.zeros_like(src), src, np.full(src.shape, p_combo)))
+
+            src = work[~tired]
+            p_win = np.array(TaskTable.success_odds(task_cls, ROLES[role], level, diff))[motivation[src]]
+            disaster = TaskTable.lookup(task_cls, ROLES[role])[0].disaster
+            p_del = disaster["odds"] if disaster else 0.0
+            promo = np.full(src.shape, (diff * Balance.stress_per_diff // 2) * 101 + 100)
+            for won, p in ((True, p_win), (False, 1 - p_win)):
+                after = _cohort(code, stress[src], motivation[src], level)
+                after.task_effects(task_cls, diff, np.full(len(src), won))
+                add(src, after, after.xp - XP_FLOOR, promo, p_combo * (1 - p_del) * p)
+            if p_del:
+                after = _cohort(code, stress[src], motivation[src], level)
+                after.task_effects(task_cls, diff, np.zeros(len(src), dtype=bool), np.ones(len(src), dtype=bool))
+                add(src, after, np.zeros_like(src), promo, p_combo * p_del)
+
+    # Break: take_break recovers randint(break_min, break_max) motivation
+    rest = np.flatnonzero(actions == "break")
+    recs = range(Balance.break_min, Balance.break_max + 1)
+    for rec in recs:
+        c = _cohort(code, stress[rest], motivation[rest], level)
+        c.take_break(rec=rec)
+        add(rest, c, np.zeros_like(rest), rest, 1 / len(recs))
+
+    # anything else (an item with an empty inventory) is a lost turn
+    idle = np.flatnonzero((actions != "work") & (actions != "break"))
+    parts.append((idle, idle, np.zeros_like(idle), idle, np.ones(idle.shape)))
+
+    src, dst, gain, promo, prob = (np.concatenate(col) for col in zip(*parts))
+
+    # merge transitions that end up in the same place
+    promo = np.where(gain > 0, promo, 0)
+    n_gain = int(gain.max()) + 1
+    key = ((src * (N_STATES + 1) + dst) * n_gain + gain) * N_STATES + promo
+    uniq, inverse = np.unique(key, return_inverse=True)
+    prob = np.bincount(inverse, prob)
+    rest, promo = np.divmod(uniq, N_STATES)
+    rest, gain = np.divmod(rest, n_gain)
+    src, dst = np.divmod(rest, N_STATES + 1)
+    return LevelModel(src, dst, gain, promo, prob)
+
+
+class LevelResult:
+    def __init__(self):
+        self.burnout = 0.0
+        self.burnout_time = 0.0
+        self.stuck = 0.0
+        self.turns = 0.0  # expected turns spent in the level
+        self.xp = 0.0  # expected xp earned in the level
+        self.promo = np.zeros(N_STATES)
+        self.promo_time = np.zeros(N_STATES)
+
+
+def solve_level(model, level, mass, time_mass):
+    """Push the entry distribution of a level through it.
+
+    mass[i] is the chance of entering the level in state i, time_mass[i] is
+    E[turn number at entry; entered in state i].
+    """
+    threshold = level * Balance.xp_per_level
+    # xp values this level can reach
+    xps = [0]
+    seen = {0}
+    for x in xps:
+        for g in model.gains:
+            if x + g < threshold and x + g not in seen:
+                seen.add(x + g)
+                xps.append(x + g)
+    xps.sort()
+    layer = {x: i for i, x in enumerate(xps)}
+    inflow = np.zeros((len(xps), N_STATES))
+    inflow_t = np.zeros((len(xps), N_STATES))
+    inflow[0] = mass
+    inflow_t[0] = time_mass
+
+    res = LevelResult()
+    for i, x in enumerate(xps):
+        if not inflow[i].any():
+            continue
+        # expected visits, and expected sum of the turn numbers of those visits:
+        # occ (I - Q) = inflow and occ_t (I - Q) = inflow_t + occ Q = inflow_t + occ - inflow
+        occ = model.lu.solve(inflow[i])
+        occ_t = model.lu.solve(inflow_t[i] + occ - inflow[i])
+        res.stuck += occ[model.stuck].sum()
+        occ[model.stuck] = 0
+        occ_t[model.stuck] = 0
+        res.turns += occ.sum()
+        res.burnout += occ @ model.burnout
+        res.burnout_time += (occ_t + occ) @ model.burnout
+
+        # everything that leaves this xp value through a success
+        w = occ[model.src1] * model.p1
+        w_t = (occ_t + occ)[model.src1] * model.p1
+        res.xp += w @ model.gain1
+        for g, (every, burn, move) in model.by_gain.items():
+            if x + g >= threshold:
+                # promotion resets stress, so nobody burns out on the way up
+                res.promo += np.bincount(model.promo1[every], w[every], N_STATES)
+                res.promo_time += np.bincount(model.promo1[every], w_t[every], N_STATES)
+                continue
+            res.burnout += w[burn].sum()
+            res.burnout_time += w_t[burn].sum()
+            j = layer[x + g]
+            inflow[j] += np.bincount(model.dst1[move], w[move], N_STATES)
+            inflow_t[j] += np.bincount(model.dst1[move], w_t[move], N_STATES)
+    return res
+
+
+class CareerStats:
+    def __init__(self, role, policy_name, target_level):
+        self.role = role
+        self.policy = policy_name
+        self.target_level = target_level
+        self.burnout_probability = 0.0
+        self.stuck_probability = 0.0
+        self.expected_burnout_turn = 0.0
+        self.reach_probability = {1: 1.0}
+        self.expected_turns_to_level = {1: 0.0}
+        self.xp_per_turn = 0.0
+
+    def __str__(self):
+        lines = [
+            f"--- {self.role} ({self.policy}), exact ---",
+            f"Burnout before lvl {self.target_level}: {self.burnout_probability:.4%}"
+            f" (after {self.expected_burnout_turn:.1f} turns on average)",
+        ]
+        if self.stuck_probability > 1e-9:
+            lines.append(f"Stuck forever: {self.stuck_probability:.4%}")
+        lines.append(f"XP per turn: {self.xp_per_turn:.3f}")
+        for lvl in sorted(self.reach_probability):
+            if lvl == 1:
+                continue
+            lines.append(
+                f"  lvl {lvl:>2}: reached {self.reach_probability[lvl]:.4%},"
+                f" after {self.expected_turns_to_level[lvl]:.1f} turns on average"
+            )
+        return "\n".join(lines)
+
+
+def solve(role, policy_name="slacker", target_level=10):
+    """Exact career stats for a role under a deterministic policy from simulation.POLICIES.
+
+    Careers start like a new game (stress 0, role's starting motivation) and
+    end on burnout or on reaching target_level. Results are cached per Balance.
+
+    Not cheap: every level below target_level has a model of its own (the
+    odds change with the level) that takes about half a second to build and
+    factor, and pushing the mass through a level gets slower as its xp
+    threshold grows. From cold, target level 4 takes 1-2 s and a full
+    10-level solve 5-10 s. The level models are cached, a later solve for the
+    same role and policy only builds the levels it hasn't seen.
+    """
+    return _solve(role, policy_name, target_level, Balance.key())
+
+
+@functools.lru_cache(maxsize=None)
+def _solve(role, policy_name, target_level, rules):
+    stats = CareerStats(role, policy_name, target_level)
+    start = start_motivation()[ROLE_CLASSES.index(ROLES[role])]
+    mass = np.zeros(N_STATES)
+    mass[start] = 1.0
+    time_mass = np.zeros(N_STATES)
+    total_turns = 0.0
+    total_xp = 0.0
+    burn_time = 0.0
+
+    for level in range(1, target_level):
+        res = solve_level(level_model(role, policy_name, level, rules), level, mass, time_mass)
+        stats.burnout_probability += res.burnout
+        stats.stuck_probability += res.stuck
+        burn_time += res.burnout_time
+        total_turns += res.turns
+        total_xp += res.xp
+        mass, time_mass = res.promo, res.promo_time
+        reached = mass.sum()
+        stats.reach_probability[level + 1] = reached
+        stats.expected_turns_to_level[level + 1] = time_mass.sum() / reached if reached > 0 else float("inf")
+        if reached == 0:
+            break
+
+    if stats.burnout_probability > 0:
+        stats.expected_burnout_turn = burn_time / stats.burnout_probability
+    if total_turns > 0:
+        stats.xp_per_turn = total_xp / total_turns
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exact Office RPG career stats (no sampling)")
+    parser.add_argument("--role", choices=sorted(ROLES), default="Developer")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="slacker")
+    parser.add_argument("--target-level", type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = solve(args.role, args.policy, args.target_level)
+    elapsed = time.perf_counter() - start
+    print(stats)
+    print(f"Took {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+# Office RPG. Importing the package is cheap on purpose: the game, the
+# minigames and their optional dependencies are only loaded when used.
@@ -0,0 +1,3 @@
+from office_rpg.game import main
+
+main()
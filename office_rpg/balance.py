@@ -0,0 +1,100 @@
+# ==========================================
+# BALANCE
+# ==========================================
+# The numbers of the game rules, in one place. Tasks, employees and items read
+# them from Balance when they use them, so a tuning run (see sweep.py) can try
+# another set with Balance.apply({...}) without touching the code.
+#
+# What each role does to each task type stays in task_table.json (TaskTable),
+# apply() takes those cells too, named "Task.Role.field", e.g.
+# "CodingTask.Developer.chance" or "CodingTask.Manager.disaster.odds".
+
+def as_number(name, value, kind):
+    """value as kind (int or float), ValueError when it isn't one, e.g. 12.5 for an int."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{name} must be a number, not {value!r}")
+    if kind is int:
+        if value != int(value):
+            raise ValueError(f"{name} must be a whole number, not {value!r}")
+        return int(value)
+    return float(value)
+
+
+class Balance:
+    # Task.__init__, per point of difficulty
+    stress_per_diff = 5
+    mot_cost_per_diff = 3
+    xp_per_diff = 15
+    # Task.calc_odds: motivation + level * odds_per_level - diff * odds_per_diff
+    # +- odds_noise, clamped to odds_min..odds_max
+    odds_per_level = 5
+    odds_per_diff = 8
+    odds_noise = 10
+    odds_min = 5
+    odds_max = 95
+    # Employee
+    xp_per_level = 100  # xp needed to leave a level is level * xp_per_level
+    intern_xp_rate = 1.2
+    employee_motivation = 50  # starting motivation per role
+    intern_motivation = 40
+    developer_motivation = 50
+    manager_motivation = 60
+    hr_motivation = 70
+    break_min = 10
+    break_max = 25
+    break_stress = 5
+    # items
+    coffee_stress_divisor = 2  # coffee takes val // this off the stress
+    caffeine_crash = 120
+    crash_stress = 15
+    laptop_slow_below = 2  # level
+    laptop_stress = 5
+
+    DEFAULTS = None  # {name: value} as above, filled in below
+
+    @staticmethod
+    def params():
+        """The current set as {name: value} (the task table cells not included)."""
+        return {name: getattr(Balance, name) for name in Balance.DEFAULTS}
+
+    @staticmethod
+    def key():
+        """Changes whenever the rules do (a parameter or a task table cell), for caching tables built from them."""
+        from office_rpg.tasks import TaskTable
+
+        return TaskTable.version, tuple(Balance.params().values())
+
+    @staticmethod
+    def apply(overrides=None):
+        """Back to the defaults and a freshly loaded task table, then set overrides ({name: value}).
+
+        Values take the type of the default (12.0 is fine for an int, 12.5
+        isn't). A bad name raises a KeyError, a bad value a ValueError.
+        """
+        from office_rpg.tasks import TaskPool, TaskTable
+
+        params = dict(Balance.DEFAULTS)
+        cells = {}
+        for name, value in (overrides or {}).items():
+            if "." in name:
+                cells[name] = value
+            elif name not in Balance.DEFAULTS:
+                raise KeyError(f"unknown balance parameter {name}")
+            else:
+                params[name] = as_number(name, value, type(Balance.DEFAULTS[name]))
+        for name, value in params.items():
+            setattr(Balance, name, value)
+        TaskTable.load()
+        try:
+            for name, value in cells.items():
+                TaskTable.override(name, value)
+        except (KeyError, ValueError):
+            Balance.apply()  # not half of the overrides
+            raise
+        TaskPool.clear()  # pooled tasks keep the costs they were made with
+
+
+Balance.DEFAULTS = {
+    name: value for name, value in vars(Balance).items()
+    if not name.startswith("_") and isinstance(value, (int, float)) and not isinstance(value, bool)
+}
@@ -0,0 +1,179 @@
+import abc
+import random
+
+from office_rpg.balance import Balance
+from office_rpg.events import BreakTaken, Promotion, XpGained
+from office_rpg.items import Inventory
+from office_rpg.metrics import Metrics
+from office_rpg.system import Console
+
+
+# ==========================================
+# BASE CLASS 1: CORPORATE ENTITY
+# ==========================================
+class CorporateEntity(abc.ABC):
+    # __slots__ all the way down: no per-instance __dict__, big offices stay small
+    __slots__ = ("_name", "_stress")
+
+    def __init__(self, name):
+        self._name = name
+        self._stress = 0
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def stress(self):
+        return self._stress
+
+    @stress.setter
+    def stress(self, val):
+        if val > 100:
+            self._stress = 100
+        elif val < 0:
+            self._stress = 0
+        else:
+            self._stress = val
+
+    @abc.abstractmethod
+    def get_status(self):
+        pass
+
+    @abc.abstractmethod
+    def get_icon(self):
+        pass
+
+
+# Derived Class 1.1: Consultant
+class Consultant(CorporateEntity):
+    """External entity, doesn't have motivation, just billable hours."""
+
+    __slots__ = ("billable_hours",)
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.billable_hours = 0
+
+    def get_icon(self):
+        return "🤑"
+
+    def get_status(self):
+        return f"{self.name} (Consultant) - Hours Billed: {self.billable_hours}"
+
+    def invoice(self):
+        Console.say(f"{self.name} sends an invoice. Stress +0, Wallet +$$$")
+
+
+# Derived Class 1.2: Employee (The main player parent)
+class Employee(CorporateEntity):
+    __slots__ = ("_motivation", "_xp", "_level", "inventory", "flappy_flap_best_score")
+
+    def __init__(self, name, mot=None):
+        super().__init__(name)
+        self._motivation = Balance.employee_motivation if mot is None else mot
+        self._xp = 0
+        self._level = 1
+        self.inventory = Inventory()
+        self.flappy_flap_best_score = 0
+
+    @property
+    def motivation(self):
+        return self._motivation
+
+    @motivation.setter
+    def motivation(self, val):
+        self._motivation = max(0, min(100, val))
+
+    @property
+    def xp(self):
+        return self._xp
+
+    @property
+    def level(self):
+        return self._level
+
+    def get_icon(self):
+        return "😐"
+
+    def get_status(self):
+        s_bar = "#" * (self.stress // 10)
+        m_bar = "#" * (self.motivation // 10)
+        return (
+            f"--- {self.get_icon()} {self.name} ({self.__class__.__name__}) ---\n"
+            f"LVL: {self.level} | XP: {self.xp}\n"
+            f"Stress:     [{s_bar:<10}] {self.stress}\n"
+            f"Motivation: [{m_bar:<10}] {self.motivation}"
+        )
+
+    def add_xp(self, amount):
+        self._xp += amount
+        Console.emit(XpGained(self.name, amount))
+        if self._xp >= self._level * Balance.xp_per_level:
+            self._level += 1
+            self._xp = 0
+            self.motivation = 100
+            self.stress = 0
+            Console.emit(Promotion(self.name, self._level))
+            if Metrics.enabled:
+                Metrics.inc("promotions_total", role=type(self).__name__, level=self._level)
+
+    def modify_motivation(self, modifier):
+        self.motivation += modifier
+
+    def modify_stress(self, modifier):
+        self.stress += modifier
+    
+    def take_break(self, rng=random):
+        rec = rng.randint(Balance.break_min, Balance.break_max)
+        self.motivation += rec
+        self.stress -= Balance.break_stress
+        Console.emit(BreakTaken(self.name, rec, -Balance.break_stress))
+
+    def use_item(self, handle):
+        """Use up one item of an inventory stack (handle from Inventory)."""
+        self.inventory.take(handle).apply(self)
+
+
+# Further Derived Classes (Grandchildren of CorporateEntity)
+class Intern(Employee):
+    __slots__ = ()
+
+    def __init__(self, name):
+        super().__init__(name, mot=Balance.intern_motivation)
+
+    def get_icon(self):
+        return "👶"
+
+    def add_xp(self, amount):
+        super().add_xp(int(amount * Balance.intern_xp_rate))
+
+
+class Manager(Employee):
+    __slots__ = ()
+
+    def __init__(self, name):
+        super().__init__(name, mot=Balance.manager_motivation)
+
+    def get_icon(self):
+        return "📅"
+
+
+class Developer(Employee):
+    __slots__ = ()
+
+    def __init__(self, name):
+        super().__init__(name, mot=Balance.developer_motivation)
+
+    def get_icon(self):
+        return "💻"
+
+
+class HR(Employee):
+    __slots__ = ()
+
+    def __init__(self, name):
+        super().__init__(name, mot=Balance.hr_motivation)
+
+    def get_icon(self):
+        return "📋"
@@ -0,0 +1,305 @@
+import json
+import sys
+import time
+
+
+# ==========================================
+# EVENTS
+# ==========================================
+# What the game logic says happened, as data: Console.emit(event) hands it to
+# the current sink, and only the sink turns it into text, sleeps, JSON or
+# nothing at all. Fields are plain values (names, numbers) so every event can
+# be logged as is.
+
+class Event:
+    __slots__ = ()
+
+    def text(self):
+        raise NotImplementedError
+
+    def fields(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Message(Event):
+    """Free text (Console.say)."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message):
+        self.message = message
+
+    def text(self):
+        return self.message
+
+
+class Pause(Event):
+    """A dramatic pause (Console.pause), a sleep on a terminal."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def text(self):
+        return ""
+
+
+class TaskStarted(Event):
+    __slots__ = ("task", "diff")
+
+    def __init__(self, task, diff):
+        self.task = task
+        self.diff = diff
+
+    def text(self):
+        return f"\nDoing: {self.task} (Diff: {self.diff})..."
+
+
+class TaskFinished(Event):
+    __slots__ = ("task", "success", "message")
+
+    def __init__(self, task, success, message):
+        self.task = task
+        self.success = success
+        self.message = message
+
+    def text(self):
+        return f"{'OK' if self.success else 'FAIL'}: {self.message}"
+
+
+class RoleReaction(Event):
+    """The role's own take on a task (task_table.json "say" / "disaster")."""
+
+    __slots__ = ("task", "role", "message", "disaster")
+
+    def __init__(self, task, role, message, disaster=False):
+        self.task = task
+        self.role = role
+        self.message = message
+        self.disaster = disaster
+
+    def text(self):
+        return self.message
+
+
+class XpGained(Event):
+    __slots__ = ("employee", "amount")
+
+    def __init__(self, employee, amount):
+        self.employee = employee
+        self.amount = amount
+
+    def text(self):
+        return f"   > got {self.amount} xp"
+
+
+class Promotion(Event):
+    __slots__ = ("employee", "level")
+
+    def __init__(self, employee, level):
+        self.employee = employee
+        self.level = level
+
+    def text(self):
+        return f"\n!!! PROMOTION !!! {self.employee} is now lvl {self.level}"
+
+
+class BreakTaken(Event):
+    __slots__ = ("employee", "motivation", "stress")
+
+    def __init__(self, employee, motivation, stress):
+        self.employee = employee
+        self.motivation = motivation
+        self.stress = stress
+
+    def text(self):
+        return f"\n{self.employee} is scrolling tiktok... mot +{self.motivation}, stress {self.stress}"
+
+
+class CoffeeDrunk(Event):
+    __slots__ = ("employee", "item", "crash")
+
+    def __init__(self, employee, item, crash=False):
+        self.employee = employee
+        self.item = item
+        self.crash = crash
+
+    def text(self):
+        if self.crash:
+            return "Too much caffeine -> crash imminent"
+        return f"\nDrinking {self.item}..."
+
+
+class LaptopOpened(Event):
+    __slots__ = ("employee", "item", "slow")
+
+    def __init__(self, employee, item, slow=False):
+        self.employee = employee
+        self.item = item
+        self.slow = slow
+
+    def text(self):
+        if self.slow:
+            return "...but it's really slow."
+        return f"\n{self.employee} opens the {self.item}. It works... mostly."
+
+
+class FlappyGameOver(Event):
+    """The Flappy Flap end screen, rank is None without a leaderboard."""
+
+    __slots__ = ("employee", "score", "seed", "rank", "players", "percentile")
+
+    def __init__(self, employee, score, seed, rank=None, players=None, percentile=None):
+        self.employee = employee
+        self.score = score
+        self.seed = seed
+        self.rank = rank
+        self.players = players
+        self.percentile = percentile
+
+    def text(self):
+        lines = [
+            "***********************************",
+            "             GAME OVER             ",
+            f"           Score final: {self.score}        ",
+        ]
+        if self.rank is not None:
+            lines.append(f"     Global rank: #{self.rank} of {self.players} ({self.percentile:.0f}th percentile)")
+        lines.append(f"     Level seed: {self.seed}")
+        lines.append("***********************************")
+        return "\n".join(lines)
+
+
+class FlappyReward(Event):
+    """How the game made the player feel, outcome is one of TEXTS."""
+
+    __slots__ = ("employee", "outcome", "motivation", "stress")
+    TEXTS = {
+        "best": "\nHigh new best score made {employee} proud of himself! motivation +{motivation}, stress {stress}",
+        "high": "\nHigh score made {employee} happy! motivation +{motivation}, stress {stress}",
+        "big": '\n"Wow! The bigger area levels are so fun!" motivation +{motivation}, stress {stress}',
+        "lag": '\n"RAHHHH, the game is lagging!!" motivation +{motivation}, stress {stress}',
+    }
+
+    def __init__(self, employee, outcome, motivation, stress):
+        self.employee = employee
+        self.outcome = outcome
+        self.motivation = motivation
+        self.stress = stress
+
+    def text(self):
+        return FlappyReward.TEXTS[self.outcome].format(**self.fields())
+
+
+class GameSaved(Event):
+    __slots__ = ("employee",)
+
+    def __init__(self, employee):
+        self.employee = employee
+
+    def text(self):
+        return "\n>> Game saved. don't forget to push to git."
+
+
+class SaveFailed(Event):
+    """Save store I/O that gave up, op is one of TEXTS, target the player or file it was about."""
+
+    __slots__ = ("op", "target", "error")
+    TEXTS = {
+        "save": "err saving: {error}",
+        "load": ">> could not load {target}: {error}",
+        "list": ">> could not read {target}: {error}",
+        "leaderboard": ">> could not update the leaderboard: {error}",
+        "import": ">> could not import {target}: {error}",
+    }
+
+    def __init__(self, op, target, error):
+        self.op = op
+        self.target = target
+        self.error = str(error)
+
+    def text(self):
+        return SaveFailed.TEXTS[self.op].format(**self.fields())
+
+
+# ==========================================
+# SINKS
+# ==========================================
+# A sink has emit(event) and flush(). Console.sink = None prints and sleeps
+# line by line as events come in.
+
+class NullSink:
+    """Drops everything (headless runs)."""
+
+    def emit(self, event):
+        pass
+
+    def flush(self):
+        pass
+
+
+class BufferedConsoleSink:
+    """Collects a turn's output, flush() writes it in one go.
+
+    Pauses split the text: each part is one write, with the pause slept in
+    between (times time_scale, 0 skips them).
+    """
+
+    def __init__(self, stream=None, time_scale=1.0):
+        self.stream = stream
+        self.time_scale = time_scale
+        self.parts = [[]]  # lines, then [pause seconds, lines...] per pause
+
+    def emit(self, event):
+        if type(event) is Pause:
+            self.parts.append([event.seconds])
+        else:
+            self.parts[-1].append(event.text())
+
+    def flush(self):
+        parts, self.parts = self.parts, [[]]
+        stream = self.stream or sys.stdout
+        for i, part in enumerate(parts):
+            if i:
+                stream.flush()
+                if self.time_scale:
+                    time.sleep(part[0] * self.time_scale)
+                part = part[1:]
+            if part:
+                stream.write("\n".join(part) + "\n")
+        stream.flush()
+
+
+class LogSink:
+    """One JSON object per event ({"t", "event", fields...}), written on flush()."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.lines = []
+
+    def emit(self, event):
+        record = {"t": round(time.time(), 6), "event": type(event).__name__}
+        record.update(event.fields())
+        self.lines.append(json.dumps(record))
+
+    def flush(self):
+        if self.lines:
+            self.stream.write("\n".join(self.lines) + "\n")
+            self.lines = []
+            self.stream.flush()
+
+
+class FanOut:
+    """Every event to several sinks (say the terminal and a log)."""
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    def emit(self, event):
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
@@ -0,0 +1,231 @@
+import os
+import random
+import sys
+import time
+
+from office_rpg import registry
+from office_rpg import journal as jr
+from office_rpg.entities import Intern, Developer, Manager, HR
+from office_rpg.events import BufferedConsoleSink, FanOut, LogSink
+from office_rpg.items import Coffee, Laptop
+from office_rpg.metrics import Metrics
+from office_rpg.saves import restore_player
+from office_rpg.system import Console, SystemAdmin
+from office_rpg.tasks import get_random_task
+
+
+# ==========================================
+# MAIN ENTRY POINT
+# ==========================================
+def main(argv=None):
+    import argparse  # not on the import path, see benchmarks/bench_startup.py
+
+    parser = argparse.ArgumentParser(description="Office RPG simulator")
+    parser.add_argument("--profile", choices=["cprofile", "sample"],
+                        help="profile the session, also prints a frame budget report after each Flappy Flap game")
+    parser.add_argument("--profile-out", default="profile.folded",
+                        help="collapsed stacks for flamegraph.pl / speedscope (cprofile also writes a .prof next to it)")
+    parser.add_argument("--sample-interval", type=float, default=5.0, help="ms between samples (--profile sample)")
+    parser.add_argument("--flappy-seed", type=int, help="play this Flappy Flap level every time (the end screen shows a game's seed)")
+    parser.add_argument("--flappy-thread", action="store_true", help="generate Flappy Flap levels on a background thread")
+    parser.add_argument("--event-log", help="also append every game event to this file, one JSON object per line")
+    args = parser.parse_args(argv)
+
+    # a turn's output is written in one go when the turn ends (Console.flush)
+    Console.sink = BufferedConsoleSink()
+    event_log = None
+    if args.event_log:
+        event_log = open(args.event_log, "a")
+        Console.sink = FanOut(Console.sink, LogSink(event_log))
+
+    # OFFICE_RPG_METRICS=metrics.prom (or .json) turns metrics on, the file is
+    # written on exit and on SIGUSR1
+    metrics_path = os.environ.get("OFFICE_RPG_METRICS")
+    if metrics_path:
+        Metrics.enabled = True
+        Metrics.dump_on_signal(metrics_path)
+
+    if args.flappy_seed is not None or args.flappy_thread:
+        flappy_flap = registry.minigame("flappy_flap")
+        flappy_flap.level_seed = args.flappy_seed
+        flappy_flap.level_thread = args.flappy_thread
+
+    profiler = None
+    if args.profile:
+        from office_rpg import profiling
+        registry.minigame("flappy_flap").profile_frames = True
+        profiler = profiling.start(args.profile, args.sample_interval / 1000)
+    try:
+        play()
+    finally:
+        Console.flush()
+        Console.sink = None
+        if event_log is not None:
+            event_log.close()
+        if metrics_path:
+            Metrics.write(metrics_path)
+        if profiler is not None:
+            profiler.stop()
+            profiling.write_collapsed(profiler.collapsed(), args.profile_out)
+            if args.profile == "cprofile":
+                profiler.dump(os.path.splitext(args.profile_out)[0] + ".prof")
+            print(profiler.summary())
+            print(f">> Profile written to {args.profile_out}")
+
+
+def play():
+    SystemAdmin.cls()
+    print("--- OFFICE RPG SIMULATOR ---")
+
+    player = None
+    journal = None
+    # every draw goes through here so the journal can replay the session
+    rng = jr.RecordingRandom(random)
+
+    # Auto-load check (Requirement 14)
+    saves = SystemAdmin.list_saves()
+    Console.flush()  # a failed read says so before the menu
+    if saves:
+        print("\n[System]: Found previous save files!")
+        for i, (name, role, level) in enumerate(saves):
+            print(f"{i+1}. {name} ({role}, lvl {level})")
+        print("Resume which one? (number, N to load another save by name, anything else for a new game)")
+        choice = input("> ").strip()  # input validation: only listed numbers load
+        if choice.isdigit() and 1 <= int(choice) <= len(saves):
+            game_file = SystemAdmin.load_game(saves[int(choice) - 1][0])
+            Console.flush()
+        elif choice.lower() == "n":
+            # only the most recent saves are listed, older ones are still in the store
+            name = input("Name: ").strip()
+            game_file = SystemAdmin.load_game(name) if name else None
+            Console.flush()
+            if name and game_file is None:
+                print(f">> No save for {name}.")
+        else:
+            game_file = None
+        if game_file:
+            player = restore_player(game_file)
+            journal = SystemAdmin.open_journal(player.name)
+            recovered = journal.recover()
+            if recovered is not None:
+                player = recovered
+                print(">> The last session didn't end cleanly, restored it from the journal.")
+            print(">> Loaded.")
+            time.sleep(1)
+        else:
+            print(">> Starting fresh.")
+
+    loaded_name = player.name if player else None
+
+    if player is None:
+        while True:
+            print("\n1. New Game\n2. Quit")
+            choice = input("> ")  # Input validation: checks specific chars below
+
+            if choice == "1":
+                player_name = input("Name: ")
+                print("1.Intern 2.Dev 3.Manager 4.HR")
+                role = input("Role: ")
+                # Input validation: fallback else for invalid roles
+                if role == "1":
+                    player = Intern(player_name)
+                elif role == "2":
+                    player = Developer(player_name)
+                elif role == "3":
+                    player = Manager(player_name)
+                elif role == "4":
+                    player = HR(player_name)
+                else:
+                    player = Intern(player_name)
+
+                player.inventory.add(Coffee("Instant Coffee", 10))
+                # Add laptop to show off new class
+                if random.random() > 0.5:
+                    player.inventory.add(Laptop("Dell Latitude"))
+                break
+            elif choice == "2":
+                sys.exit()
+
+    if journal is None:
+        journal = SystemAdmin.open_journal(player.name)
+    journal.snapshot(player)
+
+    # Main Game Loop
+    while True:
+        Console.flush()  # what the last turn did
+        print("\n" + "=" * 20)
+        print(player.get_status())
+        print("=" * 20)
+
+        if player.stress >= 100:
+            print("\nBURNOUT. Game Over.")
+            journal.record(jr.QUIT, player)
+            break
+
+        print("\n1. Work\n2. Break\n3. Items\n4. Save/Quit")
+        act = input(">> ")
+
+        if act == "1":
+            t = get_random_task(rng)
+            if player.motivation < t.mot_cost:
+                print("Too tired to work.")
+            else:
+                t.do_task(player, rng)
+            journal.record(jr.WORK, player, rng, jr.task_index(t), t.diff)
+
+        elif act == "2":
+            print("\n1. Doom Scrolling \n2. Flappy Flap\n3. Back")
+            action = input(">> ")
+            
+            if action == "1":
+                player.take_break(rng)
+                journal.record(jr.BREAK, player, rng)
+            elif action == "2":
+                flappy_flap = registry.minigame("flappy_flap")  # imported on first play
+                player.flappy_flap_best_score = flappy_flap.play(player, player.flappy_flap_best_score, rng)
+                journal.record(jr.FLAPPY, player, rng, player.flappy_flap_best_score, flappy_flap.last_score + 1)
+                
+            # else, be it 3 or ztherz453, the program goes back
+
+        elif act == "3":
+            if not player.inventory:
+                print("No items.")
+            else:
+                listing = player.inventory.listing()
+                for i, (_, text) in enumerate(listing):
+                    print(f"{i+1}. {text}")
+                print("Type 'C' to combine top 2 items ('C 5' crafts 5 at once)")
+                item_choice = input("Choice: ").upper()
+                craft, _, times = item_choice.partition(" ")
+
+                # Input validation for items
+                if item_choice.isdigit():
+                    idx = int(item_choice) - 1
+                    if 0 <= idx < len(listing):
+                        player.use_item(listing[idx][0])
+                        journal.record(jr.USE_ITEM, player, a=idx)
+                elif craft == "C" and (not times or times.strip().isdigit()) and len(player.inventory) >= 2:
+                    # Operator overloading usage (Item.__add__ makes the bundle)
+                    _, made = player.inventory.combine_first(max(1, int(times or 1)))
+                    print("Crafted bundle!" if made == 1 else f"Crafted {made} bundles!")
+                    journal.record(jr.COMBINE, player, a=made)
+
+        elif act == "4":
+            # one slot per name, only ask when this would overwrite somebody else's save
+            if loaded_name != player.name and SystemAdmin.has_save(player.name):
+                print(f"There is already a save for {player.name}, do you want to override it? (y/n)")
+                choice = input("> ").lower().strip()  # input validation for string
+                if choice != "y":
+                    print(">>> Game closed.")
+                    journal.record(jr.QUIT, player)
+                    break
+            SystemAdmin.save_game(player)
+            journal.record(jr.SAVE, player)
+            journal.record(jr.QUIT, player)
+            break
+
+    journal.close()
+
+
+if __name__ == "__main__":
+    main()
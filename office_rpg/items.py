@@ -0,0 +1,200 @@
+import itertools
+
+from office_rpg.balance import Balance
+from office_rpg.events import CoffeeDrunk, LaptopOpened
+from office_rpg.system import Console
+
+
+# ==========================================
+# BASE CLASS 3: ITEM
+# ==========================================
+class Item:
+    __slots__ = ("name", "val")
+
+    def __init__(self, name, val):
+        self.name = name
+        self.val = val
+
+    def apply(self, emp):
+        pass
+
+    def key(self):
+        """Items with the same key are interchangeable and share an Inventory stack."""
+        return (type(self).__name__, self.name, self.val)
+
+    def parts(self):
+        """((key, count), ...) of the plain items this is made of."""
+        return ((self.key(), 1),)
+
+    # Operator Overloading (Polymorphism requirement)
+    def __add__(self, other):
+        if isinstance(other, Item):
+            parts = dict(self.parts())
+            for key, count in other.parts():
+                parts[key] = parts.get(key, 0) + count
+            return Bundle(tuple(sorted(parts.items())), self.val + other.val)
+        return None
+
+    def __str__(self):
+        return f"{self.name} (+{self.val})"
+
+
+# Derived Class 3.1: Coffee
+class Coffee(Item):
+    __slots__ = ()
+
+    def __init__(self, name="Espresso", val=20):
+        super().__init__(name, val)
+
+    def apply(self, emp):
+        Console.emit(CoffeeDrunk(emp.name, self.name))
+        emp.motivation += self.val
+        emp.stress -= self.val // Balance.coffee_stress_divisor
+        if emp.motivation > Balance.caffeine_crash:
+            Console.emit(CoffeeDrunk(emp.name, self.name, crash=True))
+            emp.stress += Balance.crash_stress
+
+
+# Derived Class 3.1.1: Bundle (what crafting makes)
+class Bundle(Coffee):
+    """Drinks like a Coffee worth everything in it.
+
+    What's in it is a multiset of plain items, not a name: a bundle of bundles
+    merges their parts, so a long craft chain stays as big as the number of
+    different items in it and the name lists only the first few.
+    """
+
+    __slots__ = ("_parts",)
+    NAMED_PARTS = 3
+
+    def __init__(self, parts, val):
+        self._parts = parts
+        shown = [f"{name} x{count}" if count > 1 else name for (_, name, _), count in parts[:Bundle.NAMED_PARTS]]
+        if len(parts) > Bundle.NAMED_PARTS:
+            shown.append(f"{len(parts) - Bundle.NAMED_PARTS} more")
+        super().__init__(f"Bundle ({' + '.join(shown)})", val)
+
+    def key(self):
+        return ("Bundle", self._parts, self.val)
+
+    def parts(self):
+        return self._parts
+
+
+# Derived Class 3.2: Laptop (Fixes inheritance rule)
+class Laptop(Item):
+    __slots__ = ()
+
+    def __init__(self, name="Company Laptop"):
+        super().__init__(name, 0)  # No stat boost, just a tool
+
+    def apply(self, emp):
+        Console.emit(LaptopOpened(emp.name, self.name))
+        if emp.level < Balance.laptop_slow_below:
+            Console.emit(LaptopOpened(emp.name, self.name, slow=True))
+            emp.stress += Balance.laptop_stress
+
+
+# ==========================================
+# INVENTORY
+# ==========================================
+class Inventory:
+    """Stacks of identical items, in the order they were first added.
+
+    A handle names one stack for as long as it has items in it. Using or
+    removing by handle is a dict lookup, and adding an item that already has a
+    stack only bumps its count.
+    """
+
+    __slots__ = ("_stacks", "_handles", "_next", "_size")
+
+    def __init__(self, items=()):
+        self._stacks = {}  # handle -> [item, count]
+        self._handles = {}  # item key -> handle
+        self._next = 0
+        self._size = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """(handle, item, count) per stack."""
+        for handle, (item, count) in self._stacks.items():
+            yield handle, item, count
+
+    def __contains__(self, handle):
+        return handle in self._stacks
+
+    def add(self, item, count=1):
+        """Put count of item in, returns the handle of its stack."""
+        key = item.key()
+        handle = self._handles.get(key)
+        if handle is None:
+            handle = self._handles[key] = self._next
+            self._next += 1
+            self._stacks[handle] = [item, 0]
+        self._stacks[handle][1] += count
+        self._size += count
+        return handle
+
+    def take(self, handle, count=1):
+        """Remove count items from a stack, returns the item."""
+        stack = self._stacks[handle]
+        if stack[1] < count:
+            raise ValueError(f"only {stack[1]} of {stack[0].name} left")
+        stack[1] -= count
+        self._size -= count
+        if not stack[1]:
+            del self._stacks[handle]
+            del self._handles[stack[0].key()]
+        return stack[0]
+
+    def item(self, handle):
+        return self._stacks[handle][0]
+
+    def count(self, handle):
+        return self._stacks[handle][1] if handle in self._stacks else 0
+
+    def first(self):
+        """Handle of the first stack, or None when empty."""
+        return next(iter(self._stacks), None)
+
+    def handle_at(self, index):
+        """Handle of the index-th stack, as listed (O(index), for menus and journals)."""
+        return next(itertools.islice(self._stacks, index, None))
+
+    def listing(self):
+        """[(handle, text)] in menu order."""
+        return [(h, f"{item} x{count}" if count > 1 else str(item)) for h, item, count in self]
+
+    def craft(self, a, b, times=1):
+        """Bundle one item of stack a with one of stack b, times over. Returns the bundles' handle.
+
+        Same inputs make the same bundle, so it's built once whatever times is.
+        """
+        need = {a: times, b: times} if a != b else {a: 2 * times}
+        for handle, n in need.items():
+            if self.count(handle) < n:
+                raise ValueError(f"not enough {self.item(handle).name if handle in self else 'items'} for {times}")
+        bundle = self.item(a) + self.item(b)
+        for handle, n in need.items():
+            self.take(handle, n)
+        return self.add(bundle, times)
+
+    def combine_first(self, times=1):
+        """The menu's combine: bundle the first two items (times over, as far as they go).
+
+        Returns (handle, bundles made), (None, 0) with fewer than two items.
+        """
+        if self._size < 2:
+            return None, 0
+        a = self.first()
+        if self._stacks[a][1] >= 2:
+            b = a
+            times = min(times, self._stacks[a][1] // 2)
+        else:
+            b = self.handle_at(1)
+            times = 1  # the first stack only had the one
+        return self.craft(a, b, times), times
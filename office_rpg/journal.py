@@ -0,0 +1,261 @@
+import json
+import os
+import struct
+
+from office_rpg import registry
+from office_rpg.saves import snapshot, load_inventory, restore_player
+from office_rpg.system import Console
+from office_rpg.tasks import get_random_task
+
+
+# ==========================================
+# ACTION JOURNAL
+# ==========================================
+# Every menu action is appended to a per-player file together with the values
+# the rng handed out while it ran. Replaying the file feeds those values back
+# through the same Task.do_task / Employee code, so the session comes out bit
+# for bit identical. Snapshots of the player are written every few hundred
+# actions, and compact() drops everything before the latest one.
+#
+# On disk each record is a u16 length followed by the payload. The payload
+# starts with the record kind. Actions then carry two ints (a, b) and the
+# draws. The draw types are stored as struct codes ("h" for ints, "d" for
+# floats) so a record unpacks with one struct call. Snapshots carry JSON.
+
+WORK, BREAK, FLAPPY, USE_ITEM, COMBINE, SAVE, QUIT, SNAPSHOT = range(1, 9)
+
+ACTION_HEADER = struct.Struct("<BiiB")
+LENGTH = struct.Struct("<H")
+
+# draw layouts seen so far, b"hhhhh" -> Struct("<hhhhh")
+_draw_structs = {}
+
+
+def _draw_struct(codes):
+    s = _draw_structs.get(codes)
+    if s is None:
+        s = _draw_structs[codes] = struct.Struct("<" + codes.decode("ascii"))
+    return s
+
+
+class RecordingRandom:
+    """Passes calls through to rng and remembers every value it returns."""
+
+    __slots__ = ("rng", "draws")
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.draws = []
+
+    def random(self):
+        v = self.rng.random()
+        self.draws.append(v)
+        return v
+
+    def randint(self, a, b):
+        v = self.rng.randint(a, b)
+        self.draws.append(v)
+        return v
+
+    def choice(self, seq):
+        v = self.rng.choice(seq)
+        self.draws.append(seq.index(v))
+        return v
+
+
+class ReplayRandom:
+    """Hands out the draws of one recorded action, in order."""
+
+    __slots__ = ("_draws",)
+
+    def __init__(self, draws=()):
+        self._draws = iter(draws)
+
+    def load(self, draws):
+        self._draws = iter(draws)
+
+    def random(self):
+        return next(self._draws)
+
+    def randint(self, a, b):
+        return next(self._draws)
+
+    def choice(self, seq):
+        return seq[next(self._draws)]
+
+
+def encode_action(kind, a, b, draws):
+    codes = "".join("d" if type(v) is float else "h" for v in draws).encode("ascii")
+    return ACTION_HEADER.pack(kind, a, b, len(draws)) + codes + _draw_struct(codes).pack(*draws)
+
+
+def encode_snapshot(player):
+    state = snapshot(player)
+    state["name"] = player.name
+    return bytes([SNAPSHOT]) + json.dumps(state).encode("utf-8")
+
+
+def read_records(path):
+    """Yield (kind, a, b, draws) for actions and (SNAPSHOT, state, None, None).
+
+    A record cut short by a crash ends the journal there.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 0
+    end = len(data)
+    header_size = ACTION_HEADER.size
+    unpack_header = ACTION_HEADER.unpack_from
+    structs = _draw_structs
+    while pos + 2 <= end:
+        (size,) = LENGTH.unpack_from(data, pos)
+        start = pos + 2
+        pos = start + size
+        if pos > end:
+            break
+        if data[start] == SNAPSHOT:
+            state = json.loads(data[start + 1:pos])
+            state["inventory"] = load_inventory(state["inventory"])
+            yield SNAPSHOT, state, None, None
+            continue
+        kind, a, b, n = unpack_header(data, start)
+        codes_at = start + header_size
+        codes = data[codes_at:codes_at + n]
+        draws = structs.get(codes) or _draw_struct(codes)
+        yield kind, a, b, draws.unpack_from(data, codes_at + n)
+
+
+def apply_action(player, kind, a, b, rng):
+    """One menu action, exactly as main() runs it (minus the prints)."""
+    if kind == WORK:
+        # pooled: same draws as main()'s fresh task, the name is never looked at
+        t = get_random_task(rng, pooled=True)
+        if player.motivation >= t.mot_cost:
+            t.do_task(player, rng)
+    elif kind == BREAK:
+        player.take_break(rng)
+    elif kind == FLAPPY:
+        # real-time game, only its outcome is recorded: a is the best score,
+        # b the game's score + 1 (0 in journals from before the reward was recorded)
+        if b:
+            registry.minigame("flappy_flap").reward(player, b - 1, a, rng)
+        player.flappy_flap_best_score = a
+    elif kind == USE_ITEM:
+        player.use_item(player.inventory.handle_at(a))
+    elif kind == COMBINE:
+        # a: bundles made (0 in journals from before bulk crafting)
+        player.inventory.combine_first(max(1, a))
+
+
+def replay(path):
+    """Rebuild the player at the end of a journal.
+
+    Returns (player, actions replayed, kind of the last record).
+    """
+    player = None
+    count = 0
+    last = None
+    rng = ReplayRandom()
+    was_quiet = Console.quiet
+    Console.quiet = True
+    try:
+        for kind, a, b, draws in read_records(path):
+            last = kind
+            if kind == SNAPSHOT:
+                player = restore_player(a)
+                continue
+            rng.load(draws)
+            apply_action(player, kind, a, b, rng)
+            count += 1
+    finally:
+        Console.quiet = was_quiet
+    return player, count, last
+
+
+class Journal:
+    snapshot_every = 500
+    # compact on open once the file gets this big
+    max_bytes = 1 << 20
+
+    def __init__(self, path):
+        self.path = path
+        self._since_snapshot = 0
+        self._truncate_partial_tail()
+        if os.path.exists(path) and os.path.getsize(path) > self.max_bytes:
+            self.compact()
+        self.f = open(path, "ab")
+
+    def _truncate_partial_tail(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r+b") as f:
+            data = f.read()
+            pos = 0
+            while pos + 2 <= len(data):
+                (size,) = LENGTH.unpack_from(data, pos)
+                if pos + 2 + size > len(data):
+                    break
+                pos += 2 + size
+            if pos != len(data):
+                f.truncate(pos)
+
+    def _write(self, payload):
+        self.f.write(LENGTH.pack(len(payload)) + payload)
+        self.f.flush()
+
+    def snapshot(self, player):
+        self._write(encode_snapshot(player))
+        self._since_snapshot = 0
+
+    def record(self, kind, player, rng=None, a=0, b=0):
+        """Append one action, with the draws rng (a RecordingRandom) collected."""
+        draws = ()
+        if rng is not None:
+            draws = rng.draws
+            rng.draws = []
+        self._write(encode_action(kind, a, b, draws))
+        if kind in (SAVE, QUIT):
+            os.fsync(self.f.fileno())
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot(player)
+
+    def recover(self):
+        """The player of a session that crashed, or None if it ended cleanly."""
+        self.f.flush()
+        if os.path.getsize(self.path) == 0:
+            return None
+        player, count, last = replay(self.path)
+        if last == QUIT:
+            return None
+        return player
+
+    def compact(self):
+        """Rewrite the journal starting at its latest snapshot."""
+        with open(self.path, "rb") as f:
+            data = f.read()
+        pos = 0
+        keep = None
+        while pos + 2 <= len(data):
+            (size,) = LENGTH.unpack_from(data, pos)
+            if data[pos + 2] == SNAPSHOT:
+                keep = pos
+            pos += 2 + size
+        if not keep:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data[keep:pos])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        if hasattr(self, "f"):
+            self.f.close()
+            self.f = open(self.path, "ab")
+
+    def close(self):
+        self.f.close()
+
+
+def task_index(task):
+    return registry.task_types().index(type(task))
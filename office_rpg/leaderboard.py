@@ -0,0 +1,192 @@
+import time
+
+
+# ==========================================
+# LEADERBOARD
+# ==========================================
+# Every player's best Flappy Flap score, role and level, in the same SQLite
+# file as the saves. The (score, updated) index is the sorted on-disk index,
+# so updating a score and reading the top k are O(log n) B-tree walks.
+#
+# SQLite can't count the rows above a score without scanning them, which is
+# O(rank). So the number of players per score is also kept in score_counts,
+# in the same transaction as the score itself. In memory it sits in a Fenwick
+# tree (ScoreCounts), where a rank or percentile costs O(log max score)
+# however many players there are. Loading that only reads one row per
+# distinct score, not one per player.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leaderboard (
+    name TEXT PRIMARY KEY,
+    score INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS leaderboard_score ON leaderboard (score DESC, updated);
+CREATE TABLE IF NOT EXISTS score_counts (
+    score INTEGER PRIMARY KEY,
+    players INTEGER NOT NULL
+);
+"""
+
+
+class ScoreCounts:
+    """Players per score, with the prefix sums in a Fenwick (binary indexed) tree."""
+
+    def __init__(self, size=1024):
+        self.players = [0] * size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+
+    def add(self, score, delta):
+        if score >= len(self.players):
+            # double until it fits and rebuild, O(size) but only log(max score) times
+            players = self.players + [0] * (max(score + 1, 2 * len(self.players)) - len(self.players))
+            self.__init__(len(players))
+            for s, n in enumerate(players):
+                if n:
+                    self.add(s, n)
+        self.players[score] += delta
+        self.total += delta
+        tree = self.tree
+        size = len(self.players)
+        i = score + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def at_most(self, score):
+        """Players with a score <= score."""
+        tree = self.tree
+        i = min(score + 1, len(self.players))
+        n = 0
+        while i > 0:
+            n += tree[i]
+            i -= i & -i
+        return n
+
+    def above(self, score):
+        return self.total - self.at_most(score)
+
+
+class Leaderboard:
+    def __init__(self, path):
+        import sqlite3  # deferred like SaveStore
+
+        self.path = path
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        # the tables and their first import commit together: an import that fails
+        # leaves no half-built leaderboard behind, and runs again next time
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            new = self.db.execute("SELECT 1 FROM sqlite_master WHERE name = 'leaderboard'").fetchone() is None
+            for statement in SCHEMA.split(";"):
+                if statement.strip():
+                    self.db.execute(statement)
+            if new:
+                self._import_saves()
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        self._version = None
+        self.scores = None
+        self._refresh()
+
+    def close(self):
+        self.db.close()
+
+    def _import_saves(self):
+        """Seed a new leaderboard with the best scores already in the save slots (inside __init__'s transaction)."""
+        if self.db.execute("SELECT 1 FROM sqlite_master WHERE name = 'saves'").fetchone() is None:
+            return
+        self.db.execute(
+            "INSERT OR IGNORE INTO leaderboard (name, score, role, level, updated) "
+            "SELECT name, flappy_flap_best_score, role, level, updated FROM saves WHERE flappy_flap_best_score > 0"
+        )
+        self.db.execute("INSERT INTO score_counts SELECT score, COUNT(*) FROM leaderboard GROUP BY score")
+
+    def _refresh(self):
+        # data_version changes when another connection (a server worker,
+        # another game) commits, only then are the counts read again
+        version = self.db.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._version:
+            return
+        self._version = version
+        rows = self.db.execute("SELECT score, players FROM score_counts").fetchall()
+        scores = ScoreCounts(max((s for s, _ in rows), default=0) + 1)
+        for score, players in rows:
+            scores.add(score, players)
+        self.scores = scores
+
+    def __len__(self):
+        self._refresh()
+        return self.scores.total
+
+    def submit(self, name, score, role, level):
+        """Record a finished game, returns the player's best score (this one or an older one)."""
+        now = time.time()
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            # other writers are locked out now, catch up with what they committed
+            self._refresh()
+            row = self.db.execute("SELECT score FROM leaderboard WHERE name = ?", (name,)).fetchone()
+            old = None if row is None else row[0]
+            if old is None:
+                self.db.execute(
+                    "INSERT INTO leaderboard (name, score, role, level, updated) VALUES (?, ?, ?, ?, ?)",
+                    (name, score, role, level, now),
+                )
+            elif score > old:
+                self.db.execute(
+                    "UPDATE leaderboard SET score = ?, role = ?, level = ?, updated = ? WHERE name = ?",
+                    (score, role, level, now, name),
+                )
+            else:
+                # keep the best score (and when it was made), the role and level move on
+                self.db.execute("UPDATE leaderboard SET role = ?, level = ? WHERE name = ?", (role, level, name))
+            best = score if old is None else max(old, score)
+            if best != old:
+                if old is not None:
+                    self.db.execute("UPDATE score_counts SET players = players - 1 WHERE score = ?", (old,))
+                self.db.execute(
+                    "INSERT INTO score_counts (score, players) VALUES (?, 1) "
+                    "ON CONFLICT (score) DO UPDATE SET players = players + 1",
+                    (best,),
+                )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        # our own commits leave data_version alone, so apply them by hand
+        if best != old:
+            if old is not None:
+                self.scores.add(old, -1)
+            self.scores.add(best, 1)
+        return best
+
+    def rank(self, score):
+        """1 + the number of players with a better score (ties share a rank)."""
+        self._refresh()
+        return self.scores.above(score) + 1
+
+    def percentile(self, score):
+        """Share of the players (in %) this score beats or ties."""
+        self._refresh()
+        if not self.scores.total:
+            return 100.0
+        return 100.0 * self.scores.at_most(score) / self.scores.total
+
+    def best(self, name):
+        """(score, role, level) of player name, or None."""
+        return self.db.execute("SELECT score, role, level FROM leaderboard WHERE name = ?", (name,)).fetchone()
+
+    def top(self, k=10):
+        """[(name, score, role, level)] of the k best, earliest first among ties."""
+        cur = self.db.execute(
+            "SELECT name, score, role, level FROM leaderboard ORDER BY score DESC, updated LIMIT ?", (k,)
+        )
+        return cur.fetchall()
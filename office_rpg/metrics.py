@@ -0,0 +1,188 @@
+import json
+import os
+import time
+
+
+# ==========================================
+# METRICS
+# ==========================================
+# Counters and latency histograms for the hot paths. Off by default: call
+# sites check Metrics.enabled before taking a timestamp, so a disabled build
+# pays one attribute lookup per hook and nothing else.
+#
+# Histograms are HDR-style: values (nanoseconds) are exact below 32 and above
+# that go into 16 linear sub-buckets per power of two, so any percentile is
+# within ~6% whatever the range, and memory is a few dozen ints per series.
+
+SUB_BITS = 4
+SUB_BUCKETS = 1 << SUB_BITS
+
+
+def bucket_index(v):
+    if v < 2 * SUB_BUCKETS:
+        return max(0, v)
+    shift = v.bit_length() - SUB_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (v >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(i):
+    """(lowest, highest) value that lands in bucket i."""
+    if i < 2 * SUB_BUCKETS:
+        return i, i
+    shift = i // SUB_BUCKETS - 1
+    top = i % SUB_BUCKETS + SUB_BUCKETS
+    return top << shift, ((top + 1) << shift) - 1
+
+
+class Histogram:
+    __slots__ = ("labels", "buckets", "count", "total", "min", "max")
+
+    def __init__(self, labels=()):
+        self.labels = labels
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, v):
+        i = bucket_index(v)
+        self.buckets[i] = self.buckets.get(i, 0) + 1
+        self.count += 1
+        self.total += v
+        if self.min is None or v < self.min:
+            self.min = v
+        if v > self.max:
+            self.max = v
+
+    def percentile(self, pct):
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * pct / 100))
+        seen = 0
+        for i in sorted(self.buckets):
+            seen += self.buckets[i]
+            if seen >= rank:
+                return min(bucket_bounds(i)[1], self.max)
+        return self.max
+
+    def cumulative(self):
+        """[(upper bound, observations <= bound)] over the non-empty buckets."""
+        out = []
+        seen = 0
+        for i in sorted(self.buckets):
+            seen += self.buckets[i]
+            out.append((bucket_bounds(i)[1], seen))
+        return out
+
+
+def _sort_key(item):
+    return tuple(str(part) for part in item[0])
+
+
+def _series(name, labels):
+    if not labels:
+        return name
+    inner = ",".join(f'{k}="{v}"' for k, v in labels)
+    return f"{name}{{{inner}}}"
+
+
+class Metrics:
+    """Process-wide counters and histograms, same static style as Console."""
+
+    enabled = False
+    counters = {}  # (name, *label values) -> [labels, number]
+    histograms = {}  # (name, *label values) -> Histogram, values in ns
+
+    # labels are keyed in call order (no sorting on the hot path), so always
+    # pass them in the same order for one metric
+    @staticmethod
+    def inc(name, amount=1, **labels):
+        key = (name, *labels.values())
+        counters = Metrics.counters
+        if key in counters:
+            counters[key][1] += amount
+        else:
+            counters[key] = [tuple(labels.items()), amount]
+
+    @staticmethod
+    def observe_ns(name, ns, **labels):
+        key = (name, *labels.values())
+        h = Metrics.histograms.get(key)
+        if h is None:
+            h = Metrics.histograms[key] = Histogram(tuple(labels.items()))
+        h.record(ns)
+
+    @staticmethod
+    def since(name, start_ns, **labels):
+        """observe_ns of the time elapsed since start_ns (a time.perf_counter_ns())."""
+        Metrics.observe_ns(name, time.perf_counter_ns() - start_ns, **labels)
+
+    @staticmethod
+    def reset():
+        Metrics.counters = {}
+        Metrics.histograms = {}
+
+    @staticmethod
+    def prometheus():
+        """Prometheus text exposition format, histograms in seconds."""
+        lines = []
+        typed = set()
+        for (name, *_), (labels, value) in sorted(Metrics.counters.items(), key=_sort_key):
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{_series(name, labels)} {value}")
+        for (name, *_), h in sorted(Metrics.histograms.items(), key=_sort_key):
+            labels = h.labels
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            for bound, seen in h.cumulative():
+                le = labels + (("le", f"{bound / 1e9:.9g}"),)
+                lines.append(f"{_series(name + '_bucket', le)} {seen}")
+            lines.append(f"{_series(name + '_bucket', labels + (('le', '+Inf'),))} {h.count}")
+            lines.append(f"{_series(name + '_sum', labels)} {h.total / 1e9:.9g}")
+            lines.append(f"{_series(name + '_count', labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def snapshot():
+        """Plain dict of everything recorded so far (histograms summarized, in us)."""
+        hists = {}
+        for (name, *_), h in sorted(Metrics.histograms.items(), key=_sort_key):
+            hists[_series(name, h.labels)] = {
+                "count": h.count,
+                "mean_us": h.total / h.count / 1000 if h.count else 0,
+                "min_us": (h.min or 0) / 1000,
+                "p50_us": h.percentile(50) / 1000,
+                "p90_us": h.percentile(90) / 1000,
+                "p99_us": h.percentile(99) / 1000,
+                "p999_us": h.percentile(99.9) / 1000,
+                "max_us": h.max / 1000,
+            }
+        return {
+            "time": time.time(),
+            "counters": {_series(k[0], l): v for k, (l, v) in sorted(Metrics.counters.items(), key=_sort_key)},
+            "histograms": hists,
+        }
+
+    @staticmethod
+    def write(path):
+        """Dump to path, Prometheus text unless it ends in .json. Atomic (temp file + rename)."""
+        if path.endswith(".json"):
+            text = json.dumps(Metrics.snapshot(), indent=2)
+        else:
+            text = Metrics.prometheus()
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def dump_on_signal(path):
+        """Write to path whenever the process gets SIGUSR1 (POSIX only)."""
+        import signal
+
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: Metrics.write(path))
@@ -0,0 +1,3 @@
+class Minigame():
+    def play():
+        return None
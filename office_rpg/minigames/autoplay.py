@@ -0,0 +1,84 @@
+from office_rpg.minigames.flappy import Flappy_flap, FlappyBoard
+from office_rpg.terminal import SimulatedClock
+
+
+# ==========================================
+# FLAPPY FLAP AUTOPLAYER
+# ==========================================
+# An input source (start/stop/drain, like KeyReader) that plays by itself.
+# Every tick it reads the whole visible board: each column from the player's
+# to the right edge becomes a bitmask of its open rows. For each move it could
+# make, it pushes the set of rows it could be in through those columns (a row
+# reaches the rows within `moves` of it, then the walls cut them down), and
+# takes the move that survives the most columns, then the one with the most
+# rows still open at the edge, then the smallest move.
+#
+# It only looks at the board as it is, so the rows added at 100 and 300 just
+# show up (as walls first, then as the taller columns scroll in).
+
+class AutoPlayer:
+    def __init__(self, game, moves=1):
+        self.game = game
+        self.moves = moves  # keys it presses at most per tick (a row each)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def open_rows(self):
+        """Bitmask of the open rows of every column from the player's (x = 1) to the right edge."""
+        board = self.game.board
+        width, head = board.width, board.head
+        wall = FlappyBoard.WALL
+        masks = [0] * (width - 1)
+        for y, row in enumerate(board.rows):
+            bit = 1 << y
+            for x in range(1, width):
+                if row[(head + x) % width] != wall:
+                    masks[x - 1] |= bit
+        return masks
+
+    def best_move(self):
+        masks = self.open_rows()
+        height = self.game.board.height
+        full = (1 << height) - 1
+        moves = self.moves
+        cursor = self.game.cursor_position
+        best, best_score = 0, None
+        seen = set()
+        for d in sorted(range(-moves, moves + 1), key=abs):
+            y = max(0, min(height - 1, cursor + d))
+            if y in seen:
+                continue
+            seen.add(y)
+            rows = (1 << y) & masks[0]
+            survived = 0
+            if rows:
+                survived = 1
+                for mask in masks[1:]:
+                    for _ in range(moves):
+                        rows |= (rows << 1) | (rows >> 1)
+                    rows &= full & mask
+                    if not rows:
+                        break
+                    survived += 1
+            score = (survived, bin(rows).count("1"))
+            if best_score is None or score > best_score:
+                best, best_score = y - cursor, score
+        return best
+
+    def drain(self):
+        d = self.best_move()
+        return ["up"] * -d if d < 0 else ["down"] * d
+
+
+def play_headless(seed=None, max_score=None, moves=1, renderer=None):
+    """One game by the AutoPlayer on a SimulatedClock (no waiting, nothing drawn by default).
+
+    Returns the finished game, game.score is how far it got.
+    """
+    game = Flappy_flap(seed=seed)
+    game.run(0, AutoPlayer(game, moves), renderer, SimulatedClock(), max_score)
+    return game
@@ -0,0 +1,260 @@
+import random
+import time
+
+from office_rpg.events import FlappyGameOver, FlappyReward
+from office_rpg.metrics import Metrics
+from office_rpg.minigames import Minigame
+from office_rpg.minigames.levels import LevelStream
+from office_rpg.system import Console, SystemAdmin
+from office_rpg.terminal import TerminalRenderer, KeyReader, SystemClock
+
+
+class FlappyBoard:
+    """The Flappy_flap playfield as a ring buffer of columns.
+
+    Each row is a bytearray and head is the index of the leftmost visible
+    column, so scrolling writes one new column instead of shifting every row.
+    """
+
+    WALL = ord("I")
+    EMPTY = ord(" ")
+
+    def __init__(self, height, width):
+        self.width = width
+        self.rows = [bytearray(b" " * width) for _ in range(height)]
+        self.head = 0
+
+    @property
+    def height(self):
+        return len(self.rows)
+
+    def cell(self, y, x):
+        return self.rows[y][(self.head + x) % self.width]
+
+    def scroll(self, column):
+        # the leftmost column falls off and its slot becomes the new rightmost one
+        h = self.head
+        for y, row in enumerate(self.rows):
+            row[h] = column[y]
+        self.head = (h + 1) % self.width
+
+    def add_rows(self, count):
+        for _ in range(count):
+            self.rows.append(bytearray(b"I" * self.width))
+
+    def row_text(self, y):
+        row = self.rows[y]
+        h = self.head
+        return (row[h:] + row[:h]).decode()
+
+
+class Flappy_flap(Minigame):
+
+
+    # Minigame parameters
+    SCREEN_HEIGHT = 3 # Starting height, every game grows its own board by GROWTH
+    GROWTH = ((100, 2), (300, 2)) # (at score, rows added)
+    SCREEN_WIDTH = 20
+    GAME_SPEED = 0.1 # Time between each frame (seconds)
+    MAX_CATCH_UP = 5 # Ticks simulated at most per frame when rendering runs late
+    MOVES = {"up": -1, "down": 1}
+    profile_frames = False # --profile: per-frame budget report after each game
+    level_seed = None # --flappy-seed: play this level instead of a random one
+    level_thread = False # generate the level on a background thread
+    last_score = 0 # score of the last game play() ran (journaled with the reward)
+
+
+    def __init__(self, rng=random, seed=None, background=False):
+        self.board = FlappyBoard(Flappy_flap.SCREEN_HEIGHT, Flappy_flap.SCREEN_WIDTH)
+        self.cursor_position = 1 # Y position (line) of the player
+        self.score = 0
+        self.budget = None # a profiling.FrameBudget when profile_frames is on
+        # the whole level follows from the seed, see levels.py
+        self.seed = rng.getrandbits(32) if seed is None else seed
+        self.level = LevelStream(self.seed, Flappy_flap.SCREEN_HEIGHT, Flappy_flap.GROWTH,
+                                 self.cursor_position, background=background)
+
+
+    def grow(self):
+        for at, rows in Flappy_flap.GROWTH:
+            if self.score == at:
+                self.board.add_rows(rows)
+
+
+    def next_column(self):
+        return next(self.level)
+
+
+    def tick(self, keys=()):
+        """One game step with the keys pressed since the last one. False on collision."""
+        self.grow()
+        for key in keys:
+            direction = Flappy_flap.MOVES.get(key, 0)
+            self.cursor_position = max(0, min(self.board.height - 1, self.cursor_position + direction))
+
+        # Collision test
+        if self.board.cell(self.cursor_position, 1) == FlappyBoard.WALL:
+            return False
+
+        # Obstacles move left, new ones come in on the right side
+        if self.budget is None:
+            self.board.scroll(self.next_column())
+        else:
+            start = time.perf_counter_ns()
+            column = self.next_column()
+            generated = time.perf_counter_ns()
+            self.board.scroll(column)
+            self.budget.add("generation", generated - start)
+            self.budget.add("shift", time.perf_counter_ns() - generated)
+        self.score += 1
+        return True
+
+
+    def draw_game(self, best_score, renderer):
+        if Metrics.enabled:
+            start = time.perf_counter_ns()
+        lines = [
+            f"--- Flappy Flap | Score: {self.score} | Best score: {best_score} ---",
+            "-------------------------------------------",
+        ]
+        for i in range(self.board.height):
+            row = self.board.row_text(i)
+            if i == self.cursor_position:
+                row = row[:1] + "O" + row[2:]
+            lines.append("|" + row + "|")
+        lines.append("-------------------------------------------")
+        if Metrics.enabled:
+            built = time.perf_counter_ns()
+            Metrics.observe_ns("flappy_phase_seconds", built - start, phase="build")
+        renderer.render(lines)
+        if Metrics.enabled:
+            Metrics.since("flappy_phase_seconds", built, phase="render")
+            Metrics.inc("flappy_frames_total")
+
+
+    def run(self, best_score=0, keys=None, renderer=None, clock=None, max_score=None):
+        """The game loop until a collision (or max_score), returns the best score.
+
+        keys is an input source (start/stop/drain, like KeyReader), renderer
+        gets the frames (None draws nothing) and clock has monotonic_ns() and
+        sleep(), the real ones by default. With a SimulatedClock and an
+        AutoPlayer (see autoplay.py) the game runs headless and as fast as it can.
+        """
+        keys = keys if keys is not None else KeyReader.for_terminal()
+        clock = clock or SystemClock()
+        keys.start()
+        game_running = True
+
+        # Fixed timestep: the game advances one tick per GAME_SPEED of real
+        # (monotonic) time, whatever rendering costs. Slow frames run extra ticks.
+        # Integer nanoseconds so the accumulator never drifts.
+        tick = int(Flappy_flap.GAME_SPEED * 1_000_000_000)
+        budget = None
+        if Flappy_flap.profile_frames:
+            from office_rpg.profiling import FrameBudget
+            budget = self.budget = FrameBudget(tick)
+        previous = clock.monotonic_ns()
+        lag = tick
+        try:
+            while game_running:
+                now = clock.monotonic_ns()
+                lag += now - previous
+                previous = now
+
+                steps = 0
+                if Metrics.enabled:
+                    tick_start = time.perf_counter_ns()
+                while lag >= tick and steps < Flappy_flap.MAX_CATCH_UP:
+                    if budget is None:
+                        pressed = keys.drain()
+                    else:
+                        start = time.perf_counter_ns()
+                        pressed = keys.drain()
+                        budget.add("input", time.perf_counter_ns() - start)
+                    if not self.tick(pressed):
+                        game_running = False
+                        break
+                    lag -= tick
+                    steps += 1
+                    if self.score>best_score:
+                        best_score=self.score
+                    if max_score is not None and self.score >= max_score:
+                        game_running = False
+                        break
+                if steps == Flappy_flap.MAX_CATCH_UP:
+                    lag = 0 # too far behind, drop the backlog instead of spiralling
+                    if Metrics.enabled:
+                        Metrics.inc("flappy_backlog_dropped_total")
+                if Metrics.enabled:
+                    Metrics.since("flappy_phase_seconds", tick_start, phase="tick")
+                    Metrics.inc("flappy_ticks_total", steps)
+
+                if not game_running:
+                    if budget is not None:
+                        budget.end_frame()
+                    break
+
+                # Game display (nothing new to show if no tick ran)
+                if steps and renderer is not None:
+                    if budget is not None:
+                        start = time.perf_counter_ns()
+                    self.draw_game(best_score, renderer)
+                    if budget is not None:
+                        budget.add("render", time.perf_counter_ns() - start)
+                if Metrics.enabled or budget is not None:
+                    sleep_start = time.perf_counter_ns()
+                clock.sleep(max(0, tick - lag - (clock.monotonic_ns() - previous)) / 1_000_000_000)
+                if Metrics.enabled:
+                    Metrics.since("flappy_phase_seconds", sleep_start, phase="sleep")
+                if budget is not None:
+                    budget.add("sleep", time.perf_counter_ns() - sleep_start)
+                    budget.end_frame()
+        finally:
+            keys.stop() # terminal back to normal even on Ctrl+C
+            if renderer is not None:
+                renderer.close()
+            self.level.close()
+        return best_score
+
+
+    @staticmethod
+    def play(player, best_score = 0, rng=random):
+        """One game on the terminal, then the end screen and the reward. Returns the best score.
+
+        rng draws the reward (the session's, so a journal can replay it).
+        """
+        game = Flappy_flap(seed=Flappy_flap.level_seed, background=Flappy_flap.level_thread)
+        renderer = TerminalRenderer()
+        best_score = game.run(best_score, KeyReader.for_terminal(), renderer)
+        budget = game.budget
+
+        score = game.score
+        Flappy_flap.last_score = score
+        ranked = SystemAdmin.submit_score(player, score)
+
+        # End game screen
+        SystemAdmin.cls()
+        Console.emit(FlappyGameOver(player.name, score, game.seed, *(ranked or ())))
+        Console.say(renderer.report())
+        if budget is not None:
+            Console.say(budget.report())
+        Console.pause(2)
+
+        Flappy_flap.reward(player, score, best_score, rng)
+        return best_score
+
+
+    @staticmethod
+    def reward(player, score, best_score, rng=random):
+        """How a game of score makes the player feel (best_score already counts it)."""
+        if score > best_score and score >= 50:
+            outcome, number, stress = "best", rng.randint(15, 35), -15
+        elif score >= 75 and score <= 100:
+            outcome, number, stress = "high", rng.randint(10, 30), -10
+        elif score >= 100:
+            outcome, number, stress = "big", rng.randint(12, 32), -12
+        else:
+            outcome, number, stress = "lag", rng.randint(10, 25), -5
+        player.modify_motivation(number)
+        player.modify_stress(stress)
+        Console.emit(FlappyReward(player.name, outcome, number, stress))
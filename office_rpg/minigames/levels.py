@@ -0,0 +1,104 @@
+import queue
+import random
+import threading
+
+
+# ==========================================
+# FLAPPY FLAP LEVELS
+# ==========================================
+# A level is an endless stream of obstacle columns, all drawn from one
+# random.Random(seed): the same seed plays the same level. Columns come in
+# chunks. One getrandbits() call covers every cell of a chunk (2 bits a cell,
+# a wall when both are 0, so 25% walls like before), and each column is put
+# together from ready-made 4-row pieces looked up by their 8 bits.
+#
+# Every chunk carries on a path that moves at most one row per column, and
+# both ends of each step are kept open. It starts on the player's row, so the
+# player, who can also move a row per tick, can always follow it.
+
+EMPTY = ord(" ")
+WALL = ord("I")
+STEPS = (-1, 0, 1)
+
+
+PIECE_ROWS = 4
+# every 4-row piece of a column, indexed by its 8 random bits
+PIECES = [bytes(WALL if (bits >> (2 * y)) & 3 == 0 else EMPTY for y in range(PIECE_ROWS)) for bits in range(256)]
+
+
+def height_at(index, height, growth):
+    """Rows of column index when the board starts at height and grows by growth ((at score, rows), ...)."""
+    for at, rows in growth:
+        if index >= at:
+            height += rows
+    return height
+
+
+def generate(seed, height, growth=(), start_row=1, chunk=64):
+    """Yield lists of chunk columns (bytearrays, row 0 first) forever."""
+    rng = random.Random(seed)
+    path = start_row
+    index = 0
+    while True:
+        heights = [height_at(index + i, height, growth) for i in range(chunk)]
+        pieces = [-(-h // PIECE_ROWS) for h in heights]
+        # one random byte per piece
+        data = rng.getrandbits(8 * sum(pieces)).to_bytes(sum(pieces), "little")
+        steps = rng.choices(STEPS, k=chunk)
+        columns = []
+        at = 0
+        for h, n, step in zip(heights, pieces, steps):
+            column = bytearray(b"".join([PIECES[b] for b in data[at:at + n]])[:h])
+            at += n
+            column[path] = EMPTY
+            path = max(0, min(h - 1, path + step))
+            column[path] = EMPTY
+            columns.append(column)
+        index += chunk
+        yield columns
+
+
+class LevelStream:
+    """The columns of one game, next(stream) is the next one to scroll in.
+
+    With background=True a daemon thread keeps up to `ahead` chunks ready,
+    otherwise a chunk is made whenever the last one runs out.
+    """
+
+    CHUNK = 64
+
+    def __init__(self, seed, height, growth=(), start_row=1, chunk=CHUNK, background=False, ahead=4):
+        self.seed = seed
+        self._chunks = generate(seed, height, growth, start_row, chunk)
+        self._current = iter(())
+        self._queue = None
+        self._stop = None
+        if background:
+            self._queue = queue.Queue(maxsize=ahead)
+            self._stop = threading.Event()
+            threading.Thread(target=self._fill, daemon=True).start()
+
+    def _fill(self):
+        for chunk in self._chunks:
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if self._stop.is_set():
+                return
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        column = next(self._current, None)
+        if column is None:
+            self._current = iter(self._queue.get() if self._queue is not None else next(self._chunks))
+            column = next(self._current)
+        return column
+
+    def close(self):
+        if self._stop is not None:
+            self._stop.set()
@@ -0,0 +1,197 @@
+import collections
+import os
+import sys
+import threading
+
+
+# ==========================================
+# PROFILING (python project.py --profile ...)
+# ==========================================
+# Both profilers write collapsed stacks ("main;play;do_task 42" per line), the
+# input format of flamegraph.pl, speedscope and inferno.
+
+def _frame_name(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Looks at the stack of one thread every `interval` seconds from a daemon thread.
+
+    Costs the profiled thread nothing between samples (only the GIL hand-off),
+    so timings stay close to an unprofiled run.
+    """
+
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.samples = collections.Counter()  # tuple of code objects, root first -> count
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.samples[tuple(stack)] += 1
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def collapsed(self):
+        folded = collections.Counter()
+        for stack, count in self.samples.items():
+            folded[";".join(_frame_name(code) for code in stack)] += count
+        return folded
+
+    def summary(self, top=15):
+        total = sum(self.samples.values())
+        own = collections.Counter()
+        for stack, count in self.samples.items():
+            own[_frame_name(stack[-1])] += count
+        lines = [f"{total} samples every {self.interval * 1000:g} ms, top functions by own samples:"]
+        for name, count in own.most_common(top):
+            lines.append(f"  {count / total:6.1%}  {name}")
+        return "\n".join(lines)
+
+
+class CProfileProfiler:
+    """Deterministic cProfile run. pstats only keeps caller -> callee edges,
+    so the collapsed stacks are rebuilt by splitting each function's own time
+    over its callers in proportion to the time they spent calling it.
+    """
+
+    MAX_DEPTH = 64
+
+    def __init__(self):
+        import cProfile
+
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def _stats(self):
+        import pstats
+
+        return pstats.Stats(self.profile).stats
+
+    def collapsed(self):
+        stats = self._stats()
+        folded = collections.Counter()
+
+        def name(func):
+            filename, line, funcname = func
+            return f"{funcname} ({os.path.basename(filename)}:{line})"
+
+        def walk(func, us, path, seen):
+            callers = stats[func][4] if func in stats else {}
+            callers = {c: edge for c, edge in callers.items() if c not in seen}
+            total = sum(edge[3] for edge in callers.values())
+            if not callers or not total or len(path) >= CProfileProfiler.MAX_DEPTH:
+                folded[";".join(reversed(path))] += int(us)
+                return
+            for caller, edge in callers.items():
+                share = us * edge[3] / total
+                if share >= 1:
+                    walk(caller, share, path + [name(caller)], seen | {caller})
+
+        for func, (cc, nc, tt, ct, callers) in stats.items():
+            if tt * 1e6 >= 1:
+                walk(func, tt * 1e6, [name(func)], {func})
+        return folded
+
+    def summary(self, top=15):
+        import io
+        import pstats
+
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats("cumulative").print_stats(top)
+        return out.getvalue()
+
+    def dump(self, path):
+        self.profile.dump_stats(path)
+
+
+def start(kind, interval=0.005):
+    profiler = SamplingProfiler(interval) if kind == "sample" else CProfileProfiler()
+    profiler.start()
+    return profiler
+
+
+def write_collapsed(folded, path):
+    with open(path, "w") as f:
+        for stack, count in sorted(folded.items()):
+            if count > 0:
+                f.write(f"{stack} {count}\n")
+
+
+# ==========================================
+# FRAME BUDGET (Flappy_flap)
+# ==========================================
+class FrameBudget:
+    """Where each frame of a fixed-timestep game loop went, phase by phase.
+
+    The loop calls add(phase, ns) as it goes and end_frame() once per frame.
+    A frame is over budget when the work in it (everything but sleep) took
+    longer than one tick.
+    """
+
+    PHASES = ("input", "shift", "generation", "render", "sleep")
+
+    def __init__(self, tick_ns):
+        self.tick_ns = tick_ns
+        self.frames = []  # one {phase: ns} per frame
+        self.current = dict.fromkeys(FrameBudget.PHASES, 0)
+
+    def add(self, phase, ns):
+        self.current[phase] += ns
+
+    def end_frame(self):
+        self.frames.append(self.current)
+        self.current = dict.fromkeys(FrameBudget.PHASES, 0)
+
+    def over_budget(self):
+        """[(frame index, work ns)] of the frames whose work didn't fit in a tick."""
+        out = []
+        for i, frame in enumerate(self.frames):
+            work = sum(frame.values()) - frame["sleep"]
+            if work > self.tick_ns:
+                out.append((i, work))
+        return out
+
+    def report(self, show=10):
+        if not self.frames:
+            return "No frames recorded."
+        n = len(self.frames)
+        lines = [
+            f"Frame budget: {n} frames, tick {self.tick_ns / 1e6:g} ms",
+            f"  {'phase':<11} {'mean (ms)':>9} {'p99 (ms)':>9} {'of tick':>8}",
+        ]
+        for phase in FrameBudget.PHASES:
+            values = sorted(frame[phase] for frame in self.frames)
+            mean = sum(values) / n
+            p99 = values[min(n - 1, n * 99 // 100)]
+            lines.append(f"  {phase:<11} {mean / 1e6:>9.3f} {p99 / 1e6:>9.3f} {mean / self.tick_ns:>8.1%}")
+        over = self.over_budget()
+        lines.append(f"  over budget: {len(over)} frames")
+        for i, work in over[:show]:
+            frame = self.frames[i]
+            worst = max((p for p in FrameBudget.PHASES if p != "sleep"), key=frame.get)
+            lines.append(f"    frame {i}: {work / 1e6:.2f} ms of work, mostly {worst}")
+        return "\n".join(lines)
@@ -0,0 +1,56 @@
+import importlib
+
+
+# ==========================================
+# PLUGIN REGISTRY
+# ==========================================
+# Minigames and task types are registered as "module:Class" strings and only
+# imported the first time they are needed, so a session that never opens a
+# minigame never pays for it (or for its optional dependencies).
+
+MINIGAMES = {
+    "flappy_flap": "office_rpg.minigames.flappy:Flappy_flap",
+}
+
+TASK_TYPE_SPECS = [
+    "office_rpg.tasks:CodingTask",
+    "office_rpg.tasks:MeetingTask",
+    "office_rpg.tasks:HRTask",
+    "office_rpg.tasks:SupportTicketTask",
+    "office_rpg.tasks:DocumentationTask",
+    "office_rpg.tasks:CreativeTask",
+]
+
+_loaded = {}
+_task_types = None
+
+
+def load(spec):
+    obj = _loaded.get(spec)
+    if obj is None:
+        module_name, _, attr = spec.partition(":")
+        obj = getattr(importlib.import_module(module_name), attr)
+        _loaded[spec] = obj
+    return obj
+
+
+def register_minigame(name, spec):
+    MINIGAMES[name] = spec
+
+
+def minigame(name):
+    return load(MINIGAMES[name])
+
+
+def register_task_type(spec):
+    """Add a task type to get_random_task (it needs a row in the task table too)."""
+    global _task_types
+    TASK_TYPE_SPECS.append(spec)
+    _task_types = None
+
+
+def task_types():
+    global _task_types
+    if _task_types is None:
+        _task_types = [load(spec) for spec in TASK_TYPE_SPECS]
+    return _task_types
@@ -0,0 +1,231 @@
+import json
+import os
+import time
+
+from office_rpg.entities import Employee, Intern, Developer, Manager, HR
+from office_rpg.events import SaveFailed
+from office_rpg.items import Item, Coffee, Laptop, Bundle, Inventory
+from office_rpg.system import Console
+
+
+# ==========================================
+# SAVE STORE
+# ==========================================
+# One SQLite file, one row per player, keyed by name. The name is the primary
+# key, so a lookup is a single index probe whatever the number of saves.
+# Every save runs in its own transaction (atomic, a crash can't leave half a
+# row behind) and only writes the columns that differ from the row on disk,
+# read again inside that transaction, so another process saving the same
+# player in between can't leave a mix of both.
+
+FIELDS = ("role", "stress", "motivation", "xp", "level", "flappy_flap_best_score", "inventory")
+
+ROLE_TYPES = {
+    "Employee": Employee,
+    "Intern": Intern,
+    "Developer": Developer,
+    "Manager": Manager,
+    "HR": HR,
+}
+
+ITEM_TYPES = {
+    "Item": Item,
+    "Coffee": Coffee,
+    "Laptop": Laptop,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    name TEXT PRIMARY KEY,
+    role TEXT NOT NULL,
+    stress INTEGER NOT NULL,
+    motivation INTEGER NOT NULL,
+    xp INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    flappy_flap_best_score INTEGER NOT NULL,
+    inventory TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS saves_updated ON saves (updated);
+CREATE TABLE IF NOT EXISTS logins (
+    name TEXT PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    since REAL NOT NULL
+);
+"""
+
+
+def _alive(pid):
+    if os.name == "nt":
+        return True  # os.kill(pid, 0) would end it there, the server drops its workers' logins (release_all)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def dump_inventory(inventory):
+    # one [kind, name, val, count] per stack, a bundle's name is its parts
+    stacks = []
+    for _, item, count in inventory:
+        if isinstance(item, Bundle):
+            parts = [[*key, n] for key, n in item.parts()]
+            stacks.append(["Bundle", parts, item.val, count])
+        else:
+            stacks.append([*item.key(), count])
+    return json.dumps(stacks)
+
+
+def _load_item(kind, name, val):
+    # bypass the constructors, Laptop() doesn't take a val
+    item = object.__new__(ITEM_TYPES.get(kind, Item))
+    Item.__init__(item, name, val)
+    return item
+
+
+def load_inventory(text):
+    inventory = Inventory()
+    for kind, name, val, *count in json.loads(text):
+        if kind == "Bundle":
+            item = Bundle(tuple(((k, nm, v), n) for k, nm, v, n in name), val)
+        else:
+            item = _load_item(kind, name, val)
+        # saves from before stacking have no count, one entry per item
+        inventory.add(item, count[0] if count else 1)
+    return inventory
+
+
+def snapshot(p):
+    """The saved columns of player p, same keys as a loaded save (minus name)."""
+    return {
+        "role": p.__class__.__name__,
+        "stress": p.stress,
+        "motivation": p.motivation if hasattr(p, "motivation") else 0,
+        "xp": p.xp if hasattr(p, "xp") else 0,
+        "level": p.level if hasattr(p, "level") else 1,
+        "flappy_flap_best_score": p.flappy_flap_best_score,
+        "inventory": dump_inventory(p.inventory),
+    }
+
+
+def restore_player(data):
+    """Build the Employee a loaded save describes (inventory already an Inventory)."""
+    player = ROLE_TYPES.get(data["role"], Employee)(data["name"])
+    player.stress = data["stress"]
+    player.motivation = data["motivation"]
+    player._xp = data["xp"]
+    player._level = data["level"]
+    player.flappy_flap_best_score = data["flappy_flap_best_score"]
+    player.inventory = data["inventory"]
+    return player
+
+
+class SaveStore:
+    def __init__(self, path):
+        import sqlite3  # ~10 ms, only paid once a store is opened
+
+        self.path = path
+        # isolation_level=None: no implicit transactions, save() opens its own
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _row(self, name):
+        cur = self.db.execute(f"SELECT {', '.join(FIELDS)} FROM saves WHERE name = ?", (name,))
+        row = cur.fetchone()
+        if row is None:
+            return None
+        return dict(zip(FIELDS, row))
+
+    def save(self, p):
+        """Write player p, returns the names of the columns that changed."""
+        row = snapshot(p)
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            # the write lock is held from here, nobody else changes the row until COMMIT
+            old = self._row(p.name)
+            if old is None:
+                changed = list(FIELDS)
+                self.db.execute(
+                    f"INSERT INTO saves (name, {', '.join(FIELDS)}, updated) VALUES (?, {', '.join('?' * len(FIELDS))}, ?)",
+                    (p.name, *(row[k] for k in FIELDS), time.time()),
+                )
+            else:
+                changed = [k for k in FIELDS if old[k] != row[k]]
+                sets = "".join(f"{k} = ?, " for k in changed)
+                self.db.execute(
+                    f"UPDATE saves SET {sets}updated = ? WHERE name = ?",
+                    (*(row[k] for k in changed), time.time(), p.name),
+                )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        return changed
+
+    def load(self, name):
+        """The save of name as a dict (inventory as an Inventory), or None."""
+        row = self._row(name)
+        if row is None:
+            return None
+        row["name"] = name
+        row["inventory"] = load_inventory(row["inventory"])
+        return row
+
+    def claim(self, name):
+        """Log name in for this process, False if another live process has it (a server worker)."""
+        pid = os.getpid()
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.db.execute("SELECT pid FROM logins WHERE name = ?", (name,)).fetchone()
+            if row is not None and row[0] != pid and _alive(row[0]):
+                self.db.execute("ROLLBACK")
+                return False
+            self.db.execute("INSERT OR REPLACE INTO logins (name, pid, since) VALUES (?, ?, ?)", (name, pid, time.time()))
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        return True
+
+    def release(self, name):
+        """Undo claim(name), if this process holds it."""
+        self.db.execute("DELETE FROM logins WHERE name = ? AND pid = ?", (name, os.getpid()))
+
+    def release_all(self, pids):
+        """Drop every login held by pids (server workers that have stopped, crashed ones included)."""
+        self.db.executemany("DELETE FROM logins WHERE pid = ?", [(pid,) for pid in pids])
+
+    def exists(self, name):
+        return self.db.execute("SELECT 1 FROM saves WHERE name = ?", (name,)).fetchone() is not None
+
+    def recent(self, limit=10):
+        """[(name, role, level)] of the most recently saved players."""
+        cur = self.db.execute("SELECT name, role, level FROM saves ORDER BY updated DESC LIMIT ?", (limit,))
+        return cur.fetchall()
+
+    def import_legacy(self, filename):
+        """Move an old single-slot savefile.json into the store (once)."""
+        if not os.path.exists(filename):
+            return
+        try:
+            with open(filename, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            # leave the file alone, it can still be fixed by hand
+            Console.emit(SaveFailed("import", filename, e))
+            return
+        if not self.exists(data["name"]):
+            data.setdefault("inventory", [])
+            self.db.execute(
+                f"INSERT INTO saves (name, {', '.join(FIELDS)}, updated) VALUES (?, {', '.join('?' * len(FIELDS))}, ?)",
+                (data["name"], *(data[k] for k in FIELDS[:-1]), json.dumps(data["inventory"]), os.path.getmtime(filename)),
+            )
+        os.replace(filename, filename + ".imported")
@@ -0,0 +1,339 @@
+import argparse
+import asyncio
+import concurrent.futures
+import itertools
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import time
+
+from office_rpg.entities import Intern, Developer, Manager, HR
+from office_rpg.events import Pause
+from office_rpg.items import Coffee, Laptop
+from office_rpg.metrics import Metrics
+from office_rpg.saves import restore_player
+from office_rpg.system import Console, SystemAdmin
+from office_rpg.tasks import get_random_task
+
+
+# ==========================================
+# GAME SERVER (python -m office_rpg.server)
+# ==========================================
+# Line-based TCP, telnet works as a client. Every connection is a Session
+# with its own Employee and its own random.Random. Commands run the normal
+# game code synchronously with Console.sink pointed at the session: events
+# are collected as text and a Pause turns into an await asyncio.sleep()
+# between the lines, so one player's 0.8 s task never blocks the others.
+# Save store I/O (login, save, logout) is awaited on the server's I/O thread,
+# so a slow disk doesn't block them either.
+
+PROMPT = b"\n> "
+ROLES = {
+    "intern": Intern,
+    "dev": Developer,
+    "developer": Developer,
+    "manager": Manager,
+    "hr": HR,
+}
+COMMANDS = {"help", "quit", "login", "status", "work", "break", "items", "use", "combine", "save"}
+HELP = (
+    "commands: login <name> [intern|dev|manager|hr], status, work, break,\n"
+    "          items, use <n>, combine [n], save, quit"
+)
+
+
+class Session:
+    """One connected player. Doubles as the Console sink while its commands run."""
+
+    def __init__(self, server, rng):
+        self.server = server
+        self.rng = rng
+        self.player = None
+        self.out = []  # lines (str) and pauses (float seconds), in order
+
+    def say(self, text):
+        self.out.append(text)
+
+    def emit(self, event):
+        if type(event) is Pause:
+            self.out.append(float(event.seconds))
+        else:
+            self.out.append(event.text())
+
+    def flush(self):
+        pass  # send() writes self.out after every command
+
+    def play(self, action, *args):
+        """Run game code with this session as the Console sink."""
+        Console.sink = self
+        try:
+            return action(*args)
+        finally:
+            Console.sink = None
+
+    async def handle(self, line):
+        """Run one command, False once the session is over."""
+        cmd, _, arg = line.partition(" ")
+        cmd = cmd.lower()
+        arg = arg.strip()
+        if cmd in ("help", ""):
+            self.say(HELP)
+        elif cmd == "quit":
+            try:
+                await self.logout()
+            except Exception as e:
+                self.say(f"err saving: {e}")
+            self.say("Bye.")
+            return False
+        elif cmd == "login":
+            await self.login(arg)
+        elif self.player is None:
+            self.say("login first (help for the commands)")
+        elif cmd == "status":
+            self.say(self.player.get_status())
+        elif cmd == "work":
+            t = get_random_task(self.rng)
+            if self.player.motivation < t.mot_cost:
+                self.say("Too tired to work.")
+            else:
+                self.play(t.do_task, self.player, self.rng)
+        elif cmd == "break":
+            self.play(self.player.take_break, self.rng)
+        elif cmd == "items":
+            if not self.player.inventory:
+                self.say("No items.")
+            for i, (_, text) in enumerate(self.player.inventory.listing()):
+                self.say(f"{i+1}. {text}")
+        elif cmd == "use":
+            # input validation: only listed numbers
+            listing = self.player.inventory.listing()
+            if arg.isdigit() and 1 <= int(arg) <= len(listing):
+                self.play(self.player.use_item, listing[int(arg) - 1][0])
+            else:
+                self.say("use <item number>, see items")
+        elif cmd == "combine":
+            if arg and not arg.isdigit():
+                self.say("combine [how many]")
+            elif len(self.player.inventory) >= 2:
+                _, made = self.player.inventory.combine_first(max(1, int(arg or 1)))
+                self.say("Crafted bundle!" if made == 1 else f"Crafted {made} bundles!")
+            else:
+                self.say("Need 2 items.")
+        elif cmd == "save":
+            try:
+                await self.server.io("save", self.player)
+                self.say(">> Game saved.")
+            except Exception as e:
+                self.say(f"err saving: {e}")
+        else:
+            self.say(f"unknown command {cmd!r} (help for the commands)")
+
+        if self.player is not None and self.player.stress >= 100:
+            self.say("\nBURNOUT. Game Over.")
+            # like the local game: a burnout isn't saved
+            player, self.player = self.player, None
+            try:
+                await self.server.io("release", player.name)
+            finally:
+                self.server.online.discard(player.name)
+            return False
+        return True
+
+    async def login(self, arg):
+        if self.player is not None:
+            self.say(f"already playing as {self.player.name}")
+            return
+        name, _, role = arg.partition(" ")
+        if not name:
+            self.say("login <name> [intern|dev|manager|hr]")
+            return
+        if name in self.server.online:
+            self.say(f"{name} is already playing")
+            return
+        self.server.online.add(name)  # before the load, a second login can't slip in meanwhile
+        try:
+            # the other workers (and servers) on the store see the login too
+            if not await self.server.io("claim", name):
+                self.server.online.discard(name)
+                self.say(f"{name} is already playing")
+                return
+            data = await self.server.io("load", name)
+        except Exception as e:
+            # the row stays on disk, only this login gives up
+            self.server.online.discard(name)
+            await self.server.io("release", name)
+            self.say(f">> could not load {name}: {e}")
+            return
+        if data:
+            self.player = restore_player(data)
+            self.say(f">> Welcome back, {name}.")
+        else:
+            self.player = ROLES.get(role.strip().lower(), Intern)(name)
+            self.player.inventory.add(Coffee("Instant Coffee", 10))
+            if self.rng.random() > 0.5:
+                self.player.inventory.add(Laptop("Dell Latitude"))
+            self.say(f">> New {self.player.__class__.__name__}: {name}.")
+        self.say(self.player.get_status())
+
+    async def logout(self):
+        """Save and leave (dropped connections too)."""
+        if self.player is None:
+            return
+        player, self.player = self.player, None
+        try:
+            await self.server.io("save", player)
+        finally:
+            # only now, a new login of the same name loads this save
+            try:
+                await self.server.io("release", player.name)
+            finally:
+                self.server.online.discard(player.name)
+
+
+class GameServer:
+    def __init__(self, time_scale=1.0, seed=None):
+        self.time_scale = time_scale  # 0 skips the pauses (load tests)
+        self.seed = seed
+        self.online = set()  # names logged in on this process
+        self._ids = itertools.count()
+        # one thread: the store's sqlite connection belongs to the thread that opened it
+        self._io = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="saves")
+
+    async def io(self, method, *args):
+        """Await SystemAdmin.store().<method>(*args) on the I/O thread (the store is opened there too)."""
+        def call():
+            return getattr(SystemAdmin.store(), method)(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._io, call)
+
+    def new_rng(self):
+        if self.seed is None:
+            return random.Random()
+        return random.Random(self.seed * 1_000_003 + next(self._ids))
+
+    async def serve_client(self, reader, writer):
+        session = Session(self, self.new_rng())
+        writer.write(f"--- OFFICE RPG SERVER ---\n{HELP}".encode() + PROMPT)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if Metrics.enabled:
+                    start = time.perf_counter_ns()
+                keep = await session.handle(line.decode(errors="replace").strip())
+                await self.send(session, writer)
+                writer.write(PROMPT if keep else b"\n")
+                await writer.drain()
+                if Metrics.enabled:
+                    cmd = line.split(b" ", 1)[0].strip().decode(errors="replace").lower()
+                    Metrics.since("server_command_seconds", start, cmd=cmd if cmd in COMMANDS else "other")
+                if not keep:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            name = session.player.name if session.player is not None else None
+            try:
+                await session.logout()
+            except Exception as e:
+                # nobody to tell on the connection any more, the server's output it is
+                if Metrics.enabled:
+                    Metrics.inc("save_errors_total", op="logout")
+                print(f">> could not save {name} on logout: {e}", file=sys.stderr, flush=True)
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except ConnectionError:
+                    pass
+
+    async def send(self, session, writer):
+        out, session.out = session.out, []
+        text = []
+        for part in out:
+            if isinstance(part, float):
+                if self.time_scale:
+                    writer.write("\n".join(text).encode() + b"\n")
+                    text = []
+                    await writer.drain()
+                    await asyncio.sleep(part * self.time_scale)
+            else:
+                text.append(part)
+        writer.write("\n".join(text).encode())
+
+
+async def serve(host, port, time_scale, seed, reuse_port=False):
+    game = GameServer(time_scale, seed)
+    server = await asyncio.start_server(game.serve_client, host, port, backlog=4096, reuse_port=reuse_port or None)
+    async with server:
+        await server.serve_forever()
+
+
+def run(host, port, time_scale, seed, reuse_port=False, saves=None):
+    if saves is not None:
+        SystemAdmin.db_path = saves  # set here, a spawned worker doesn't inherit the parent's
+    try:
+        asyncio.run(serve(host, port, time_scale, seed, reuse_port))
+    except KeyboardInterrupt:
+        pass
+
+
+def _release_logins(path, pids):
+    # whatever the workers didn't log out themselves (killed, crashed)
+    from office_rpg.saves import SaveStore
+    store = SaveStore(path)
+    try:
+        store.release_all(pids)
+    finally:
+        store.close()
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Office RPG over TCP (telnet localhost 4242)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4242)
+    parser.add_argument("--saves", default=SystemAdmin.db_path, help="SQLite save store shared by all sessions")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="multiplies every in-game pause, 0 = none")
+    parser.add_argument("--seed", type=int, default=None, help="session i gets random.Random(seed, i)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes sharing the port (SO_REUSEPORT), one event loop each")
+    args = parser.parse_args(argv)
+
+    print(f"Listening on {args.host}:{args.port} ({args.workers} worker(s))", flush=True)
+    if args.workers == 1:
+        try:
+            run(args.host, args.port, args.time_scale, args.seed, saves=args.saves)
+        finally:
+            _release_logins(args.saves, [os.getpid()])
+        return
+    # logins are claimed in the store, so a name plays on one worker at a time
+    signal.signal(signal.SIGTERM, _interrupt)  # so kill stops the workers too
+    procs = [
+        multiprocessing.Process(
+            target=run,
+            args=(args.host, args.port, args.time_scale, None if args.seed is None else args.seed + i, True, args.saves),
+        )
+        for i in range(args.workers)
+    ]
+    for p in procs:
+        p.start()
+    try:
+        for p in procs:
+            p.join()
+    except KeyboardInterrupt:
+        for p in procs:
+            p.terminate()
+        for p in procs:
+            p.join()
+    finally:
+        _release_logins(args.saves, [p.pid for p in procs])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import os
+import time
+
+from office_rpg.events import GameSaved, Message, Pause, SaveFailed
+from office_rpg.metrics import Metrics
+
+
+# ==========================================
+# FILE I/O AND HELPER STUFF
+# ==========================================
+class SystemAdmin:
+    db_path = "saves.db"
+    # the old single-slot save, imported into the store the first time it's opened
+    filename = "savefile.json"
+    journal_dir = "journals"
+    _store = None
+    _leaderboard = None
+
+    @staticmethod
+    def store():
+        # sqlite3 only gets imported once somebody saves or loads
+        if SystemAdmin._store is None or SystemAdmin._store.path != SystemAdmin.db_path:
+            from office_rpg.saves import SaveStore
+            SystemAdmin._store = SaveStore(SystemAdmin.db_path)
+            SystemAdmin._store.import_legacy(SystemAdmin.filename)
+        return SystemAdmin._store
+
+    @staticmethod
+    def save_game(p):
+        if Metrics.enabled:
+            start = time.perf_counter_ns()
+        try:
+            SystemAdmin.store().save(p)
+            if Metrics.enabled:
+                Metrics.since("save_io_seconds", start, op="save")
+            Console.emit(GameSaved(p.name))
+        except Exception as e:
+            if Metrics.enabled:
+                Metrics.inc("save_errors_total", op="save")
+            Console.emit(SaveFailed("save", p.name, e))
+
+    @staticmethod
+    def load_game(name):
+        """The save of player name as a dict, or None if there is none."""
+        import sqlite3  # deferred like the store itself, see store()
+        if Metrics.enabled:
+            start = time.perf_counter_ns()
+        try:
+            data = SystemAdmin.store().load(name)
+        except (sqlite3.DatabaseError, ValueError) as e:
+            # the row stays on disk, only this load gives up
+            if Metrics.enabled:
+                Metrics.inc("save_errors_total", op="load")
+            Console.emit(SaveFailed("load", name, e))
+            return None
+        if Metrics.enabled:
+            Metrics.since("save_io_seconds", start, op="load")
+        return data
+
+    @staticmethod
+    def has_save(name):
+        return SystemAdmin.store().exists(name)
+
+    @staticmethod
+    def list_saves(limit=10):
+        if not os.path.exists(SystemAdmin.db_path) and not os.path.exists(SystemAdmin.filename):
+            return []
+        import sqlite3
+        if Metrics.enabled:
+            start = time.perf_counter_ns()
+        try:
+            saves = SystemAdmin.store().recent(limit)
+        except sqlite3.DatabaseError as e:
+            if Metrics.enabled:
+                Metrics.inc("save_errors_total", op="list")
+            Console.emit(SaveFailed("list", SystemAdmin.db_path, e))
+            return []
+        if Metrics.enabled:
+            Metrics.since("save_io_seconds", start, op="list")
+        return saves
+
+    @staticmethod
+    def leaderboard():
+        # same file as the saves (its own tables and connection)
+        if SystemAdmin._leaderboard is None or SystemAdmin._leaderboard.path != SystemAdmin.db_path:
+            from office_rpg.leaderboard import Leaderboard
+            SystemAdmin.store()  # a new leaderboard starts from the saves, legacy one included
+            SystemAdmin._leaderboard = Leaderboard(SystemAdmin.db_path)
+        return SystemAdmin._leaderboard
+
+    @staticmethod
+    def submit_score(p, score):
+        """Put a finished Flappy Flap game on the leaderboard, returns (rank, players, percentile) or None."""
+        import sqlite3
+        if Metrics.enabled:
+            start = time.perf_counter_ns()
+        try:
+            board = SystemAdmin.leaderboard()
+            board.submit(p.name, score, p.__class__.__name__, getattr(p, "level", 1))
+            result = (board.rank(score), len(board), board.percentile(score))
+        except sqlite3.DatabaseError as e:
+            if Metrics.enabled:
+                Metrics.inc("save_errors_total", op="leaderboard")
+            Console.emit(SaveFailed("leaderboard", p.name, e))
+            return None
+        if Metrics.enabled:
+            Metrics.since("save_io_seconds", start, op="leaderboard")
+        return result
+
+    @staticmethod
+    def open_journal(name):
+        """The append-only action journal of player name, see office_rpg/journal.py."""
+        from office_rpg.journal import Journal
+        from urllib.parse import quote
+        os.makedirs(SystemAdmin.journal_dir, exist_ok=True)
+        return Journal(os.path.join(SystemAdmin.journal_dir, quote(name, safe="") + ".journal"))
+
+    @staticmethod
+    def cls():
+        os.system("cls" if os.name == "nt" else "clear")
+
+
+class Console:
+    """The event bus: game logic emits typed events (office_rpg/events.py) here.
+
+    quiet drops everything, whatever the sink (headless runs, journal replay).
+    Otherwise the sink gets the events, see events.py for the sinks; without
+    one they're printed and slept on the spot.
+    """
+
+    quiet = False
+    sink = None
+
+    @staticmethod
+    def emit(event):
+        if Console.quiet:
+            return
+        if Console.sink is not None:
+            Console.sink.emit(event)
+        elif type(event) is Pause:
+            time.sleep(event.seconds)
+        else:
+            print(event.text())
+
+    @staticmethod
+    def say(*args):
+        Console.emit(Message(" ".join(map(str, args))))
+
+    @staticmethod
+    def pause(seconds):
+        Console.emit(Pause(seconds))
+
+    @staticmethod
+    def flush():
+        """End of a turn: buffered sinks write out now."""
+        if Console.sink is not None and not Console.quiet:
+            Console.sink.flush()
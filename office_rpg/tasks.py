@@ -0,0 +1,259 @@
+import abc
+import functools
+import json
+import os
+import random
+import time
+
+from office_rpg import registry
+from office_rpg.balance import Balance, as_number
+from office_rpg.events import Pause, RoleReaction, TaskFinished, TaskStarted
+from office_rpg.metrics import Metrics
+from office_rpg.system import Console
+
+
+# ==========================================
+# BASE CLASS 2: TASK
+# ==========================================
+class Modifier:
+    """What one role does to one task type (a cell of task_table.json)."""
+
+    __slots__ = ("chance", "set_chance", "level_chance", "stress", "motivation", "xp_bonus", "say", "skip", "disaster")
+
+    def __init__(self, chance=0, set_chance=None, level_chance=None, stress=0, motivation=0,
+                 xp_bonus=0, say=None, skip=False, disaster=None):
+        self.chance = chance  # added to the odds...
+        self.set_chance = set_chance  # ...unless the odds are just replaced
+        self.level_chance = tuple(level_chance) if level_chance else None  # (min level, extra chance)
+        self.stress = stress  # applied before the task resolves
+        self.motivation = motivation
+        self.xp_bonus = xp_bonus
+        self.say = say
+        self.skip = skip  # task ends right there, no resolve
+        self.disaster = disaster  # {"odds", "stress", "say"}, rolled first, ends the task if it hits
+
+    def adjust(self, chance, level):
+        if self.set_chance is not None:
+            chance = self.set_chance
+        else:
+            chance += self.chance
+        if self.level_chance is not None and level >= self.level_chance[0]:
+            chance += self.level_chance[1]
+        return chance
+
+
+NO_MODIFIER = Modifier()
+
+
+class TaskTable:
+    """(task type x role) modifiers, loaded from task_table.json on first use.
+
+    Lookups are cached per (task class, employee class), subclasses fall back
+    to the closest parent listed in the file (like the old isinstance checks).
+    """
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "task_table.json")
+    _tasks = None  # {task name: {"win", "lose", "roles": {role name: Modifier}}}
+    _compiled = {}  # {(task class, employee class): (Modifier, win msg, lose msg)}
+    version = 0  # bumped on every change, see Balance.key()
+
+    @staticmethod
+    def load(path=None):
+        with open(path or TaskTable.path, "r") as f:
+            data = json.load(f)
+        tasks = {}
+        for task_name, entry in data.items():
+            roles = {role: Modifier(**mod) for role, mod in entry["roles"].items()}
+            tasks[task_name] = {"win": entry["win"], "lose": entry["lose"], "roles": roles}
+        TaskTable._tasks = tasks
+        TaskTable._compiled = {}
+        TaskTable.version += 1
+        TaskTable.success_odds.cache_clear()
+
+    @staticmethod
+    def override(cell, value):
+        """Set one modifier field, cell is "Task.Role.field" (or "Task.Role.disaster.odds" / ".stress")."""
+        if TaskTable._tasks is None:
+            TaskTable.load()
+        task_name, role, field, *sub = cell.split(".")
+        mod = TaskTable._tasks[task_name]["roles"][role]
+        if field == "disaster" and sub in (["odds"], ["stress"]):
+            value = as_number(cell, value, float if sub[0] == "odds" else int)
+            mod.disaster = dict(mod.disaster or {"odds": 0.0, "stress": 0, "say": ""}, **{sub[0]: value})
+        elif field in ("chance", "set_chance", "stress", "motivation", "xp_bonus") and not sub:
+            if value is not None or field != "set_chance":  # None: no fixed odds
+                value = as_number(cell, value, int)
+            setattr(mod, field, value)
+        else:
+            raise KeyError(f"can't set {cell}")
+        TaskTable._compiled = {}
+        TaskTable.version += 1
+        TaskTable.success_odds.cache_clear()
+
+    @staticmethod
+    def lookup(task_type, emp_type):
+        rule = TaskTable._compiled.get((task_type, emp_type))
+        if rule is None:
+            rule = TaskTable._compile(task_type, emp_type)
+            TaskTable._compiled[(task_type, emp_type)] = rule
+        return rule
+
+    @staticmethod
+    def _compile(task_type, emp_type):
+        if TaskTable._tasks is None:
+            TaskTable.load()
+        entry = next((TaskTable._tasks[c.__name__] for c in task_type.__mro__ if c.__name__ in TaskTable._tasks), None)
+        if entry is None:
+            raise KeyError(f"{task_type.__name__} is not in the task table")
+        roles = entry["roles"]
+        mod = next((roles[c.__name__] for c in emp_type.__mro__ if c.__name__ in roles), NO_MODIFIER)
+        return mod, entry["win"], entry["lose"]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def success_odds(task_type, emp_type, level, diff):
+        """Chance of success for every motivation 0..100 (exact, over the calc_odds noise).
+
+        Doesn't count the disaster roll, and tasks that skip never succeed.
+        Cleared by Balance.apply, the odds follow the current Balance.
+        """
+        mod = TaskTable.lookup(task_type, emp_type)[0]
+        if mod.skip:
+            return (0.0,) * 101
+        b = Balance
+        noises = range(-b.odds_noise, b.odds_noise + 1)
+        odds = []
+        for mot in range(101):
+            base = mot + (level * b.odds_per_level) - (diff * b.odds_per_diff)
+            hits = 0
+            for noise in noises:
+                chance = mod.adjust(max(b.odds_min, min(b.odds_max, base + noise)), level)
+                hits += max(0, min(101, chance))  # randint(0, 100) < chance
+            odds.append(hits / (len(noises) * 101))
+        return tuple(odds)
+
+
+class Task(abc.ABC):
+    __slots__ = ("name", "diff", "stress_add", "mot_cost", "xp_gain")
+
+    def __init__(self, name, diff):
+        self.name = name
+        self.diff = diff
+        self.stress_add = diff * Balance.stress_per_diff
+        self.mot_cost = diff * Balance.mot_cost_per_diff
+        self.xp_gain = diff * Balance.xp_per_diff
+
+    # rng is anything with the random module's interface (the module itself
+    # by default, or a random.Random for reproducible simulations).
+    # Returns whether it worked, None when it ended before the roll (disaster or skip).
+    def do_task(self, emp, rng=random):
+        mod, win_msg, lose_msg = TaskTable.lookup(type(self), type(emp))
+        chance = self.calc_odds(emp, rng)
+        if mod.disaster is not None and rng.random() < mod.disaster["odds"]:
+            Console.emit(RoleReaction(type(self).__name__, type(emp).__name__, mod.disaster["say"], True))
+            emp.stress += mod.disaster["stress"]
+            return
+        if mod.say:
+            Console.emit(RoleReaction(type(self).__name__, type(emp).__name__, mod.say))
+        if mod.motivation:
+            emp.motivation += mod.motivation
+        if mod.stress:
+            emp.stress += mod.stress
+        if mod.skip:
+            return
+        success = rng.randint(0, 100) < mod.adjust(chance, emp.level)
+        self.resolve(emp, success, win_msg, lose_msg, mod.xp_bonus)
+        return success
+
+    def calc_odds(self, emp, rng=random):
+        b = Balance
+        base = emp.motivation + (emp.level * b.odds_per_level) - (self.diff * b.odds_per_diff)
+        noise = rng.randint(-b.odds_noise, b.odds_noise)
+        return max(b.odds_min, min(b.odds_max, base + noise))
+
+    def resolve(self, emp, success, win_msg, lose_msg, xp_bonus=0):
+        if Metrics.enabled:
+            start = time.perf_counter_ns()
+        Console.emit(TaskStarted(self.name, self.diff))
+        Console.emit(Pause(0.8))
+        emp.motivation -= self.mot_cost
+        if success:
+            Console.emit(TaskFinished(self.name, True, win_msg))
+            emp.add_xp(self.xp_gain + xp_bonus)
+            emp.stress += self.stress_add // 2
+        else:
+            Console.emit(TaskFinished(self.name, False, lose_msg))
+            emp.stress += self.stress_add
+        if Metrics.enabled:
+            task, role = type(self).__name__, type(emp).__name__
+            Metrics.since("task_resolve_seconds", start, task=task, role=role)
+            Metrics.inc("tasks_total", task=task, role=role, outcome="success" if success else "fail")
+
+
+# Derived Classes for Task (We have 6, so we are good here)
+# How each role does them is in task_table.json, see TaskTable.
+class CodingTask(Task):
+    __slots__ = ()
+
+
+class MeetingTask(Task):
+    __slots__ = ()
+
+
+class HRTask(Task):
+    __slots__ = ()
+
+
+class SupportTicketTask(Task):
+    __slots__ = ()
+
+
+class DocumentationTask(Task):
+    __slots__ = ()
+
+
+class CreativeTask(Task):
+    __slots__ = ()
+
+
+class TaskPool:
+    """One shared Task per (type, diff) so hot loops don't allocate a task per turn.
+
+    Tasks only hold diff and the costs derived from it, so sharing them is safe
+    as long as nobody renames or mutates a pooled task.
+    """
+
+    _pool = {}
+
+    @staticmethod
+    def get(task_type, diff):
+        key = (task_type, diff)
+        task = TaskPool._pool.get(key)
+        if task is None:
+            task = task_type(f"{task_type.__name__}_{diff}", diff)
+            TaskPool._pool[key] = task
+        return task
+
+    @staticmethod
+    def clear():
+        TaskPool._pool = {}
+
+
+# the built-in task types, get_random_task draws from registry.task_types()
+TASK_TYPES = [
+    CodingTask,
+    MeetingTask,
+    HRTask,
+    SupportTicketTask,
+    DocumentationTask,
+    CreativeTask,
+]
+
+
+def get_random_task(rng=random, pooled=False):
+    t = rng.choice(registry.task_types())
+    number = rng.randint(100, 999)  # drawn in both modes so the rng stream stays the same
+    diff = rng.randint(1, 8)
+    if pooled:
+        return TaskPool.get(t, diff)
+    return t(f"Task_{number}", diff)
@@ -0,0 +1,219 @@
+import collections
+import os
+import select
+import sys
+import threading
+import time
+
+
+# ==========================================
+# TERMINAL OUTPUT AND INPUT (MINIGAMES)
+# ==========================================
+class TerminalRenderer:
+    """Double-buffered terminal output for the minigames.
+
+    Keeps what is on screen (front) and only rewrites the cells that changed,
+    with ANSI cursor moves, in a single write per frame. No clear, no flicker.
+    """
+
+    def __init__(self, out=None):
+        self.out = out or sys.stdout
+        self.front = []  # lines currently on screen
+        self.frame_times = []  # seconds spent in each render()
+        if os.name == "nt":
+            os.system("")  # turns on ANSI escape codes in the Windows console
+
+    def render(self, lines):
+        start = time.perf_counter()
+        if not self.front:
+            parts = ["\x1b[2J\x1b[?25l"]  # clear once, hide cursor
+        else:
+            parts = []
+        for y, line in enumerate(lines):
+            old = self.front[y] if y < len(self.front) else ""
+            if len(line) < len(old):
+                line = line.ljust(len(old))  # blank out what's left of a longer old line
+            x = 0
+            while x < len(line):
+                if x < len(old) and line[x] == old[x]:
+                    x += 1
+                    continue
+                run_start = x
+                while x < len(line) and not (x < len(old) and line[x] == old[x]):
+                    x += 1
+                parts.append(f"\x1b[{y + 1};{run_start + 1}H{line[run_start:x]}")
+        parts.append(f"\x1b[{len(lines) + 1};1H")  # park the cursor under the frame
+        self.out.write("".join(parts))
+        self.out.flush()
+        self.front = list(lines)
+        self.frame_times.append(time.perf_counter() - start)
+
+    def close(self):
+        self.out.write("\x1b[?25h")  # cursor back
+        self.out.flush()
+        self.front = []
+
+    def report(self):
+        if not self.frame_times:
+            return "No frames rendered."
+        avg = sum(self.frame_times) / len(self.frame_times)
+        worst = max(self.frame_times)
+        return f"{len(self.frame_times)} frames, render avg {avg * 1000:.2f} ms, worst {worst * 1000:.2f} ms"
+
+
+class KeyReader:
+    """Reads keys from the terminal on a background thread.
+
+    Every key lands in a deque (appends/pops are atomic, so no lock) and the
+    game drains it once per tick, so nothing pressed between two ticks is
+    lost. Plain stdin in cbreak mode: works over SSH and doesn't need root.
+    """
+
+    # escape sequences and letters we care about
+    KEYS = {
+        b"\x1b[A": "up",
+        b"\x1b[B": "down",
+        b"\x1bOA": "up",
+        b"\x1bOB": "down",
+        b"w": "up",
+        b"s": "down",
+    }
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self.events = collections.deque()
+        self._stop = threading.Event()
+        self._thread = None
+        self._saved_mode = None
+
+    @staticmethod
+    def for_terminal():
+        # keyboard can still do it when stdin is not a terminal (needs root on Linux)
+        if os.name != "nt" and not sys.stdin.isatty():
+            return KeyboardPoller()
+        return KeyReader()
+
+    def start(self):
+        if os.name == "nt":
+            target = self._read_windows
+        else:
+            import termios
+            import tty
+
+            fd = self.stream.fileno()
+            self._saved_mode = termios.tcgetattr(fd)
+            tty.setcbreak(fd)  # one key at a time, no echo, Ctrl+C still works
+            target = self._read_posix
+        self._stop.clear()
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._saved_mode is not None:
+            import termios
+
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved_mode)
+            self._saved_mode = None
+
+    def drain(self):
+        keys = []
+        while self.events:
+            keys.append(self.events.popleft())
+        return keys
+
+    def feed(self, data):
+        """Turn raw bytes into key events, returns the unfinished tail (half an escape sequence)."""
+        while data:
+            if data[:1] == b"\x1b":
+                if len(data) < 3 and any(seq.startswith(data) for seq in KeyReader.KEYS):
+                    return data
+                key = KeyReader.KEYS.get(data[:3])
+                if key:
+                    self.events.append(key)
+                    data = data[3:]
+                else:
+                    data = data[1:]
+            else:
+                key = KeyReader.KEYS.get(data[:1].lower())
+                if key:
+                    self.events.append(key)
+                data = data[1:]
+        return data
+
+    def _read_posix(self):
+        fd = self.stream.fileno()
+        pending = b""
+        while not self._stop.is_set():
+            ready, _, _ = select.select([fd], [], [], 0.05)
+            if not ready:
+                continue
+            data = os.read(fd, 64)
+            if not data:
+                break
+            pending = self.feed(pending + data)
+
+    def _read_windows(self):
+        import msvcrt
+
+        arrows = {"H": "up", "P": "down"}
+        while not self._stop.is_set():
+            while msvcrt.kbhit():
+                ch = msvcrt.getwch()
+                if ch in ("\x00", "\xe0"):
+                    key = arrows.get(msvcrt.getwch())
+                else:
+                    key = KeyReader.KEYS.get(ch.lower().encode())
+                if key:
+                    self.events.append(key)
+            time.sleep(0.005)
+
+
+class KeyboardPoller:
+    """Old-style input through the keyboard package, same interface as KeyReader."""
+
+    def __init__(self):
+        global keyboard
+        import keyboard  # requires "keyboard" package, only imported when this fallback is used
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def drain(self):
+        if keyboard.is_pressed('up'):
+            return ["up"]
+        elif keyboard.is_pressed('down'):
+            return ["down"]
+        return []
+
+
+# ==========================================
+# CLOCKS (MINIGAME LOOPS)
+# ==========================================
+class SystemClock:
+    """Real time: the default for the minigame loops."""
+
+    def monotonic_ns(self):
+        return time.monotonic_ns()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class SimulatedClock:
+    """Time that only moves when slept on, so a headless game never waits."""
+
+    def __init__(self, start_ns=0):
+        self.now = start_ns
+
+    def monotonic_ns(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += round(seconds * 1_000_000_000)
@@ -0,0 +1,271 @@
+import argparse
+import math
+import random
+import time
+
+from office_rpg.balance import Balance
+from office_rpg.items import Coffee, Laptop
+from office_rpg.tasks import TASK_TYPES, TaskTable
+from simulation import ROLES, POLICIES, run_career, summarize, career_rng
+
+
+# ==========================================
+# CAREER PLANNER (MONTE CARLO TREE SEARCH)
+# ==========================================
+# Picks work / break / item each turn by tree search, aiming for the highest
+# level before burnout. The search never touches a real Employee: a game state
+# is a plain tuple
+#
+#   (role, stress, motivation, xp, level, inventory)
+#
+# with inventory = ((kind, val, count), ...) in Inventory order, so forking a
+# state is free and the state itself is the transposition cache key. The rng
+# is never part of the state: step() takes it explicitly (like every rng=
+# argument in the game), and the planner owns its own random.Random, so
+# searching doesn't move the real game's stream.
+#
+# step() is play_turn() on tuples: same task table, Balance, clamping and
+# promotion rule (see Cohort for the vectorized version), the draws are just
+# made with rng.random() instead of randint/choice.
+
+WORK, BREAK, ITEM = range(3)
+ACTIONS = ("work", "break", "item")
+DIFFS = range(1, 9)
+
+
+def _compile(role):
+    """One tuple per (task type, diff) get_random_task can draw, equally likely."""
+    emp_type = ROLES[role]
+    b = Balance
+    rate = b.intern_xp_rate if role == "Intern" else None  # Intern.add_xp: float then int() like the original
+    rules = []
+    for task_type in TASK_TYPES:
+        mod = TaskTable.lookup(task_type, emp_type)[0]
+        level_min, level_chance = mod.level_chance or (10 ** 9, 0)
+        disaster = mod.disaster or {"odds": 0.0, "stress": 0}
+        for diff in DIFFS:
+            xp = diff * b.xp_per_diff + mod.xp_bonus
+            rules.append((
+                diff * b.mot_cost_per_diff,  # mot_cost
+                diff * b.stress_per_diff,  # stress_add
+                diff * b.odds_per_diff,  # odds penalty
+                int(xp * rate) if rate else xp,
+                mod.chance, mod.set_chance, level_min, level_chance,
+                mod.stress, mod.motivation, mod.skip,
+                disaster["odds"], disaster["stress"],
+            ))
+    return tuple(rules)
+
+
+RULES = {}  # role -> _compile(role), filled on first use
+RULES_KEY = [None]  # the Balance.key() RULES were compiled under
+
+
+def rules_for(role):
+    if RULES_KEY[0] != Balance.key():
+        RULES.clear()  # the Balance changed since
+        RULES_KEY[0] = Balance.key()
+    rules = RULES.get(role)
+    if rules is None:
+        rules = RULES[role] = _compile(role)
+    return rules
+
+
+def snapshot(player):
+    """The state tuple of a live Employee."""
+    stacks = []
+    for _, item, count in player.inventory:
+        if isinstance(item, Laptop):
+            kind = "laptop"
+        elif isinstance(item, Coffee):  # bundles drink like coffee
+            kind = "coffee"
+        else:
+            kind = "item"  # Item.apply does nothing
+        stacks.append((kind, item.val, count))
+    return (type(player).__name__, player.stress, player.motivation, player.xp, player.level, tuple(stacks))
+
+
+def step(state, action, rng=random):
+    """The state after one turn of action (rng draws the task and the rolls).
+
+    The task rules are compiled once per role, Planner.search() recompiles
+    them when the Balance changed (rules_for()).
+    """
+    role, stress, mot, xp, level, inv = state
+    draw = rng.random
+    b = Balance
+    if action == WORK:
+        rules = RULES.get(role) or rules_for(role)
+        (mot_cost, stress_add, penalty, xp_gain, chance_add, set_chance, level_min, level_chance,
+         mod_stress, mod_mot, skip, disaster_odds, disaster_stress) = rules[int(draw() * len(rules))]
+        if mot < mot_cost:
+            return state  # too tired to work, turn is lost
+        noise = b.odds_noise
+        chance = mot + level * b.odds_per_level - penalty + int(draw() * (2 * noise + 1)) - noise
+        chance = b.odds_min if chance < b.odds_min else b.odds_max if chance > b.odds_max else chance
+        if disaster_odds and draw() < disaster_odds:
+            stress += disaster_stress
+            return (role, 100 if stress > 100 else stress, mot, xp, level, inv)
+        if mod_mot:
+            mot += mod_mot
+            mot = 0 if mot < 0 else 100 if mot > 100 else mot
+        if mod_stress:
+            stress += mod_stress
+            stress = 0 if stress < 0 else 100 if stress > 100 else stress
+        if skip:
+            return (role, stress, mot, xp, level, inv)
+        chance = set_chance if set_chance is not None else chance + chance_add
+        if level >= level_min:
+            chance += level_chance
+        mot = mot - mot_cost if mot > mot_cost else 0
+        if int(draw() * 101) < chance:
+            xp += xp_gain
+            if xp >= level * b.xp_per_level:
+                level += 1
+                xp = 0
+                mot = 100
+                stress = 0
+            stress += stress_add // 2
+        else:
+            stress += stress_add
+        return (role, 100 if stress > 100 else stress, mot, xp, level, inv)
+    if action == BREAK:
+        mot += b.break_min + int(draw() * (b.break_max - b.break_min + 1))
+        stress -= b.break_stress
+        return (role, 0 if stress < 0 else 100 if stress > 100 else stress, 100 if mot > 100 else mot, xp, level, inv)
+    if not inv:
+        return state
+    # use the first stack
+    kind, val, count = inv[0]
+    inv = inv[1:] if count == 1 else ((kind, val, count - 1),) + inv[1:]
+    if kind == "coffee":
+        mot = min(100, mot + val)
+        stress = max(0, stress - val // b.coffee_stress_divisor)
+        if mot > b.caffeine_crash:  # motivation is clamped first, so only below the default 120
+            stress = min(100, stress + b.crash_stress)
+    elif kind == "laptop" and level < b.laptop_slow_below:
+        stress = min(100, stress + b.laptop_stress)
+    return (role, stress, mot, xp, level, inv)
+
+
+def rollout(state, turns, rng=random):
+    """Play on with the cautious policy, returns the value of where it ends up.
+
+    Value is the level plus the fraction of the way to the next one, a
+    burnout ends the career there and costs a level.
+    """
+    role, stress, mot, xp, level, inv = state
+    for _ in range(turns):
+        if stress >= 100:
+            return level - 1
+        if stress >= 70 or mot < 25:
+            action = ITEM if inv else BREAK
+        else:
+            action = WORK
+        state = step(state, action, rng)
+        role, stress, mot, xp, level, inv = state
+    if stress >= 100:
+        return level - 1
+    return level + xp / (level * Balance.xp_per_level)
+
+
+class Planner:
+    """UCT over step(), with one node per distinct state (a transposition table).
+
+    A node is [visits, visits per action, value sum per action]. Several paths
+    reaching the same state share its node, and the table is kept from one
+    turn to the next (up to max_nodes), so the search picks up where it left off.
+    """
+
+    def __init__(self, iterations=500, depth=10, horizon=30, exploration=1.0, max_nodes=500_000, seed=None):
+        self.iterations = iterations
+        self.depth = depth  # tree turns per iteration...
+        self.horizon = horizon  # ...and total turns looked ahead, the rest is the rollout
+        self.exploration = exploration
+        self.max_nodes = max_nodes
+        self.rng = random.Random(seed)
+        self.table = {}
+        self.rollouts = 0
+
+    def _select(self, node, legal):
+        n, visits, values = node
+        best, best_score = None, -1.0
+        c = self.exploration * math.sqrt(math.log(n)) if n else 0.0
+        for a in legal:
+            v = visits[a]
+            if not v:
+                return a  # every action once before any comparing
+            score = values[a] / v + c / math.sqrt(v)
+            if score > best_score:
+                best, best_score = a, score
+        return best
+
+    def search(self, state):
+        if len(self.table) > self.max_nodes or RULES_KEY[0] != Balance.key():
+            self.table.clear()  # too big, or searched under other rules
+            rules_for(state[0])
+        table, rng = self.table, self.rng
+        for _ in range(self.iterations):
+            path = []
+            s = state
+            for _ in range(self.depth):
+                if s[1] >= 100:
+                    break
+                node = table.get(s)
+                if node is None:
+                    node = table[s] = [0, [0, 0, 0], [0.0, 0.0, 0.0]]
+                legal = (WORK, BREAK, ITEM) if s[5] else (WORK, BREAK)
+                a = self._select(node, legal)
+                path.append((node, a))
+                s = step(s, a, rng)
+                if node[1][a] == 0:
+                    break  # new edge: roll out from here
+            value = rollout(s, self.horizon - len(path), rng)
+            self.rollouts += 1
+            for node, a in path:
+                node[0] += 1
+                node[1][a] += 1
+                node[2][a] += value
+        node = table[state]
+        return max(range(3), key=lambda a: node[1][a])
+
+    def policy(self, player, rng):
+        """A simulation policy (see simulation.POLICIES): the most searched action."""
+        return ACTIONS[self.search(snapshot(player))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo tree search career planner vs the simulation policies")
+    parser.add_argument("--role", choices=sorted(ROLES), default="Developer")
+    parser.add_argument("--careers", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=500, help="search iterations (rollouts) per turn")
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--horizon", type=int, default=30)
+    parser.add_argument("--target-level", type=int, default=10)
+    parser.add_argument("--max-turns", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"--- {args.careers} careers as {args.role}, up to lvl {args.target_level} "
+          f"or {args.max_turns} turns, seed {args.seed} ---")
+    for name in sorted(POLICIES):
+        results = [run_career(args.role, POLICIES[name], args.target_level, args.max_turns, rng=career_rng(args.seed, i))
+                   for i in range(args.careers)]
+        stats = summarize(results)
+        print(f"{name:<12} mean lvl {stats['mean_level']:5.2f}  burnout {stats['burnout_rate']:6.1%}  "
+              f"turns {stats['mean_turns']:6.1f}")
+
+    planner = Planner(args.iterations, args.depth, args.horizon, seed=args.seed)
+    start = time.perf_counter()
+    results = [run_career(args.role, planner.policy, args.target_level, args.max_turns, rng=career_rng(args.seed, i))
+               for i in range(args.careers)]
+    elapsed = time.perf_counter() - start
+    stats = summarize(results)
+    print(f"{'mcts':<12} mean lvl {stats['mean_level']:5.2f}  burnout {stats['burnout_rate']:6.1%}  "
+          f"turns {stats['mean_turns']:6.1f}")
+    print(f"{planner.rollouts} rollouts in {elapsed:.2f}s ({planner.rollouts / elapsed:.0f} rollouts/s), "
+          f"{len(planner.table)} states in the table")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+import argparse
+import collections
+import heapq
+import random
+import threading
+import time
+
+from office_rpg.system import Console
+from office_rpg.tasks import TaskTable, get_random_task
+from simulation import ROLES, positive_int
+
+
+# ==========================================
+# OFFICE SCHEDULER
+# ==========================================
+# A whole office works in rounds. Each round a stream of tasks arrives, and
+# every employee can take at most one task. The rest take a break.
+#
+# Employees with the same (role, level, motivation) have exactly the same
+# odds on any task (TaskTable.success_odds covers calc_odds and the role
+# modifiers), so they share a bucket. Every task kind (type, diff) gets a
+# heap of buckets ordered by those odds. It only holds buckets whose
+# motivation covers the kind's mot_cost, so too-tired employees are never
+# picked. Taking the best employee means popping empty buckets off the top
+# and then taking one employee from the first non-empty bucket.
+#
+# Who gets which task is decided once, for the whole office, in task order,
+# so the best odds are always the office's best. Running the tasks is what
+# the threads share: each worker gets the jobs of its own employees (every
+# workers-th one) in a deque, and steals from the back of the other deques
+# once its own is empty. Every employee has their own random.Random, so a job
+# plays out the same whichever thread runs it, and the results only depend on
+# the seed, never on --workers (the steal count does, it's timing).
+# The GIL keeps the threads on one core, so the threads show the scheduling,
+# not a speedup.
+
+
+class Roster:
+    """The office's employees still working, bucketed for the current round."""
+
+    def __init__(self, employees):
+        self.employees = employees
+        self.buckets = {}  # (role, level, motivation) -> set of employee indexes
+        self.heaps = {}  # (task type, diff) -> heap of (-odds, n, bucket key)
+        self.idle = 0  # not yet given a task this round
+
+    def start_round(self, alive):
+        self.buckets = {}
+        self.heaps = {}
+        self.idle = len(alive)
+        for i in alive:
+            emp = self.employees[i]
+            key = (type(emp), emp.level, emp.motivation)
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = set()
+            bucket.add(i)
+
+    def _heap(self, task):
+        kind = (type(task), task.diff)
+        heap = self.heaps.get(kind)
+        if heap is None:
+            # only buckets motivated enough for this task (mot_cost = diff * 3)
+            heap = []
+            for n, key in enumerate(self.buckets):
+                role, level, mot = key
+                if mot >= task.mot_cost:
+                    heap.append((-TaskTable.success_odds(kind[0], role, level, task.diff)[mot], n, key))
+            heapq.heapify(heap)
+            self.heaps[kind] = heap
+        return heap
+
+    def take_best(self, task):
+        """Index of the employee with the best odds on task (removed for this round), or None."""
+        if not self.idle:
+            return None
+        heap = self._heap(task)
+        while heap:
+            bucket = self.buckets[heap[0][2]]
+            if bucket:
+                self.idle -= 1
+                return bucket.pop()
+            heapq.heappop(heap)
+        return None
+
+
+class Office:
+    def __init__(self, headcount, workers=4, seed=0, load=0.7):
+        roles = list(ROLES.values())
+        self.employees = [roles[i % len(roles)](f"E{i}") for i in range(headcount)]
+        self.load = load  # new tasks per round, as a share of the people still working
+        self.workers = workers
+        self.rng = random.Random(seed)  # the task stream
+        self.rngs = [random.Random(seed * 1_000_003 + i + 1) for i in range(headcount)]  # each employee's own
+        self.roster = Roster(self.employees)
+        self.queues = [collections.deque() for _ in range(workers)]  # (employee index, task) jobs
+        self.backlog = collections.deque()  # tasks nobody could take, first in line next round
+        self.tasks_done = [0] * headcount
+        self.rounds_alive = [0] * headcount
+        self.worked = [-1] * headcount  # last round the employee had a task
+        self.burnout_round = {}  # employee index -> round
+        self.steals = 0
+        self._lock = threading.Lock()
+        self._errors = []
+
+    def alive(self):
+        return len(self.employees) - len(self.burnout_round)
+
+    def _work(self, w, barrier, rounds):
+        own = self.queues[w]
+        others = [q for v, q in enumerate(self.queues) if v != w]
+        mine = range(w, len(self.employees), self.workers)
+        employees, rngs = self.employees, self.rngs
+        try:
+            for round_no in range(rounds):
+                barrier.wait()  # jobs are dealt
+                while True:
+                    try:
+                        i, task = own.popleft()
+                    except IndexError:
+                        job = self._steal(others)
+                        if job is None:
+                            break
+                        i, task = job
+                    task.do_task(employees[i], rngs[i])
+                    self.tasks_done[i] += 1
+                    self.worked[i] = round_no
+                barrier.wait()  # every job is done
+                for i in mine:
+                    if i in self.burnout_round:
+                        continue
+                    if employees[i].stress >= 100:
+                        self.burnout_round[i] = round_no
+                    elif self.worked[i] != round_no:
+                        employees[i].take_break(rngs[i])
+                barrier.wait()  # breaks taken, the main thread deals the next round
+        except threading.BrokenBarrierError:
+            pass  # somebody else failed, they report it
+        except BaseException as e:
+            self._errors.append(e)
+            barrier.abort()  # nobody waits on this worker forever
+
+    def _steal(self, others):
+        for q in others:
+            try:
+                job = q.pop()  # the far end, away from the owner
+            except IndexError:
+                continue
+            with self._lock:
+                self.steals += 1
+            return job
+        return None
+
+    def _deal(self, round_no):
+        alive = [i for i in range(len(self.employees)) if i not in self.burnout_round]
+        for i in alive:
+            self.rounds_alive[i] += 1
+        self.roster.start_round(alive)
+        tasks = list(self.backlog)
+        self.backlog.clear()
+        tasks += [get_random_task(self.rng, pooled=True) for _ in range(int(len(alive) * self.load))]
+        for task in tasks:
+            i = self.roster.take_best(task)
+            if i is None:
+                self.backlog.append(task)  # nobody free and motivated enough, maybe next round
+            else:
+                self.queues[i % self.workers].append((i, task))
+
+    def run(self, rounds):
+        barrier = threading.Barrier(self.workers + 1)
+        threads = [threading.Thread(target=self._work, args=(w, barrier, rounds), daemon=True)
+                   for w in range(self.workers)]
+        was_quiet = Console.quiet
+        Console.quiet = True
+        for t in threads:
+            t.start()
+        start = time.perf_counter()
+        try:
+            for round_no in range(rounds):
+                self._deal(round_no)
+                barrier.wait()
+                barrier.wait()
+                barrier.wait()
+        except threading.BrokenBarrierError:
+            pass  # a worker failed, raised below
+        except BaseException:
+            barrier.abort()  # let the workers go
+            raise
+        finally:
+            Console.quiet = was_quiet
+            for t in threads:
+                t.join()
+        if self._errors:
+            raise self._errors[0]
+        return time.perf_counter() - start
+
+    def report(self, rounds, elapsed):
+        done = sum(self.tasks_done)
+        util = sorted(self.tasks_done[i] / n for i, n in enumerate(self.rounds_alive) if n)
+        by_role = collections.defaultdict(lambda: [0, 0])
+        for i, emp in enumerate(self.employees):
+            by_role[type(emp).__name__][1] += 1
+            if i in self.burnout_round:
+                by_role[type(emp).__name__][0] += 1
+        burnout_rounds = list(self.burnout_round.values())
+        burnout_rounds.sort()
+        headcount = len(self.employees)
+        pct = lambda xs, p: xs[min(len(xs) - 1, len(xs) * p // 100)] if xs else float("nan")
+        return {
+            "headcount": headcount,
+            "tasks_done": done,
+            "tasks_per_s": done / elapsed,
+            "utilization_mean": sum(util) / len(util),
+            "utilization_p10": pct(util, 10),
+            "utilization_p90": pct(util, 90),
+            "burnout_rate": len(burnout_rounds) / headcount,
+            "burnout_round_p10": pct(burnout_rounds, 10),
+            "burnout_round_p50": pct(burnout_rounds, 50),
+            "burnout_round_p90": pct(burnout_rounds, 90),
+            "burnout_by_role": {role: b / n for role, (b, n) in sorted(by_role.items())},
+            "backlog": len(self.backlog),
+            "steals": self.steals,
+        }
+
+
+def headcount_list(text):
+    return [positive_int(h) for h in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schedule a stream of tasks over a whole office")
+    parser.add_argument("--headcounts", type=headcount_list,
+                        default="100,1000,10000", help="comma separated office sizes")
+    parser.add_argument("--rounds", type=positive_int, default=50)
+    parser.add_argument("--workers", type=positive_int, default=4, help="scheduler threads (work stealing)")
+    parser.add_argument("--load", type=float, default=0.7, help="tasks per round per working employee")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    headcounts = args.headcounts
+
+    # fill the TaskTable.success_odds cache first, or the first row pays for it
+    Office(min(headcounts), args.workers, args.seed, args.load).run(args.rounds)
+    print(f"{'headcount':>9} {'tasks/s':>10} {'util':>6} {'p10-p90':>11} {'burnout':>8} "
+          f"{'round p50':>9} {'backlog':>8} {'steals':>7}  burnout by role")
+    for headcount in headcounts:
+        office = Office(headcount, args.workers, args.seed, args.load)
+        elapsed = office.run(args.rounds)
+        r = office.report(args.rounds, elapsed)
+        roles = " ".join(f"{role} {rate:.0%}" for role, rate in r["burnout_by_role"].items())
+        print(f"{r['headcount']:>9} {r['tasks_per_s']:>10,.0f} {r['utilization_mean']:>6.0%} "
+              f"{r['utilization_p10']:>5.0%}-{r['utilization_p90']:<5.0%} {r['burnout_rate']:>8.0%} "
+              f"{r['burnout_round_p50']:>9} {r['backlog']:>8} {r['steals']:>7}  {roles}")
+
+
+if __name__ == "__main__":
+    main()
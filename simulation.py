@@ -0,0 +1,244 @@
+import argparse
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from office_rpg.entities import Intern, Developer, Manager, HR
+from office_rpg.items import Coffee, Laptop
+from office_rpg.system import Console
+from office_rpg.tasks import get_random_task
+
+
+# ==========================================
+# HEADLESS CAREER SIMULATOR
+# ==========================================
+# Drives the real Employee / Task / Item classes the same way main() does,
+# just without input(), prints or sleeps. A policy picks the menu action.
+
+ROLES = {
+    "Intern": Intern,
+    "Developer": Developer,
+    "Manager": Manager,
+    "HR": HR,
+}
+
+
+# Policies: policy(player, rng) -> "work" | "break" | "item"
+def always_work(player, rng):
+    return "work"
+
+
+def cautious(player, rng):
+    if player.stress >= 70 or player.motivation < 25:
+        if player.inventory:
+            return "item"
+        return "break"
+    return "work"
+
+
+def slacker(player, rng):
+    if player.motivation < 60:
+        return "break"
+    return "work"
+
+
+def random_policy(player, rng):
+    return rng.choice(["work", "work", "break", "item"])
+
+
+POLICIES = {
+    "always_work": always_work,
+    "cautious": cautious,
+    "slacker": slacker,
+    "random": random_policy,
+}
+
+
+class CareerResult:
+    def __init__(self, role, level, xp, turns, burnout, flappy_flap_best_score, first_promotion=None):
+        self.role = role
+        self.level = level
+        self.xp = xp
+        self.turns = turns
+        self.burnout = burnout
+        self.flappy_flap_best_score = flappy_flap_best_score
+        self.first_promotion = first_promotion  # turn it got to lvl 2, None if it never did
+
+    def __repr__(self):
+        end = "burnout" if self.burnout else "survived"
+        return f"<CareerResult {self.role} lvl {self.level} after {self.turns} turns ({end})>"
+
+
+def new_player(role, name="Sim", rng=random):
+    # same starting kit as a new game in main()
+    player = ROLES[role](name)
+    player.inventory.add(Coffee("Instant Coffee", 10))
+    if rng.random() > 0.5:
+        player.inventory.add(Laptop("Dell Latitude"))
+    return player
+
+
+def play_turn(player, action, rng=random, task=None):
+    """One menu action. Work draws a task unless one is given, returns Task.do_task's outcome."""
+    if action == "work":
+        t = task or get_random_task(rng, pooled=True)
+        if player.motivation < t.mot_cost:
+            return None  # too tired to work, turn is lost
+        return t.do_task(player, rng)
+    elif action == "break":
+        player.take_break(rng)
+    elif action == "item":
+        if player.inventory:
+            player.use_item(player.inventory.first())
+
+
+def run_career(role, policy, target_level=10, max_turns=1000, rng=random):
+    """Play one career until burnout, target_level or max_turns (whichever comes first)."""
+    player = new_player(role, rng=rng)
+    turns = 0
+    first_promotion = None
+    was_quiet = Console.quiet
+    Console.quiet = True
+    try:
+        while turns < max_turns:
+            if player.stress >= 100 or player.level >= target_level:
+                break
+            play_turn(player, policy(player, rng), rng)
+            turns += 1
+            if first_promotion is None and player.level > 1:
+                first_promotion = turns
+    finally:
+        Console.quiet = was_quiet
+    return CareerResult(
+        role,
+        player.level,
+        player.xp,
+        turns,
+        player.stress >= 100,
+        player.flappy_flap_best_score,
+        first_promotion,
+    )
+
+
+def run_many(role, policy, careers, target_level=10, max_turns=1000):
+    return [run_career(role, policy, target_level, max_turns) for _ in range(careers)]
+
+
+# ==========================================
+# PARALLEL MONTE CARLO
+# ==========================================
+# Career i always gets its own random.Random seeded from (seed, i), so the
+# merged histograms don't depend on how careers are split across workers.
+
+def career_rng(seed, index):
+    return random.Random(seed * 1_000_003 + index)
+
+
+def _run_chunk(role, policy_name, seed, start, stop, target_level, max_turns):
+    levels = Counter()
+    burnout_turns = Counter()
+    policy = POLICIES[policy_name]
+    for i in range(start, stop):
+        r = run_career(role, policy, target_level, max_turns, rng=career_rng(seed, i))
+        levels[r.level] += 1
+        if r.burnout:
+            burnout_turns[r.turns] += 1
+    return levels, burnout_turns
+
+
+def run_parallel(role, policy_name, careers, workers=None, seed=0, target_level=10, max_turns=1000, chunk_size=500):
+    """Spread careers over a process pool, returns merged histograms.
+
+    Policies are passed by name (see POLICIES) so they can be sent to the workers.
+    """
+    chunks = [(start, min(start + chunk_size, careers)) for start in range(0, careers, chunk_size)]
+    args = [(role, policy_name, seed, a, b, target_level, max_turns) for a, b in chunks]
+
+    hist = {"levels": Counter(), "burnout_turns": Counter()}
+    if workers == 1:
+        parts = [_run_chunk(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_chunk, *zip(*args)))
+    for levels, burnout_turns in parts:
+        hist["levels"].update(levels)
+        hist["burnout_turns"].update(burnout_turns)
+    return hist
+
+
+def print_histogram(title, counter, width=40):
+    print(title)
+    if not counter:
+        print("  (empty)")
+        return
+    top = max(counter.values())
+    for key in sorted(counter):
+        bar = "#" * max(1, counter[key] * width // top)
+        print(f"  {key:>5} | {bar} {counter[key]}")
+
+
+def summarize(results):
+    n = len(results)
+    if n == 0:
+        return {}
+    return {
+        "careers": n,
+        "burnout_rate": sum(r.burnout for r in results) / n,
+        "mean_level": sum(r.level for r in results) / n,
+        "mean_turns": sum(r.turns for r in results) / n,
+    }
+
+
+def positive_int(text):
+    """argparse type for counts, 0 or less is a usage error."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Office RPG career simulator")
+    parser.add_argument("--role", choices=sorted(ROLES), default="Developer")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="cautious")
+    parser.add_argument("--careers", type=positive_int, default=10000)
+    parser.add_argument("--target-level", type=int, default=10)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=positive_int, default=None,
+                        help="run on a process pool and print merged histograms (reproducible, --seed defaults to 0)")
+    args = parser.parse_args()
+
+    if args.workers is not None:
+        seed = args.seed if args.seed is not None else 0
+        start = time.perf_counter()
+        hist = run_parallel(args.role, args.policy, args.careers, args.workers, seed, args.target_level, args.max_turns)
+        elapsed = time.perf_counter() - start
+        print(f"--- {args.careers} careers as {args.role} ({args.policy}), seed {seed} ---")
+        print_histogram("Level reached:", hist["levels"])
+        # turns are bucketed by 10 to keep the output short
+        buckets = Counter()
+        for turns, count in hist["burnout_turns"].items():
+            buckets[turns // 10 * 10] += count
+        print_histogram("Turns until burnout:", buckets)
+        print(f"Took {elapsed:.2f}s ({args.careers / elapsed:.0f} careers/s)")
+        return
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    start = time.perf_counter()
+    results = run_many(args.role, POLICIES[args.policy], args.careers, args.target_level, args.max_turns)
+    elapsed = time.perf_counter() - start
+
+    stats = summarize(results)
+    print(f"--- {args.careers} careers as {args.role} ({args.policy}) ---")
+    print(f"Burnout rate: {stats['burnout_rate']:.1%}")
+    print(f"Mean level:   {stats['mean_level']:.2f}")
+    print(f"Mean turns:   {stats['mean_turns']:.1f}")
+    print(f"Took {elapsed:.2f}s ({args.careers / elapsed:.0f} careers/s)")
+
+
+if __name__ == "__main__":
+    main()
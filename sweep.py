@@ -0,0 +1,196 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from office_rpg.balance import Balance
+from office_rpg.tasks import TaskTable
+from simulation import ROLES, POLICIES, run_career, career_rng
+
+
+# ==========================================
+# BALANCE SWEEP
+# ==========================================
+# Plays careers under many balance sets (office_rpg/balance.py) on a process
+# pool and reports burnout and time to the first promotion per role. A point
+# is one parameter set for one role. Every finished point goes straight to
+# cache_dir/<key>.json, key = sha256 of everything that decides its result
+# (all parameters, the task table, seed, role, policy, careers...), so
+# running a sweep again, or after it was interrupted, only plays what's missing.
+
+def parse_value(text):
+    if text.lower() == "none":
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def grid_points(grid):
+    """Every combination of {name: [values]}."""
+    names = sorted(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def random_points(ranges, count, seed):
+    """count points drawn uniformly from {name: (low, high)}, ints when both bounds are ints."""
+    rng = random.Random(seed)
+    points = []
+    for _ in range(count):
+        point = {}
+        for name in sorted(ranges):
+            low, high = ranges[name]
+            if isinstance(low, int) and isinstance(high, int):
+                point[name] = rng.randint(low, high)
+            else:
+                point[name] = round(rng.uniform(low, high), 4)
+        points.append(point)
+    return points
+
+
+def point_key(point, role, settings):
+    params = dict(Balance.DEFAULTS)
+    params.update(point)
+    with open(TaskTable.path, "rb") as f:
+        table = hashlib.sha256(f.read()).hexdigest()
+    blob = json.dumps({"params": params, "task_table": table, "role": role, **settings}, sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()[:32]
+
+
+def evaluate(point, role, settings):
+    """Play settings["careers"] careers of role under point, returns the stats."""
+    Balance.apply(point)
+    try:
+        policy = POLICIES[settings["policy"]]
+        start = time.perf_counter()
+        results = [
+            run_career(role, policy, settings["target_level"], settings["max_turns"], rng=career_rng(settings["seed"], i))
+            for i in range(settings["careers"])
+        ]
+        elapsed = time.perf_counter() - start
+    finally:
+        Balance.apply()
+    n = len(results)
+    promoted = [r.first_promotion for r in results if r.first_promotion is not None]
+    return {
+        "burnout_rate": sum(r.burnout for r in results) / n,
+        "mean_level": sum(r.level for r in results) / n,
+        "promoted_rate": len(promoted) / n,
+        "turns_to_promotion": sum(promoted) / len(promoted) if promoted else None,
+        "seconds": elapsed,
+    }
+
+
+def _write(path, record):
+    # written whole then renamed, so an interrupted sweep never leaves half a file
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(record, f)
+    os.replace(tmp, path)
+
+
+def sweep(points, roles, settings, cache_dir, workers=None, progress=print):
+    """Stats of every (point, role), from the cache when it's there. Returns [(point, {role: stats})]."""
+    os.makedirs(cache_dir, exist_ok=True)
+    found = {}
+    todo = []
+    for i, point in enumerate(points):
+        for role in roles:
+            key = point_key(point, role, settings)
+            path = os.path.join(cache_dir, key + ".json")
+            if os.path.exists(path):
+                with open(path) as f:
+                    found[i, role] = json.load(f)["stats"]
+            else:
+                todo.append((i, role, path))
+    progress(f"{len(found)} of {len(points) * len(roles)} points cached, playing {len(todo)}")
+
+    def done(i, role, path, stats):
+        _write(path, {"params": points[i], "role": role, "settings": settings, "stats": stats})
+        found[i, role] = stats
+        progress(f"  [{len(found)}/{len(points) * len(roles)}] {role} {points[i]}: "
+                 f"burnout {stats['burnout_rate']:.1%}")
+
+    if workers == 1:
+        for i, role, path in todo:
+            done(i, role, path, evaluate(points[i], role, settings))
+    elif todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(evaluate, points[i], role, settings): (i, role, path) for i, role, path in todo}
+            for future in as_completed(futures):
+                done(*futures[future], future.result())
+    return [(point, {role: found[i, role] for role in roles}) for i, point in enumerate(points)]
+
+
+def print_report(results, roles):
+    names = sorted({name for point, _ in results for name in point})
+    widths = [max(8, len(n)) for n in names]
+    head = "  ".join(f"{n:>{w}}" for n, w in zip(names, widths))
+    print(f"{head}  " + "  ".join(f"{role + ' burnout / lvl 2 in':>24}" for role in roles))
+    for point, stats in results:
+        row = "  ".join(f"{point.get(n, '-')!s:>{w}}" for n, w in zip(names, widths))
+        cells = []
+        for role in roles:
+            s = stats[role]
+            turns = f"{s['turns_to_promotion']:.1f}" if s["turns_to_promotion"] is not None else "never"
+            cells.append(f"{s['burnout_rate']:>12.1%} / {turns:>9}")
+        print(f"{row}  " + "  ".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid or random search over the balance parameters")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2,...",
+                        help="values to try for one parameter (repeat for more, every combination is played)")
+    parser.add_argument("--range", action="append", default=[], metavar="NAME=LOW:HIGH",
+                        help="with --random: range to draw one parameter from")
+    parser.add_argument("--random", type=int, default=0, metavar="N", help="play N random points instead of a grid")
+    parser.add_argument("--roles", default=",".join(ROLES))
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="cautious")
+    parser.add_argument("--careers", type=int, default=2000, help="careers per point and role")
+    parser.add_argument("--target-level", type=int, default=10)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", default="sweep_cache")
+    args = parser.parse_args()
+
+    if args.random:
+        ranges = {}
+        for spec in args.range:
+            name, bounds = spec.split("=", 1)
+            low, high = bounds.split(":")
+            ranges[name] = (parse_value(low), parse_value(high))
+        points = random_points(ranges, args.random, args.seed)
+    else:
+        grid = {}
+        for spec in args.grid:
+            name, values = spec.split("=", 1)
+            grid[name] = [parse_value(v) for v in values.split(",")]
+        points = grid_points(grid)
+    try:
+        for point in points:
+            Balance.apply(point)  # fail on a typo or a bad value before any work starts
+    except (KeyError, ValueError) as e:
+        parser.error(e.args[0])
+    finally:
+        Balance.apply()
+
+    roles = args.roles.split(",")
+    settings = {"seed": args.seed, "policy": args.policy, "careers": args.careers,
+                "target_level": args.target_level, "max_turns": args.max_turns}
+    start = time.perf_counter()
+    results = sweep(points, roles, settings, args.cache_dir, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"--- {len(points)} points x {len(roles)} roles, {args.careers} careers each ({args.policy}), "
+          f"seed {args.seed} ---")
+    print_report(results, roles)
+    print(f"Took {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
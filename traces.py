@@ -0,0 +1,304 @@
+import argparse
+import array
+import json
+import mmap
+import os
+import sys
+import time
+
+from office_rpg.system import Console
+from office_rpg.tasks import TASK_TYPES, TaskTable, get_random_task
+from simulation import ROLES, POLICIES, new_player, play_turn, career_rng
+
+
+# ==========================================
+# COLUMNAR TURN TRACES
+# ==========================================
+# A trace is a directory: schema.json plus one flat file per column holding
+# fixed-width values back to back (row i of a column is at i * itemsize).
+# The writer only needs the standard library. It keeps a small batch per
+# column in an array.array and copies full batches into the column files
+# through mmap, growing them as it goes. The reader (needs numpy) maps the
+# same files as read-only arrays, nothing gets loaded until it's touched, so
+# aggregating goes block by block and never holds the whole trace in memory.
+#
+# schema.json: {"format", "version", "rows", "byteorder", "columns": [{"name", "type", "dtype"}]}
+# "type" is the array module typecode, "dtype" the matching numpy dtype.
+# rows is rewritten on every flush, a crashed writer leaves a readable trace
+# up to the last one.
+
+FORMAT = "office-rpg-trace"
+VERSION = 1
+SCHEMA = "schema.json"
+
+_KINDS = {"b": "i", "h": "i", "i": "i", "l": "i", "q": "i", "B": "u", "H": "u", "I": "u", "L": "u", "Q": "u",
+          "f": "f", "d": "f"}
+
+
+def _dtype(typecode):
+    order = "<" if sys.byteorder == "little" else ">"
+    return f"{order}{_KINDS[typecode]}{array.array(typecode).itemsize}"
+
+
+class ColumnWriter:
+    """Appends rows to a trace directory, columns is [(name, array typecode)].
+
+    An existing trace with the same columns is carried on, not overwritten.
+    """
+
+    def __init__(self, path, columns, batch=1 << 16):
+        self.path = path
+        self.columns = [tuple(c) for c in columns]
+        self.batch = batch
+        self.rows = 0
+        self._capacity = 0
+        os.makedirs(path, exist_ok=True)
+        mode = "w+b"
+        if os.path.exists(os.path.join(path, SCHEMA)):
+            with open(os.path.join(path, SCHEMA)) as f:
+                schema = json.load(f)
+            if [(c["name"], c["type"]) for c in schema["columns"]] != self.columns:
+                raise ValueError(f"{path} holds a trace with other columns")
+            if schema["byteorder"] != sys.byteorder:
+                raise ValueError(f"{path} was written on a {schema['byteorder']} endian machine")
+            self.rows = schema["rows"]
+            mode = "r+b"
+        self._files = [open(os.path.join(path, name + ".col"), mode) for name, _ in self.columns]
+        self._maps = [None] * len(self.columns)
+        self._buffers = [array.array(typecode) for _, typecode in self.columns]
+        self._appenders = [b.append for b in self._buffers]
+        self._grow(self.rows + batch)
+        self._write_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _grow(self, rows):
+        # remap every column at the new size (close + truncate + map works everywhere, resize() doesn't)
+        for i, f in enumerate(self._files):
+            if self._maps[i] is not None:
+                self._maps[i].close()
+            size = rows * self._buffers[i].itemsize
+            f.truncate(size)
+            self._maps[i] = mmap.mmap(f.fileno(), size)
+        self._capacity = rows
+
+    def append(self, *row):
+        """One row, values in column order."""
+        for add, value in zip(self._appenders, row):
+            add(value)
+        if len(self._buffers[0]) >= self.batch:
+            self._spill()
+
+    def _spill(self):
+        n = len(self._buffers[0])
+        if not n:
+            return
+        if self.rows + n > self._capacity:
+            self._grow(max(self.rows + n, self._capacity * 2))
+        for m, b in zip(self._maps, self._buffers):
+            start = self.rows * b.itemsize
+            m[start:start + n * b.itemsize] = b.tobytes()
+            del b[:]
+        self.rows += n
+
+    def last(self, name):
+        """Value of column name in the last row, None in an empty trace."""
+        i = [n for n, _ in self.columns].index(name)
+        b = self._buffers[i]
+        if len(b):
+            return b[-1]
+        if not self.rows:
+            return None
+        end = self.rows * b.itemsize
+        return array.array(b.typecode, self._maps[i][end - b.itemsize:end])[0]
+
+    def _write_schema(self):
+        schema = {
+            "format": FORMAT,
+            "version": VERSION,
+            "rows": self.rows,
+            "byteorder": sys.byteorder,
+            "columns": [{"name": name, "type": typecode, "dtype": _dtype(typecode)} for name, typecode in self.columns],
+        }
+        tmp = os.path.join(self.path, SCHEMA + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(schema, f)
+        os.replace(tmp, os.path.join(self.path, SCHEMA))
+
+    def flush(self):
+        self._spill()
+        for m in self._maps:
+            m.flush()
+        self._write_schema()
+
+    def close(self):
+        if self._files is None:
+            return
+        self.flush()
+        for m, f, b in zip(self._maps, self._files, self._buffers):
+            m.close()
+            f.truncate(self.rows * b.itemsize)  # drop the unused capacity
+            f.close()
+        self._files = None
+
+
+class Trace:
+    """A trace directory opened read-only, columns[name] is a numpy view of the column file."""
+
+    def __init__(self, path):
+        import numpy as np  # requires "numpy" package, only for reading
+
+        with open(os.path.join(path, SCHEMA)) as f:
+            schema = json.load(f)
+        if schema.get("format") != FORMAT or schema.get("version") != VERSION:
+            raise ValueError(f"{path} isn't a version {VERSION} trace")
+        self.path = path
+        self.rows = schema["rows"]
+        self.columns = {}
+        for col in schema["columns"]:
+            dtype = np.dtype(col["dtype"])
+            if self.rows:
+                view = np.memmap(os.path.join(path, col["name"] + ".col"), dtype=dtype, mode="r", shape=(self.rows,))
+            else:
+                view = np.empty(0, dtype=dtype)
+            self.columns[col["name"]] = view
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def blocks(self, rows=1 << 22):
+        """{name: view} per block of rows, for aggregating without touching everything at once."""
+        for start in range(0, self.rows, rows):
+            yield {name: col[start:start + rows] for name, col in self.columns.items()}
+
+
+# ==========================================
+# CAREER TRACES
+# ==========================================
+# One row per turn of a simulated career (simulation.run_career's loop).
+
+ROLE_NAMES = sorted(ROLES)
+ACTIONS = ("work", "break", "item")
+TURN_COLUMNS = [
+    ("career", "q"),
+    ("turn", "i"),
+    ("role", "b"),  # index in ROLE_NAMES
+    ("action", "b"),  # index in ACTIONS
+    ("task", "b"),  # index in TASK_TYPES, -1 when not working
+    ("diff", "b"),
+    ("odds", "f"),  # chance of success when the task started (TaskTable.success_odds), 0 if too tired
+    ("success", "b"),  # 1 / 0, -1 when there was no roll
+    ("stress", "b"),  # after the turn
+    ("motivation", "b"),
+    ("xp", "i"),
+    ("level", "h"),
+]
+
+
+def trace_careers(writer, role, policy, careers, seed=0, first=0, target_level=10, max_turns=1000):
+    """Play careers first..first+careers-1 (career_rng(seed, i)) and append every turn to writer."""
+    policy_fn = POLICIES[policy]
+    role_code = ROLE_NAMES.index(role)
+    task_codes = {t: i for i, t in enumerate(TASK_TYPES)}
+    append = writer.append
+    was_quiet = Console.quiet
+    Console.quiet = True
+    try:
+        for career in range(first, first + careers):
+            rng = career_rng(seed, career)
+            player = new_player(role, rng=rng)
+            emp_type = type(player)
+            for turn in range(max_turns):
+                if player.stress >= 100 or player.level >= target_level:
+                    break
+                action = policy_fn(player, rng)
+                if action == "work":
+                    task = get_random_task(rng, pooled=True)
+                    odds = 0.0
+                    if player.motivation >= task.mot_cost:
+                        odds = TaskTable.success_odds(type(task), emp_type, player.level, task.diff)[player.motivation]
+                    success = play_turn(player, action, rng, task)
+                    task_code, diff = task_codes.get(type(task), -1), task.diff
+                else:
+                    success = play_turn(player, action, rng)
+                    task_code, diff, odds = -1, 0, 0.0
+                append(career, turn, role_code, ACTIONS.index(action), task_code, diff, odds,
+                       -1 if success is None else int(success),
+                       player.stress, player.motivation, player.xp, player.level)
+    finally:
+        Console.quiet = was_quiet
+
+
+def summarize_trace(trace, block=1 << 22):
+    """Per role and task type: turns worked, mean odds and success rate, aggregated block by block."""
+    import numpy as np  # requires "numpy" package
+
+    n_roles, n_tasks = len(ROLE_NAMES), len(TASK_TYPES)
+    worked = np.zeros(n_roles * n_tasks, dtype=np.int64)
+    rolled = np.zeros(n_roles * n_tasks, dtype=np.int64)
+    odds = np.zeros(n_roles * n_tasks)
+    wins = np.zeros(n_roles * n_tasks, dtype=np.int64)
+    for b in trace.blocks(block):
+        working = b["task"] >= 0
+        cell = (b["role"][working].astype(np.int64) * n_tasks + b["task"][working])
+        worked += np.bincount(cell, minlength=len(worked))
+        odds += np.bincount(cell, b["odds"][working], minlength=len(odds))
+        success = b["success"][working]
+        did_roll = success >= 0
+        rolled += np.bincount(cell[did_roll], minlength=len(rolled))
+        wins += np.bincount(cell[did_roll], success[did_roll], minlength=len(wins)).astype(np.int64)
+    rows = []
+    for r in range(n_roles):
+        for t in range(n_tasks):
+            i = r * n_tasks + t
+            if worked[i]:
+                rows.append((ROLE_NAMES[r], TASK_TYPES[t].__name__, int(worked[i]), odds[i] / worked[i],
+                             wins[i] / rolled[i] if rolled[i] else 0.0))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write per-turn career traces to a columnar trace, or summarize one")
+    parser.add_argument("path", help="trace directory")
+    parser.add_argument("--careers", type=int, default=0, help="play this many careers per role and append them first")
+    parser.add_argument("--roles", default=",".join(ROLES))
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="cautious")
+    parser.add_argument("--target-level", type=int, default=10)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.careers:
+        start = time.perf_counter()
+        with ColumnWriter(args.path, TURN_COLUMNS) as writer:
+            before = writer.rows
+            # career ids go on from the trace's last one, appending again plays new careers, not the same ones
+            last = writer.last("career")
+            first = 0 if last is None else last + 1
+            for i, role in enumerate(args.roles.split(",")):
+                trace_careers(writer, role, args.policy, args.careers, args.seed, first + i * args.careers,
+                              args.target_level, args.max_turns)
+        elapsed = time.perf_counter() - start
+        added = writer.rows - before
+        print(f"Wrote {added} turns in {elapsed:.2f}s ({added / elapsed:.0f} turns/s)")
+
+    trace = Trace(args.path)
+    start = time.perf_counter()
+    rows = summarize_trace(trace)
+    elapsed = time.perf_counter() - start
+    print(f"--- {trace.rows} turns in {args.path} ---")
+    print(f"{'role':<10} {'task':<18} {'turns':>10} {'mean odds':>10} {'success':>8}")
+    for role, task, turns, mean_odds, rate in rows:
+        print(f"{role:<10} {task:<18} {turns:>10} {mean_odds:>10.1%} {rate:>8.1%}")
+    print(f"Summarized in {elapsed:.2f}s ({trace.rows / max(elapsed, 1e-9):.0f} turns/s)")
+
+
+if __name__ == "__main__":
+    main()